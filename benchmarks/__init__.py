@@ -0,0 +1,21 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Benchmarks of odsparsator.
+
+generate: synthetic .ods files of configurable size and content.
+harness: timing and peak memory of ods_to_python() and ods_to_json() for
+    each option combination, saved as JSON to compare releases.
+conversion: speed of the conversion of the numeric cell values, against
+    the conversion through Decimal.
+startup: startup time of the command line, and check of the modules it
+    imports.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.generate bench.ods --rows 10000 --columns 20
+    python -m benchmarks.harness bench.ods --output results.json
+    python -m benchmarks.harness bench.ods --compare results.json
+    python -m benchmarks.conversion
+    python -m benchmarks.startup --max-import 100
+"""
@@ -0,0 +1,99 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Micro-benchmark of the conversion of the numeric cell values.
+
+Times odsparsator.numeric.number(), used by ODSParsator.json_convert(),
+against decimal_number(), the conversion through Decimal, on generated
+office:value literals: integers, prices with two decimals and floats of 15
+significant digits. The "distinct" case has no repeated literal, so the
+memoization does not help, the "repeated" case draws the literals from a
+small set of values, as in many sheets. The results of the two functions
+are checked to be identical.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+
+from odsparsator.numeric import clear_memo, decimal_number, number
+
+
+def literals(count: int, distinct: int | None = None, seed: int = 0) -> list[str]:
+    """Return office:value literals, a third of each kind.
+
+    Args:
+        count (int): Number of literals.
+        distinct (int or None): Number of distinct values the literals are
+            drawn from, default to all different.
+        seed (int): Seed of the random generator.
+    """
+    rnd = random.Random(seed)  # noqa: S311
+    kinds = (
+        lambda: str(rnd.randint(-100_000, 100_000)),
+        lambda: f"{rnd.randint(0, 9999)}.{rnd.randint(1, 99):02d}",
+        lambda: f"{rnd.uniform(-1000, 1000):.15g}",
+    )
+    values = [kinds[index % 3]() for index in range(distinct or count)]
+    if distinct is None:
+        return values
+    return [rnd.choice(values) for _ in range(count)]
+
+
+def best_time(
+    convert: Callable[[str], int | float], values: list[str], repeat: int
+) -> float:
+    """Return the best time of the conversion of the literals."""
+    best = float("inf")
+    for _ in range(repeat):
+        clear_memo()
+        start = time.perf_counter()
+        for value in values:
+            convert(value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(count: int = 1_000_000, repeat: int = 3) -> dict[str, dict[str, float]]:
+    """Time the two conversions on distinct and on repeated literals.
+
+    Args:
+        count (int): Number of literals of each case.
+        repeat (int): Number of runs, the best time is kept.
+
+    Returns:
+        dict: name of case -> {"decimal": seconds, "number": seconds,
+            "speedup": ratio}.
+    """
+    results = {}
+    for name, distinct in (("distinct", None), ("repeated", 1000)):
+        values = literals(count, distinct)
+        if [number(value) for value in values] != [
+            decimal_number(value) for value in values
+        ]:
+            raise ValueError(f"Different results in the {name} case")
+        reference = best_time(decimal_number, values, repeat)
+        fast = best_time(number, values, repeat)
+        results[name] = {
+            "decimal": reference,
+            "number": fast,
+            "speedup": reference / fast,
+        }
+    return results
+
+
+def main() -> None:
+    """Command line interface of the conversion benchmark."""
+    parser = argparse.ArgumentParser(description="Numeric conversion benchmark.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="literals")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    args = parser.parse_args()
+    print(json.dumps(compare(args.count, args.repeat), indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Generator of synthetic .ods files for the benchmarks.
+
+The cells contain a mix of floats, integers, strings, booleans and dates,
+optionally styled with background colors, spanned, or containing formulas.
+Blocks of repeated rows and hidden sheets can be added. The generation is
+deterministic for a given seed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from odfdo import Cell, Column, Document, Element, Row, Style, Table
+
+COLORS = ("#ffcccc", "#ccffcc", "#ccccff", "#ffffcc", "#ccffff", "#ffccff")
+HIDDEN_STYLE = (
+    '<style:style style:name="bench_hidden" style:family="table">'
+    '<style:table-properties table:display="false"/></style:style>'
+)
+
+
+@dataclass
+class CorpusSpec:
+    """Size and content of a synthetic spreadsheet.
+
+    Attributes:
+        rows (int): Rows per sheet, repeated blocks excluded.
+        columns (int): Columns per sheet.
+        sheets (int): Number of visible sheets.
+        hidden (int): Number of additional hidden sheets.
+        style_density (float): Ratio of cells with a background color style.
+        spans (int): Number of spanned areas of 2 x 2 cells per sheet.
+        formulas (float): Ratio of cells containing a formula.
+        repeated (int): Number of blocks of repeated rows per sheet.
+        repeat_size (int): Number of repetitions of each repeated row.
+        seed (int): Seed of the random generator.
+    """
+
+    rows: int = 1000
+    columns: int = 10
+    sheets: int = 1
+    hidden: int = 0
+    style_density: float = 0.0
+    spans: int = 0
+    formulas: float = 0.0
+    repeated: int = 0
+    repeat_size: int = 100
+    seed: int = 0
+
+
+def random_value(rnd: random.Random, x: int, y: int) -> Any:
+    kind = (x + y) % 5
+    if kind == 0:
+        return rnd.random() * 1000
+    if kind == 1:
+        return rnd.randint(-100000, 100000)
+    if kind == 2:
+        return f"text {rnd.randint(0, 999)} {x}:{y}"
+    if kind == 3:
+        return rnd.random() < 0.5
+    return date(2000, 1, 1) + timedelta(days=rnd.randint(0, 10000))
+
+
+def make_row(rnd: random.Random, spec: CorpusSpec, y: int) -> Row:
+    row = Row()
+    for x in range(spec.columns):
+        if rnd.random() < spec.formulas and y > 0:
+            cell = Cell(value=rnd.randint(0, 100), formula=f"of:=[.A{y}]+{x}")
+        else:
+            cell = Cell(value=random_value(rnd, x, y))
+        if rnd.random() < spec.style_density:
+            cell.style = f"bench_bg{rnd.randrange(len(COLORS))}"
+        row.append_cell(cell, clone=False)
+    return row
+
+
+def make_table(rnd: random.Random, spec: CorpusSpec, name: str) -> Table:
+    table = Table(name)
+    for x in range(spec.columns):
+        column = Column()
+        if spec.style_density and x % 3 == 0:
+            column.set_default_cell_style(f"bench_bg{x % len(COLORS)}")
+        table.append_column(column)
+    blocks = set(rnd.sample(range(spec.rows), min(spec.repeated, spec.rows)))
+    for y in range(spec.rows):
+        table.append_row(make_row(rnd, spec, y), clone=False)
+        if y in blocks:
+            row = make_row(rnd, spec, y)
+            row.repeated = spec.repeat_size
+            table.append_row(row, clone=False)
+    for _ in range(spec.spans):
+        if spec.rows < 2 or spec.columns < 2:
+            break
+        x = rnd.randrange(spec.columns - 1)
+        y = rnd.randrange(spec.rows - 1)
+        table.set_span((x, y, x + 1, y + 1))
+    return table
+
+
+def generate(path: Path | str, spec: CorpusSpec | None = None) -> Path:
+    """Write a synthetic .ods file.
+
+    Args:
+        path (str or Path): Path of the .ods file to write.
+        spec (CorpusSpec): Size and content of the spreadsheet.
+
+    Returns:
+        Path: path of the written file.
+    """
+    spec = spec or CorpusSpec()
+    rnd = random.Random(spec.seed)  # noqa: S311, not for security
+    doc = Document("spreadsheet")
+    doc.body.clear()
+    for index, color in enumerate(COLORS):
+        style = Style("table-cell", name=f"bench_bg{index}", background_color=color)
+        doc.insert_style(style, automatic=True)
+    if spec.hidden:
+        doc.insert_style(Element.from_tag(HIDDEN_STYLE), automatic=True)
+    for index in range(spec.sheets):
+        doc.body.append(make_table(rnd, spec, f"sheet {index}"))
+    for index in range(spec.hidden):
+        table = make_table(rnd, spec, f"hidden {index}")
+        table.style = "bench_hidden"
+        doc.body.append(table)
+    path = Path(path)
+    doc.save(path)
+    return path
+
+
+def main() -> None:
+    """Command line interface of the generator."""
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic .ods file for the benchmarks."
+    )
+    parser.add_argument("output", help="output .ods file")
+    parser.add_argument("--rows", type=int, default=defaults.rows)
+    parser.add_argument("--columns", type=int, default=defaults.columns)
+    parser.add_argument("--sheets", type=int, default=defaults.sheets)
+    parser.add_argument("--hidden", type=int, default=defaults.hidden)
+    parser.add_argument("--style-density", type=float, default=defaults.style_density)
+    parser.add_argument("--spans", type=int, default=defaults.spans)
+    parser.add_argument("--formulas", type=float, default=defaults.formulas)
+    parser.add_argument("--repeated", type=int, default=defaults.repeated)
+    parser.add_argument("--repeat-size", type=int, default=defaults.repeat_size)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = vars(parser.parse_args())
+    output = args.pop("output")
+    print(generate(output, CorpusSpec(**args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Benchmark harness: time ods_to_python() and ods_to_json() on .ods files.
+
+Each case (file, function, options) is run several times, the best time is
+kept. The peak memory is measured by tracemalloc in an additional run, so
+it does not slow down the timed runs. The results are saved as JSON, with
+the versions of odsparsator, odfdo and Python, and can be compared with the
+results of another release.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+import odfdo
+
+from odsparsator.odsparsator import __version__, ods_to_json, ods_to_python
+
+OPTIONS = ("export_minimal", "colors", "keep_styled", "all_styles", "see_hidden")
+FUNCTIONS = ("python", "json")
+
+
+def option_sets(combinations: bool = False) -> list[dict[str, bool]]:
+    """Return the option sets to benchmark: the default options and each
+    option alone, or all the combinations of the options.
+
+    Args:
+        combinations (bool): Return all the combinations.
+    """
+    if combinations:
+        return [
+            {name: True for index, name in enumerate(OPTIONS) if values[index]}
+            for values in product((False, True), repeat=len(OPTIONS))
+        ]
+    return [{}] + [{name: True} for name in OPTIONS]
+
+
+def case_name(function: str, options: dict[str, bool]) -> str:
+    return "+".join([function, *sorted(options)]) if options else function
+
+
+def count_cells(path: Path) -> tuple[int, int]:
+    """Return the number of rows and cells of the visible sheets, repeated
+    rows and cells included.
+
+    The default expanded output is counted, so that the harness also runs
+    with the releases predating the keep_repeated option.
+    """
+    content = ods_to_python(path, export_minimal=True)
+    rows = cells = 0
+    for table in content["body"]:
+        for row in table["table"]:
+            items = row["row"] if isinstance(row, dict) else row
+            rows += 1
+            cells += len(items)
+    return rows, cells
+
+
+def runner(
+    function: str, path: Path, options: dict[str, bool], output: Path
+) -> Callable[[], Any]:
+    if function == "python":
+        return lambda: ods_to_python(path, **options)
+    return lambda: ods_to_json(path, output, **options)
+
+
+def measure(run: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    """Return the best time of the runs, in seconds, and the peak memory
+    allocated by a run, in bytes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def benchmark(
+    files: Iterable[Path | str],
+    repeat: int = 3,
+    combinations: bool = False,
+    functions: Iterable[str] = FUNCTIONS,
+) -> dict[str, Any]:
+    """Run the benchmarks and return the results.
+
+    Args:
+        files (list of str or Path): The .ods files.
+        repeat (int): Number of timed runs of each case.
+        combinations (bool): All combinations of the options, else each
+            option alone.
+        functions (list of str): "python" for ods_to_python(), "json" for
+            ods_to_json().
+
+    Returns:
+        dict: the environment and a list of results, one per case.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "output.json"
+        for file in files:
+            path = Path(file)
+            size = path.stat().st_size
+            rows, cells = count_cells(path)
+            for function, options in product(functions, option_sets(combinations)):
+                seconds, peak = measure(runner(function, path, options, output), repeat)
+                results.append(
+                    {
+                        "file": path.name,
+                        "size": size,
+                        "rows": rows,
+                        "cells": cells,
+                        "case": case_name(function, options),
+                        "function": function,
+                        "options": options,
+                        "seconds": seconds,
+                        "rows_per_second": rows / seconds,
+                        "cells_per_second": cells / seconds,
+                        "bytes_per_second": size / seconds,
+                        "peak_memory": peak,
+                    }
+                )
+                print(f"{path.name} {results[-1]['case']}: {seconds:.3f} s")
+    return {
+        "odsparsator": __version__,
+        "odfdo": odfdo.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Return lines comparing the times and peak memory of the cases found
+    in both results."""
+    old = {(r["file"], r["case"]): r for r in previous["results"]}
+    lines = [
+        f"{previous['odsparsator']} -> {current['odsparsator']}: "
+        "time ratio, peak memory ratio (< 1 is better)"
+    ]
+    for result in current["results"]:
+        before = old.get((result["file"], result["case"]))
+        if before is None:
+            continue
+        time_ratio = result["seconds"] / before["seconds"]
+        memory_ratio = result["peak_memory"] / max(before["peak_memory"], 1)
+        lines.append(
+            f"{result['file']} {result['case']}: "
+            f"{time_ratio:.2f} time, {memory_ratio:.2f} memory"
+        )
+    return lines
+
+
+def main() -> None:
+    """Command line interface of the harness."""
+    parser = argparse.ArgumentParser(description="Benchmark odsparsator.")
+    parser.add_argument("files", nargs="+", help=".ods files")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument(
+        "--combinations",
+        action="store_true",
+        help="all combinations of the options, else each option alone",
+    )
+    parser.add_argument(
+        "--function", choices=FUNCTIONS, action="append", dest="functions"
+    )
+    parser.add_argument("--output", help="JSON file of the results")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    args = parser.parse_args()
+    results = benchmark(
+        args.files, args.repeat, args.combinations, args.functions or FUNCTIONS
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=4), encoding="utf8")
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf8"))
+        print("\n".join(compare(previous, results)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Startup time of the odsparsator command line.
+
+Each command runs in a fresh interpreter, the best time is kept: the empty
+interpreter as baseline, the import of odsparsator.cli, and the --version and
+--help options. The heavy modules (odfdo, lxml, numpy...) must not be loaded
+by the import of the command line, they are loaded when a conversion runs.
+
+With --max-import, the exit status is 1 if the import of the command line
+takes more than the given milliseconds above the baseline, or if a heavy
+module is loaded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = (
+    "odfdo",
+    "lxml",
+    "numpy",
+    "orjson",
+    "multiprocessing",
+    "concurrent.futures",
+    "odsparsator.odsparsator",
+)
+COMMANDS = {
+    "python": ["-c", "pass"],
+    "import": ["-c", "import odsparsator.cli"],
+    "version": ["-m", "odsparsator.cli", "--version"],
+    "help": ["-m", "odsparsator.cli", "--help"],
+}
+LOADED = (
+    "import json, sys, odsparsator.cli; "
+    "print(json.dumps(sorted(set(sys.modules) & set({modules!r}))))"
+)
+
+
+def best_time(arguments: list[str], repeat: int) -> float:
+    """Return the best wall time of the command in a new interpreter."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *arguments], capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def heavy_modules() -> list[str]:
+    """Return the heavy modules loaded by the import of odsparsator.cli."""
+    code = LOADED.format(modules=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    loaded: list[str] = json.loads(proc.stdout)
+    return loaded
+
+
+def startup(repeat: int = 10) -> dict[str, object]:
+    """Measure the startup of the command line.
+
+    Args:
+        repeat (int): Number of runs of each command.
+
+    Returns:
+        dict: the best time of each command, in seconds, and the heavy modules
+            loaded by the import of the command line.
+    """
+    return {
+        "python": sys.version.split()[0],
+        "seconds": {
+            name: best_time(arguments, repeat) for name, arguments in COMMANDS.items()
+        },
+        "heavy_modules": heavy_modules(),
+    }
+
+
+def main() -> None:
+    """Command line interface of the startup benchmark."""
+    parser = argparse.ArgumentParser(description="Startup time of odsparsator.")
+    parser.add_argument("--repeat", type=int, default=10, help="runs per command")
+    parser.add_argument(
+        "--max-import",
+        type=float,
+        help="fail above this import time of the CLI, in ms over the baseline",
+        metavar="MS",
+    )
+    args = parser.parse_args()
+    results = startup(args.repeat)
+    print(json.dumps(results, indent=4))
+    if args.max_import is None:
+        return
+    seconds = results["seconds"]
+    assert isinstance(seconds, dict)
+    overhead = (seconds["import"] - seconds["python"]) * 1000
+    if overhead > args.max_import or results["heavy_modules"]:
+        print(f"Import of the CLI: {overhead:.0f} ms over the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
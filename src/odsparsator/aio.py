@@ -0,0 +1,231 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Asynchronous front-end of odsparsator, for asyncio based services.
+
+The parsing runs in an executor, so it does not block the event loop:
+the default executor of the loop (threads), or any concurrent.futures
+executor, like a ProcessPoolExecutor. An AsyncParsator limits the number of
+parsings running at the same time.
+
+Cancellation: cancelling the awaiting task stops a parsing running in a
+thread at the next row (see ODSParsator cancel option), a job of a process
+executor is cancelled only if it has not started yet. A cancelled parsing
+keeps its slot until its job ends. A cancelled ods_to_json() leaves
+its output path unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from threading import Event, Lock
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from odsparsator.odsparsator import iter_rows, ods_to_json, ods_to_python
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_BATCH_SIZE = 256
+
+
+class AsyncParsator:
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """Run the parsings in an executor, at most max_concurrency at a time.
+
+        Args:
+            executor (Executor): Executor of the parsings, default to None,
+                the default executor of the event loop.
+            max_concurrency (int): Maximum number of parsings running at the
+                same time, the others wait for a free slot.
+        """
+        self.executor = executor
+        self.max_concurrency = max(1, max_concurrency)
+        # one semaphore per event loop, an asyncio object being bound to a loop
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    @property
+    def uses_processes(self) -> bool:
+        return isinstance(self.executor, ProcessPoolExecutor)
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting the parsings of the running loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a parsing function of odsparsator in the executor.
+
+        A cancel event is given to the function when running in a thread. The
+        slot of the parsing is released when the job ends, not when the
+        awaiting task is cancelled.
+        """
+        semaphore = self.semaphore()
+        await semaphore.acquire()
+        cancel = None
+        if not self.uses_processes:
+            cancel = Event()
+            kwargs["cancel"] = cancel
+        call = partial(function, *args, **kwargs)
+        try:
+            if self.executor is None:
+                future = asyncio.get_running_loop().run_in_executor(None, call)
+                job = None
+            else:
+                job = self.executor.submit(call)
+                future = asyncio.wrap_future(job)
+        except BaseException:
+            semaphore.release()
+            raise
+        release_when_done(future, semaphore)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if cancel is not None:
+                cancel.set()
+            elif job is not None:
+                job.cancel()  # only effective if the job has not started
+            raise
+
+    async def ods_to_python(
+        self, input_path: Path | str, **options: Any
+    ) -> dict[str, Any] | list[Any]:
+        """Parse the input file and return the content as python structure.
+
+        Args:
+            input_path (str or Path): Path of the .ods file
+            options: Options of odsparsator.ods_to_python().
+
+        Returns:
+            dict or list: content as python structure
+        """
+        result: dict[str, Any] | list[Any] = await self.run(
+            ods_to_python, input_path, **options
+        )
+        return result
+
+    async def ods_to_json(
+        self, input_path: Path | str, output_path: Path | str, **options: Any
+    ) -> None:
+        """Parse the input file and save the result in a json file.
+
+        Args:
+            input_path (str or Path): Path of the .ods file
+            output_path (str or Path): Path of the json output file.
+            options: Options of odsparsator.ods_to_json().
+        """
+        await self.run(ods_to_json, input_path, output_path, **options)
+
+    async def iter_rows(
+        self,
+        input_path: Path | str,
+        sheet: int | str = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **options: Any,
+    ) -> AsyncIterator[Any]:
+        """Yield the rows of one sheet as they are parsed.
+
+        The rows are parsed by batches in a thread, the content.xml part
+        being read as a stream, see odsparsator.iter_rows(). The rows of a
+        batch are yielded before the parsing of the next batch. A process
+        executor is not used, the parser being kept between the batches.
+
+        Args:
+            input_path (str or Path): Path of the .ods file
+            sheet (int or str): Position of the sheet in the document, or name.
+            batch_size (int): Number of rows parsed by call of the executor.
+            options: Options of odsparsator.iter_rows().
+
+        Yields:
+            list or dict: content of the row as python structure
+        """
+        executor = None if self.uses_processes else self.executor
+        rows = iter_rows(input_path, sheet, **options)
+        lock = Lock()
+        semaphore = self.semaphore()
+        await semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            while batch := await loop.run_in_executor(
+                executor, next_batch, rows, lock, max(1, batch_size)
+            ):
+                for row in batch:
+                    yield row
+        finally:
+            # the generator may still be running a cancelled batch, the slot
+            # is released once it is closed
+            closing = loop.run_in_executor(executor, close_rows, rows, lock)
+            release_when_done(closing, semaphore)
+
+
+def release_when_done(
+    future: asyncio.Future[Any], semaphore: asyncio.Semaphore
+) -> None:
+    """Release the slot of the semaphore when the job of the future ends."""
+    future.add_done_callback(lambda _future: semaphore.release())
+
+
+def next_batch(rows: Iterator[Any], lock: Lock, size: int) -> list[Any]:
+    with lock:
+        return list(islice(rows, size))
+
+
+def close_rows(rows: Iterator[Any], lock: Lock) -> None:
+    with lock:
+        rows.close()  # type: ignore[attr-defined]
+
+
+async def ods_to_python_async(
+    input_path: Path | str,
+    executor: Executor | None = None,
+    **options: Any,
+) -> dict[str, Any] | list[Any]:
+    """Parse the input file in an executor and return the content as python
+    structure.
+
+    Use an AsyncParsator to limit the number of concurrent parsings.
+
+    Args:
+        input_path (str or Path): Path of the .ods file
+        executor (Executor): Executor of the parsing, default to None, the
+            default executor of the event loop.
+        options: Options of odsparsator.ods_to_python().
+
+    Returns:
+        dict or list: content as python structure
+    """
+    return await AsyncParsator(executor).ods_to_python(input_path, **options)
+
+
+async def ods_to_json_async(
+    input_path: Path | str,
+    output_path: Path | str,
+    executor: Executor | None = None,
+    **options: Any,
+) -> None:
+    """Parse the input file in an executor and save the result in a json file.
+
+    Use an AsyncParsator to limit the number of concurrent parsings.
+
+    Args:
+        input_path (str or Path): Path of the .ods file
+        output_path (str or Path): Path of the json output file.
+        executor (Executor): Executor of the parsing, default to None, the
+            default executor of the event loop.
+        options: Options of odsparsator.ods_to_json().
+    """
+    await AsyncParsator(executor).ods_to_json(input_path, output_path, **options)
@@ -0,0 +1,105 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Selective loading of the members of the .ods archive.
+
+Parsing needs only the mimetype, content.xml and, unless in minimal mode,
+styles.xml members. A document opened from a path already reads its members
+on demand, but odfdo decompresses all the members of an archive given in
+memory, images and thumbnails included. ArchiveContainer keeps the zip
+archive open instead, and decompresses a member only when it is first asked
+for, so the load time and memory depend on the sheet data, not on the size
+of the archive.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from io import BytesIO
+from typing import IO, BinaryIO
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from odfdo import Document
+from odfdo.container import Container
+
+MIMETYPE = "mimetype"
+CONTENT = "content.xml"
+STYLES = "styles.xml"
+
+
+def needed_parts(export_minimal: bool, colors: bool) -> tuple[str, ...]:
+    """Return the members of the archive read by a parsing.
+
+    Args:
+        export_minimal (bool): Minimal mode, no styles.
+        colors (bool): The background colors of the cells are collected.
+    """
+    if export_minimal and not colors:
+        return (MIMETYPE, CONTENT)
+    return (MIMETYPE, CONTENT, STYLES)
+
+
+class ArchiveContainer(Container):
+    def __init__(self, file: BinaryIO) -> None:
+        """odfdo Container of a zip archive given as a binary file object,
+        reading its members on demand.
+
+        The file object must stay open while the document is used.
+
+        Args:
+            file (file object): Seekable binary file object, like a BytesIO.
+        """
+        super().__init__()
+        self.archive = ZipFile(file)
+        self.mimetype = self.archive.read(MIMETYPE)
+
+    def _get_zip_part(self, name: str) -> bytes | None:
+        """Decompress a member of the archive, kept for the next calls."""
+        try:
+            data = self.archive.read(name)
+        except KeyError:
+            return None
+        self.set_part(name, data)
+        return data
+
+    def get_parts(self) -> list[str]:
+        """Get the list of members."""
+        return self.archive.namelist()
+
+    def open_member(self, name: str) -> IO[bytes]:
+        """Open the original member of the archive for streamed reading.
+
+        Args:
+            name (str): Name of the member, like "content.xml".
+        """
+        return self.archive.open(name)
+
+    def slim_archive(self, names: Iterable[str]) -> bytes:
+        """Return a zip archive of only some original members.
+
+        Used to send the document to the worker processes without its images.
+
+        Args:
+            names (iterable of str): Names of the members to keep, the missing
+                ones are ignored.
+        """
+        output = BytesIO()
+        with ZipFile(output, "w") as slim:
+            for name in names:
+                if name not in self.archive.NameToInfo:
+                    continue
+                with self.open_member(name) as member:
+                    data = member.read()
+                compression = ZIP_STORED if name == MIMETYPE else ZIP_DEFLATED
+                slim.writestr(name, data, compress_type=compression, compresslevel=1)
+        return output.getvalue()
+
+
+def load_archive(file: BinaryIO) -> Document:
+    """Return the document of a .ods archive given as a binary file object,
+    only its mimetype being read.
+
+    Args:
+        file (file object): Seekable binary file object, like a BytesIO.
+    """
+    return Document(ArchiveContainer(file))
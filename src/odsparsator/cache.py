@@ -0,0 +1,178 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Persistent cache of the parsing results, in a directory.
+
+The key of a result combines the CRC32 and sizes of the content.xml and
+styles.xml parts, read from the central directory of the zip archive, the
+versions of odsparsator and odfdo, and the options of the parsing. A cache
+hit returns the stored result without decompressing the archive.
+
+The least recently used entries are removed when the size of the directory
+exceeds the size limit.
+
+The entries of ods_to_python() are pickled: only use a cache directory
+writable by trusted users.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Union
+from zipfile import ZipFile
+
+import odfdo
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+SUFFIX = ".entry"
+PARTS = ("content.xml", "styles.xml")
+
+
+def archive_crcs(input_path: Path | str | BinaryIO) -> dict[str, tuple[int, int]]:
+    """Return the CRC32 and size of the content.xml and styles.xml parts.
+
+    Only the central directory of the zip archive is read.
+
+    Args:
+        input_path (str or Path or BytesIO): Path of the .ods file, or its
+            content.
+
+    Returns:
+        dict: name of part -> (CRC32, uncompressed size).
+    """
+    with ZipFile(input_path) as archive:
+        names = set(archive.namelist())
+        return {
+            name: (archive.getinfo(name).CRC, archive.getinfo(name).file_size)
+            for name in PARTS
+            if name in names
+        }
+
+
+def write_atomic(path: Path | str, data: bytes) -> None:
+    """Write the data to the file, replacing it only once fully written.
+
+    Args:
+        path (str or Path): Path of the file.
+        data (bytes): Content of the file.
+    """
+    path = Path(path)
+    handle, name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(handle, "wb") as file:
+        file.write(data)
+    os.replace(name, path)
+
+
+class ResultCache:
+    def __init__(self, directory: Path | str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Cache of results stored in a directory, created if needed.
+
+        Args:
+            directory (str or Path): Directory of the cache entries.
+            max_size (int): Maximum size of the entries, in bytes.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    def key(
+        self, input_path: Path | str | BinaryIO, options: dict[str, Any], version: str
+    ) -> str:
+        """Return the key of the result of the parsing of a file.
+
+        Args:
+            input_path (str or Path or file object): Path of the .ods file,
+                or a seekable binary file object of its content.
+            options (dict): Options changing the result, JSON serializable.
+            version (str): Version of odsparsator.
+        """
+        description = {
+            "parts": archive_crcs(input_path),
+            "odsparsator": version,
+            "odfdo": odfdo.__version__,
+            "options": options,
+        }
+        text = json.dumps(description, sort_keys=True, default=repr)
+        return hashlib.sha256(text.encode("utf8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Path of the entry of the key."""
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, key: str) -> Path | None:
+        """Return the path of the entry of the key, or None if not cached.
+
+        The entry is marked as recently used.
+        """
+        path = self.path(key)
+        try:
+            self.touch(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    @staticmethod
+    def touch(path: Path | str) -> None:
+        """Set the modification time of the entry to now, with the full
+        precision of the clock."""
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store the data of the key, then remove the least recently used
+        entries if the cache is too large."""
+        if len(data) > self.max_size:
+            return
+        write_atomic(self.path(key), data)
+        self.touch(self.path(key))
+        self.evict()
+
+    def put_file(self, key: str, source: Path | str) -> None:
+        """Store a copy of the file as the entry of the key."""
+        if Path(source).stat().st_size > self.max_size:
+            return
+        handle, name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(handle)
+        shutil.copyfile(source, name)
+        os.replace(name, self.path(key))
+        self.touch(self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the size of the cache
+        is under the size limit."""
+        entries = []
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+CacheOption = Union[ResultCache, Path, str, None]  # noqa: UP007
+
+
+def as_cache(cache: CacheOption) -> ResultCache | None:
+    """Return the ResultCache of a cache option: a ResultCache, a directory or
+    None."""
+    if cache is None or isinstance(cache, ResultCache):
+        return cache
+    return ResultCache(cache)
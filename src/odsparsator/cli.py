@@ -1,23 +1,52 @@
 # Copyright 2021-2025 Jérôme Dumonteil
 # Licence: MIT
 # Authors: jerome.dumonteil@gmail.com
-"""CLI interface to odsparsator."""
+"""CLI interface to odsparsator.
+
+The odfdo library and the parsing modules are imported only when a
+conversion runs, so --version and --help start fast.
+"""
 
 from __future__ import annotations
 
 import argparse
+import ast
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import odfdo
+from odsparsator.version import __version__
+from odsparsator.writer import PRETTY, PROFILES
 
-from odsparsator.odsparsator import __doc__ as op_doc
-from odsparsator.odsparsator import __version__, ods_to_json
+if TYPE_CHECKING:
+    from odsparsator.stats import ParseStats
 
 ODFDO_REQUIREMENT = (3, 14, 0)
 
 
+class HelpParser(argparse.ArgumentParser):
+    def format_help(self) -> str:
+        """Format the help, the epilog being the documentation of the
+        odsparsator module."""
+        if self.epilog is None:
+            self.epilog = module_doc()
+        return super().format_help()
+
+
+def module_doc() -> str:
+    """Return the docstring of the odsparsator module, read from its source
+    without importing it."""
+    path = Path(__file__).with_name("odsparsator.py")
+    try:
+        return ast.get_docstring(ast.parse(path.read_text(encoding="utf8"))) or ""
+    except OSError:  # pragma: no cover
+        return ""
+
+
 def check_odfdo_version() -> bool:
     """Utility to verify we have the minimal version of the odfdo library."""
+    import odfdo
+
     if tuple(int(x) for x in odfdo.__version__.split(".")) >= ODFDO_REQUIREMENT:
         return True
     print(  # pragma: no cover
@@ -27,6 +56,25 @@ def check_odfdo_version() -> bool:
     return False  # pragma: no cover
 
 
+def sheet_argument(value: str) -> int | str:
+    """Convert the --sheet argument: position of the sheet if numeric, else
+    name of the sheet. A numeric name is given by --sheet-name."""
+    if value.isdigit():
+        return int(value)
+    return value
+
+
+def range_argument(value: str) -> str:
+    """Check the --range argument, a range of cells like "A1:H500"."""
+    from odsparsator.window import parse_range
+
+    try:
+        parse_range(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+    return value
+
+
 def main() -> None:  # pragma: no cover
     """Read parameters from STDIN and apply the required command.
 
@@ -37,20 +85,22 @@ def main() -> None:  # pragma: no cover
         input_file: Input file, a .ods file.
 
         output_file: Output file, json file generated from input.
+
+    "-" as input_file or output_file reads stdin or writes stdout.
     """
-    if not check_odfdo_version():
-        sys.exit(1)
-    parser = argparse.ArgumentParser(
+    parser = HelpParser(
         description="Generate a json file from an OpenDocument Format .ods file.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=op_doc,
     )
     parser.add_argument(
         "--version", action="version", version="%(prog)s " + __version__
     )
-    parser.add_argument("input_file", help="input file, a .ods ODF file.")
     parser.add_argument(
-        "output_file", help="output file, exported content in JSON format."
+        "input_file", help="input file, a .ods ODF file, - to read stdin."
+    )
+    parser.add_argument(
+        "output_file",
+        help="output file, exported content in JSON format, - to write stdout.",
     )
     parser.add_argument(
         "-m",
@@ -82,16 +132,142 @@ def main() -> None:  # pragma: no cover
         help="parse also the hidden sheets",
         action="store_true",
     )
+    parser.add_argument(
+        "-r",
+        "--keep-repeated",
+        help='keep repeated rows and cells as one item with a "repeat" count',
+        action="store_true",
+    )
+    parser.add_argument(
+        "--raw",
+        help='keep the cell values unconverted, as ["type", "raw string"] pairs',
+        action="store_true",
+    )
+    parser.add_argument(
+        "--stream",
+        help="read the sheets as a stream of rows, lower memory usage",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--sheet",
+        help="parse only this sheet, name or position from 0, can be repeated",
+        action="append",
+        type=sheet_argument,
+        dest="sheets",
+        metavar="SHEET",
+    )
+    parser.add_argument(
+        "--sheet-name",
+        help="parse only the sheet of this name, even if numeric, can be repeated",
+        action="append",
+        dest="sheets",
+        metavar="NAME",
+    )
+    parser.add_argument(
+        "--range",
+        help='parse only this range of cells of the sheets, like "A1:H500"',
+        type=range_argument,
+        dest="cell_range",
+        metavar="RANGE",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="parse the sheets in N parallel processes",
+        type=int,
+        default=1,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--profile",
+        help=(
+            "JSON output: pretty (default), compact (no indentation), "
+            "fast (compact, using orjson if installed)"
+        ),
+        choices=PROFILES,
+        default=PRETTY,
+        metavar="PROFILE",
+    )
+    parser.add_argument(
+        "--ndjson",
+        help="write JSON Lines, one row per line",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--stats",
+        help="print the timing and counters of the parsing on stderr, as JSON",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache",
+        help="directory of the result cache, reused if the input is unchanged",
+        metavar="DIR",
+    )
+    parser.add_argument(
+        "--cprofile",
+        help="run the conversion under cProfile, write the pstats to FILE",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        help=(
+            "run the conversion under tracemalloc, write the peak memory and "
+            "the top allocation sites by ODSParsator method to FILE"
+        ),
+        metavar="FILE",
+    )
     args = parser.parse_args()
+    if not check_odfdo_version():
+        sys.exit(1)
+    if args.cprofile or args.tracemalloc:
+        from odsparsator.profiling import run_profiled
+
+        stats = run_profiled(
+            lambda probe: convert(args, probe), args.cprofile, args.tracemalloc
+        )
+    else:
+        stats = convert(args, None)
+    if stats is not None:
+        import json
+
+        print(json.dumps(stats.as_dict(), indent=4), file=sys.stderr)
+
+
+def convert(args: argparse.Namespace, stats: ParseStats | None) -> ParseStats | None:
+    """Run ods_to_json() with the command line arguments.
+
+    Args:
+        args (Namespace): Parsed arguments.
+        stats (ParseStats): Stats of the profiling, if any.
+
+    Returns:
+        ParseStats: the stats to print, with the --stats option.
+    """
+    from odsparsator.odsparsator import ods_to_json
+    from odsparsator.stats import ParseStats
+
+    if stats is None and args.stats:
+        stats = ParseStats()
     ods_to_json(
-        args.input_file,
-        args.output_file,
+        sys.stdin.buffer if args.input_file == "-" else args.input_file,
+        sys.stdout.buffer if args.output_file == "-" else args.output_file,
         args.minimal,
         args.all_styles,
         args.color,
         args.keep_styled,
         args.see_hidden,
+        args.stream,
+        args.sheets,
+        args.cell_range,
+        args.jobs,
+        args.profile,
+        args.ndjson,
+        args.keep_repeated,
+        args.cache,
+        stats,
+        raw_values=args.raw,
     )
+    return stats if args.stats else None
 
 
 if __name__ == "__main__":
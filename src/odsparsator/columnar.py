@@ -0,0 +1,205 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Columnar layout of the tables: one typed array per column.
+
+Each column is a dict {"type": kind, "values": values, "mask": mask}:
+    - "int" columns: array("q") of 64-bit integers,
+    - "float" columns: array("d") of floats (integer values are converted),
+    - "bool" columns: array("B") of 0 or 1,
+    - "object" columns: list of str (dates, times, strings) or mixed values.
+The mask is an array("B"), 1 for the empty cells, where the value is 0 or
+None. With NumPy installed, the arrays are converted to numpy.ndarray
+(int64, float64, bool) and the masks are boolean arrays.
+
+The types come from the office:value-type attribute of the cells.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any
+
+from odfdo.cell import Cell
+from odfdo.row import Row
+from odfdo.utils import digit_to_alpha
+
+# numpy is imported by the first conversion to numpy arrays
+HAS_NUMPY = find_spec("numpy") is not None
+
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+OBJECT = "object"
+TYPE = "type"
+VALUES = "values"
+MASK = "mask"
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+_TYPECODES = {INT: "q", FLOAT: "d", BOOL: "B"}
+_DTYPES = {INT: "int64", FLOAT: "float64"}
+
+
+def value_kind(value: Any) -> str:
+    """Return the column type fitting the value."""
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, int):
+        return INT if INT64_MIN <= value <= INT64_MAX else OBJECT
+    if isinstance(value, float):
+        return FLOAT
+    return OBJECT
+
+
+class ColumnBuilder:
+    def __init__(self, height: int = 0) -> None:
+        """Typed values of a column, filled one cell at a time.
+
+        Args:
+            height (int): Number of empty cells before the first one added.
+        """
+        self.kind: str | None = None  # only empty cells so far
+        self.values: Any = []
+        self.mask = array("B", [1]) * height
+        self.height = height
+
+    def _convert(self, kind: str) -> None:
+        """Change the type of the column, keeping the values."""
+        if self.kind is None:
+            values: list[Any] = [None if kind == OBJECT else 0] * self.height
+        elif self.kind == BOOL:
+            values = [bool(value) for value in self.values]
+        else:
+            values = list(self.values)
+        if kind == OBJECT:
+            self.values = [
+                None if self.mask[index] else value
+                for index, value in enumerate(values)
+            ]
+        else:
+            self.values = array(_TYPECODES[kind], values)
+        self.kind = kind
+
+    def _fit(self, kind: str) -> None:
+        """Change the type of the column if needed to store a value."""
+        if kind == self.kind or self.kind == OBJECT:
+            return
+        if self.kind is None:
+            self._convert(kind)
+        elif {kind, self.kind} == {INT, FLOAT}:
+            if self.kind == INT:
+                self._convert(FLOAT)
+        else:
+            self._convert(OBJECT)
+
+    def append(self, value: Any) -> None:
+        """Add the value of the next cell, None for an empty cell."""
+        if value is not None:
+            self._fit(value_kind(value))
+        self.height += 1
+        self.mask.append(value is None)
+        if self.kind is None:
+            return  # values are created when the type is known
+        if value is None and self.kind != OBJECT:
+            value = 0
+        self.values.append(value)
+
+    def result(self, use_numpy: bool) -> dict[str, Any]:
+        """Return the column as a dict {"type", "values", "mask"}."""
+        if self.kind is None:
+            self._convert(OBJECT)
+        kind = self.kind or OBJECT
+        if not (use_numpy and HAS_NUMPY):
+            return {TYPE: kind, VALUES: self.values, MASK: self.mask}
+        import numpy
+
+        mask = numpy.frombuffer(self.mask, dtype="uint8").astype(bool)
+        if kind == OBJECT:
+            return {TYPE: kind, VALUES: self.values, MASK: mask}
+        if kind == BOOL:
+            values = numpy.frombuffer(self.values, dtype="uint8").astype(bool)
+        else:
+            values = numpy.frombuffer(self.values, dtype=_DTYPES[kind]).copy()
+        return {TYPE: kind, VALUES: values, MASK: mask}
+
+
+class TableColumns:
+    def __init__(self, convert: Callable[[Cell], Any], header: bool = False) -> None:
+        """Columns of a table, filled one row at a time.
+
+        Args:
+            convert (callable): Conversion of a cell value to a python type,
+                like ODSParsator.json_convert().
+            header (bool): Use the values of the first row as column names.
+        """
+        self.convert = convert
+        self.header: list[Any] | None = [] if header else None
+        self.columns: list[ColumnBuilder] = []
+        self.height = 0
+
+    def add_row(self, row: Row, repeated: int = 1) -> list:
+        """Add the values of the cells of the row to the columns.
+
+        Args:
+            row (odfdo.Row): Row object.
+            repeated (int): Number of repetitions of the row.
+
+        Returns:
+            list: empty list, no row is built.
+        """
+        values = [self.convert(cell) for cell in row.traverse()]
+        if self.header == []:
+            self.header = values or [None]
+            repeated -= 1
+        for _ in range(repeated):
+            for x, value in enumerate(values):
+                if x == len(self.columns):
+                    self.columns.append(ColumnBuilder(self.height))
+                self.columns[x].append(value)
+            for column in self.columns[len(values) :]:
+                column.append(None)
+            self.height += 1
+        return []
+
+    def names(self, first_column: int = 0) -> list[str]:
+        """Names of the columns: letters of the columns, or values of the
+        header row if not empty and unique. A name already used gets a "_2",
+        "_3"... suffix, so that all the names are unique.
+
+        Args:
+            first_column (int): Position of the first column in the sheet.
+        """
+        names: list[str] = []
+        used: set[str] = set()
+        header = self.header or []
+        for x in range(len(self.columns)):
+            value = header[x] if x < len(header) else None
+            if value is None or str(value) in used:
+                value = digit_to_alpha(first_column + x)
+            name = base = str(value)
+            suffix = 2
+            while name in used:
+                name = f"{base}_{suffix}"
+                suffix += 1
+            used.add(name)
+            names.append(name)
+        return names
+
+    def result(
+        self, use_numpy: bool = True, first_column: int = 0
+    ) -> dict[str, dict[str, Any]]:
+        """Return the columns by name, see names() and ColumnBuilder.result().
+
+        Args:
+            use_numpy (bool): Convert the arrays to numpy arrays if NumPy is
+                installed.
+            first_column (int): Position of the first column in the sheet.
+        """
+        names = self.names(first_column)
+        return {
+            names[x]: column.result(use_numpy) for x, column in enumerate(self.columns)
+        }
@@ -0,0 +1,77 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Conversion of the office:value literals of the numeric cells.
+
+The value of a float, percentage or currency cell is an int if it is
+integral, else a float, as given by decimal_number(). number() gives the
+same results with less work: the integer literals are detected on the string
+and parsed by int(), the other literals by float(), and Decimal is only used
+for the few literals with an integral value which are not written as
+integers, like "2.0" or "1e3". The results of the MEMO_SIZE most recently
+used literals are memoized, the same values being often repeated in a sheet.
+benchmarks.conversion compares the two functions.
+"""
+
+from __future__ import annotations
+
+import math
+from decimal import Decimal
+from functools import lru_cache
+
+NUMERIC_TYPES = frozenset(("float", "percentage", "currency"))
+MEMO_SIZE = 4096
+# odfdo reads these attribute values as booleans, so a malformed numeric cell
+# with such a value was converted to 1 or 0
+BOOLEAN_LITERALS = {"true": 1, "false": 0}
+
+
+def decimal_number(literal: str) -> int | float:
+    """Return the value of the literal, int if integral, else float, using
+    Decimal.
+
+    Args:
+        literal (str): Value of the office:value attribute.
+    """
+    if literal in BOOLEAN_LITERALS:
+        return BOOLEAN_LITERALS[literal]
+    value = Decimal(literal)
+    if int(value) == value:
+        return int(value)
+    return float(value)
+
+
+def parse_number(literal: str) -> int | float:
+    """Return the value of the literal, int if integral, else float, like
+    decimal_number(), without memoization.
+
+    Args:
+        literal (str): Value of the office:value attribute.
+    """
+    digits = literal[1:] if literal[:1] == "-" else literal
+    if digits.isdecimal():
+        return int(literal)
+    try:
+        value = float(literal)
+    except ValueError:
+        return decimal_number(literal)  # raises the error of Decimal
+    # a float not integral is the rounding of a not integral decimal
+    if not value.is_integer() and math.isfinite(value):
+        return value
+    return decimal_number(literal)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def number(literal: str) -> int | float:
+    """Return the value of the literal, int if integral, else float, like
+    decimal_number(), memoized in a least recently used cache.
+
+    Args:
+        literal (str): Value of the office:value attribute.
+    """
+    return parse_number(literal)
+
+
+def clear_memo() -> None:
+    """Forget the memoized results of number()."""
+    number.cache_clear()
@@ -14,18 +14,51 @@ The resulting data follow the format of the reverse odsgenerator.py script.
 
 from __future__ import annotations
 
+import hashlib
 import json
-from decimal import Decimal
+import os
+import pickle
+import secrets
+import shutil
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from io import BufferedIOBase, BytesIO, RawIOBase, StringIO, TextIOWrapper
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Any
+from threading import Event
+from time import perf_counter
+from typing import Any, BinaryIO, TextIO, Union, cast
 
 from odfdo import Document, Element
 from odfdo.cell import Cell
 from odfdo.document import Table
 from odfdo.row import Row
 
-__version__ = "1.13.1"
-
+from odsparsator.archive import ArchiveContainer, load_archive, needed_parts
+from odsparsator.cache import CacheOption, as_cache, write_atomic
+from odsparsator.columnar import TableColumns
+from odsparsator.numeric import NUMERIC_TYPES, number
+from odsparsator.stats import ParseStats, TimedWriter
+from odsparsator.stream import ROW as STREAM_ROW
+from odsparsator.stream import (
+    TABLE_END,
+    TABLE_START,
+    ContentStream,
+    load_content_styles,
+    table_digests,
+    table_shells,
+)
+from odsparsator.version import __version__
+from odsparsator.window import (
+    XPATH_CELLS,
+    XPATH_COLUMNS,
+    XPATH_ROWS,
+    CellRange,
+    Window,
+    crop_table,
+    parse_range,
+)
+from odsparsator.writer import PRETTY, JSONWriter, NDJSONWriter
 
 BODY = "body"
 TABLE = "table"
@@ -41,7 +74,149 @@ WIDTH = "width"
 SPAN = "span"
 STYLE = "style"
 STYLES = "styles"
+REPEAT = "repeat"
+OPTIONS = "options"
+SHEETS = "sheets"
+RECORD = "record"
 DEFAULT_BGCOLOR = "#ffffff"
+# attribute of the raw value of each value type, the strings are read as text
+RAW_ATTRIBUTES = {
+    "float": "office:value",
+    "percentage": "office:value",
+    "currency": "office:value",
+    "date": "office:date-value",
+    "time": "office:time-value",
+    "boolean": "office:boolean-value",
+}
+XPATH_SPANNED = (
+    "table:table-cell[@table:number-columns-spanned or @table:number-rows-spanned]"
+)
+
+# path of the .ods file, its content, or a binary file object to read
+InputSource = Union[Path, str, bytes, bytearray, BinaryIO]  # noqa: UP007
+# path of the JSON file, or a text or binary file object to write
+OutputTarget = Union[Path, str, TextIO, BinaryIO]  # noqa: UP007
+
+
+class ParseCancelled(Exception):
+    """The parsing was stopped by its cancel event."""
+
+
+def as_source(source: InputSource) -> Path | str | BinaryIO:
+    """Return the path of the .ods file, or a seekable binary file object of
+    its content.
+
+    A seekable file object is used as is, the members of the archive being
+    read on demand, the content of other file objects is read in a BytesIO.
+
+    Args:
+        source (str or Path or bytes or file object): Path of the .ods file,
+            its content, or a binary file object to read, like sys.stdin.buffer.
+    """
+    if isinstance(source, (str, Path, BytesIO)):
+        return source
+    if isinstance(source, (bytes, bytearray)):
+        return BytesIO(source)
+    if source.seekable():
+        return source
+    return BytesIO(source.read())
+
+
+def writes_in_place(path: Path) -> bool:
+    """Return True if the output path is a link or a special file, like a
+    device or a pipe, which is opened and written in place."""
+    return path.is_symlink() or (path.exists() and not path.is_file())
+
+
+@contextmanager
+def open_in_place(path: Path) -> Iterator[TextIO]:
+    """Open the path for writing as text, in UTF-8."""
+    with path.open("w", encoding="utf8") as output:
+        yield output
+
+
+@contextmanager
+def replaced_file(path: Path) -> Iterator[TextIO]:
+    """Open a temporary file of the directory of the path for writing as
+    text, in UTF-8, moved to the path once fully written.
+
+    If the temporary file can not be created, the path is written in place.
+    """
+    temporary = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    try:
+        # the mode of the new file follows the umask, like open()
+        handle = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except PermissionError:
+        with open_in_place(path) as output:
+            yield output
+        return
+    try:
+        with os.fdopen(handle, "w", encoding="utf8") as output:
+            yield output
+        if path.exists():
+            shutil.copymode(path, temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def open_output(target: OutputTarget) -> Iterator[TextIO]:
+    """Open the JSON output for writing as text, in UTF-8.
+
+    A regular file is written in a temporary file of the same directory,
+    replacing the file only once fully written: a failed parsing leaves the
+    previous file unchanged. A link or a special file, like /dev/null or a
+    pipe, is written in place.
+
+    Args:
+        target (str or Path or file object): Path of the file, or a text or
+            binary file object, which is not closed.
+    """
+    if isinstance(target, (str, Path)):
+        path = Path(target)
+        opener = open_in_place if writes_in_place(path) else replaced_file
+        with opener(path) as file:
+            yield file
+    elif isinstance(target, (RawIOBase, BufferedIOBase)) or "b" in getattr(
+        target, "mode", ""
+    ):
+        output = TextIOWrapper(cast(BinaryIO, target), encoding="utf8")
+        try:
+            yield output
+        finally:
+            output.flush()
+            output.detach()
+    else:
+        yield target  # type: ignore[misc]
+
+
+def copy_entry(entry: Path, target: OutputTarget) -> None:
+    """Copy the JSON file of a cache entry to the output, like a parsing."""
+    with open_output(target) as output, entry.open(encoding="utf8") as cached:
+        shutil.copyfileobj(cached, output)
+
+
+def style_closure(
+    names: Iterable[str], index: Mapping[str, tuple[Any, list[str]]]
+) -> dict[str, None]:
+    """Return the names of the styles of the index and of the styles they
+    depend on, in order of first use.
+
+    Args:
+        names (iterable of str): Names of the used styles.
+        index (dict): name of style -> (style, names of its dependencies).
+    """
+    closure: dict[str, None] = {}
+    pending = list(reversed(list(names)))
+    while pending:
+        name = pending.pop()
+        if name in closure or name not in index:
+            continue
+        closure[name] = None
+        pending.extend(reversed(index[name][1]))
+    return closure
 
 
 class ODSParsator:
@@ -53,6 +228,14 @@ class ODSParsator:
         colors: bool = False,
         keep_styled: bool = False,
         see_hidden: bool = False,
+        streaming: bool = False,
+        sheets: Iterable[int | str] | None = None,
+        cell_range: CellRange | dict[int | str, CellRange] | None = None,
+        workers: int = 1,
+        keep_repeated: bool = False,
+        stats: ParseStats | None = None,
+        cancel: Event | None = None,
+        raw_values: bool = False,
     ) -> None:
         """Class in charge of parsing the .ods document..
 
@@ -61,22 +244,68 @@ class ODSParsator:
 
         Args:
             Boolean options
+            sheets (list of int or str): Positions or names of the sheets to
+                parse, default to all sheets.
+            cell_range (str or tuple or dict): Range of cells to parse, like
+                "A1:H500", for all sheets or in a dict by sheet position or
+                name. The sheet is parsed as if it only contained the range.
+            workers (int): Number of processes parsing the sheets in parallel,
+                each process reading the tables as a stream.
+            keep_repeated (bool): Keep the repeated rows and cells as one item
+                with a "repeat" count, instead of expanding them.
+            stats (ParseStats): Record the timing and counters of the parsing,
+                default to None, no measure.
+            cancel (threading.Event): Stop the parsing by raising
+                ParseCancelled once the event is set, checked at each row.
+            raw_values (bool): Keep the cell values unconverted, as
+                (value type, raw string) pairs, see raw_value().
         """
         self.doc: Document = Document("ods")
         self.body: Element = []
         self.styles: list = []
         self.col_widths: dict = {}
         self.export_full: bool = not export_minimal
+        self.stats = stats
+        self.cancel = cancel
         self.use_decimal: bool = use_decimal
         self.all_styles: bool = all_styles
         self.colors: bool = colors
         self.keep_styled: bool = keep_styled
         self.see_hidden: bool = see_hidden
+        self.streaming: bool = streaming
+        self.sheets: list[int | str] | None = None if sheets is None else list(sheets)
+        self.cell_range = cell_range
+        self.workers: int = max(1, workers)
+        self.keep_repeated: bool = keep_repeated
+        self.raw_values: bool = raw_values
+        self._windows: Window | dict[int | str, Window] | None = None
+        if isinstance(cell_range, dict):
+            self._windows = {
+                sheet: parse_range(value) for sheet, value in cell_range.items()
+            }
+        elif cell_range is not None:
+            self._windows = parse_range(cell_range)
         self._current_table: Table = Table("none")
-        self._doc_style_cache: dict[tuple[str, str], dict[str, Any]] = {}
-        self._current_table_column_cache: dict[int, str] = {}
-        self._styles_elements: dict[str, Element] = {}
-        self._used_styles: set[str] = set()
+        self._current_window: Window | None = None
+        # background colors of the table-cell and table-row styles
+        self._cell_bgcolors: dict[str, str] = {}
+        self._row_bgcolors: dict[str, str] = {}
+        # default background colors of the columns of the current table
+        self._column_bgcolors: list[str] | None = None
+        self._style_index: dict[str, tuple[Element, list[str]]] | None = None
+        # names of the styles used by the parsed rows, in order of appearance
+        self._used_style_names: dict[str, None] = {}
+        self._remaining_sheets: set[int | str] | None = None
+        self._document_data: bytes | None = None
+        # result of the last parse_incremental()
+        self.snapshot: dict[str, Any] = {}
+        self.reparsed: list[str] = []
+
+    def _phase(self, name: str) -> AbstractContextManager[Any]:
+        """Context manager measuring a phase if stats are recorded."""
+        if self.stats is None:
+            return nullcontext()
+        return self.stats.phase(name)
 
     def collect_col_widths(self) -> None:
         """Collect all columns widths from styles."""
@@ -90,109 +319,230 @@ class ODSParsator:
             except (KeyError, TypeError):
                 pass
 
+    @staticmethod
+    def style_definition(style: Element) -> str:
+        """XML definition of the style, without its name.
+
+        Args:
+            style (odfdo.Element): Style element, not modified.
+        """
+        style = style.clone
+        style.set_attribute("style:name", None)
+        definition: str = style.serialize(pretty=True)
+        return definition
+
     def collect_all_styles(self) -> None:
         """Store all automatic styles of the document.
 
         Styles are a list of dict: Name and definition of styles.
         """
-        self.styles = []
-        for style in self.doc.get_styles(automatic=True):
-            name = style.name
-            if name:
-                style.set_attribute("style:name", None)
-                self.styles.append(
-                    {
-                        NAME: name,
-                        DEFINITION: style.serialize(pretty=True),
-                    }
-                )
+        self.styles = [
+            {NAME: name, DEFINITION: self.style_definition(style)}
+            for name, (style, _depends) in self.style_index().items()
+        ]
 
-    def store_style_name(self, name: str | None) -> None:
-        if not name:
-            return
-        if name not in self._used_styles and name in self._styles_elements:
-            style = self._styles_elements[name]
-            self._used_styles.add(name)
-            # add style dependacies
-            for key, value in style.attributes.items():
-                if key.endswith("style-name"):
-                    self.store_style_name(value)
-
-    def keep_style(self, item: Any) -> None:
-        if isinstance(item, dict):
-            self.store_style_name(item.get(STYLE))
+    def style_index(self) -> dict[str, tuple[Element, list[str]]]:
+        """Index of the automatic styles of the document, built once.
+
+        Returns:
+            dict: name of style -> (style element, names of the styles it
+                depends on).
+        """
+        if self._style_index is None:
+            self._style_index = {}
+            for style in self.doc.get_styles(automatic=True):
+                name = style.name
+                if name:
+                    depends = [
+                        value
+                        for key, value in style.attributes.items()
+                        if key.endswith("style-name") and value
+                    ]
+                    self._style_index[name] = (style, depends)
+        return self._style_index
 
     def collect_used_styles(self) -> None:
-        """Store used automatic styles of the document.
+        """Store used automatic styles of the document and their
+        dependencies, from the style names recorded while parsing the tables.
 
         Styles are a list of dict: Name and definition of styles.
         """
+        index = self.style_index()
+        self.styles = [
+            {NAME: name, DEFINITION: self.style_definition(index[name][0])}
+            for name in style_closure(self._used_style_names, index)
+        ]
 
-        self._styles_elements = {}
-        self._used_styles = set()
-
-        self.collect_all_styles()
-        for style in self.styles:
-            name = style.get(NAME)
-            definition = style.get(DEFINITION)
-            style = Element.from_tag(definition)
-            self._styles_elements[name] = style
-        for table in self.body:
-            self.keep_style(table)
-            for row in table[TABLE]:
-                if isinstance(row, dict):
-                    self.keep_style(row)
-                    cells = row[ROW]
-                else:
-                    cells = row
-                for cell in cells:
-                    self.keep_style(cell)
-        self.styles = []
-        for name in self._used_styles:
-            style = self._styles_elements[name]
-            if style.name:
-                style.set_attribute("style:name", None)
-            self.styles.append(
-                {
-                    NAME: name,
-                    DEFINITION: style.serialize(pretty=True),
-                }
-            )
-
-    def parse_document(self, document_path: Path | str) -> None:
+    def parse_document(self, document_path: InputSource) -> None:
         """Parse the input .ods file..
 
         The result is available in self.content or self.content_json.
 
         Args:
-            path (ODF path): Input .ods file.
+            document_path (str or Path or bytes or file object): Input .ods
+                file, see as_source().
         """
         self.load_document(document_path)
         self.parse()
 
-    def load_document(self, document_path: Path | str) -> None:
-        """Load the ODF file and checks its type."""
-        self.doc = Document(document_path)
-        if not self.is_spreadsheet():
-            raise ValueError("Input file must be a .ods file.")
+    def load_document(self, document_path: InputSource) -> None:
+        """Load the ODF file, or its content, and checks its type."""
+        with self._phase("load"):
+            source = as_source(document_path)
+            if isinstance(source, (str, Path)):
+                self.doc = Document(Path(source))
+            else:
+                self.doc = load_archive(source)
+            self._style_index = None
+            if not self.is_spreadsheet():
+                raise ValueError("Input file must be a .ods file.")
+            # archive given to the worker processes, the document having no path
+            self._document_data = None
+            if self.workers > 1 and isinstance(self.doc.container, ArchiveContainer):
+                self._document_data = self.doc.container.slim_archive(
+                    needed_parts(not self.export_full, self.colors)
+                )
+            if self.streaming or self.workers > 1:
+                load_content_styles(self.doc)
+            else:
+                self.doc.body  # noqa: B018, parse content.xml in this phase
+        if self.colors:
+            self.collect_bgcolors()
 
     def parse(self) -> None:
         """Parse the .ods content."""
-        self.collect_col_widths()
+        with self._phase("styles"):
+            self.collect_col_widths()
         self.collect_tables()
-        if self.export_full:
+        self.collect_styles()
+
+    def collect_styles(self) -> None:
+        """Store the styles of the content, all or only the used ones."""
+        if not self.export_full:
+            return
+        with self._phase("styles"):
             if self.all_styles:
                 self.collect_all_styles()
             else:
                 self.collect_used_styles()
 
+    def table_fingerprints(self) -> list[tuple[Table, str]]:
+        """Return the fingerprint of each table of the document, changed
+        when the table, its position or the styles it uses are changed.
+
+        Returns:
+            list: (table without rows and columns, SHA-256 digest of the
+                position, the XML of the table and the definitions of its
+                styles).
+        """
+        index: dict[str, tuple[str, list[str]]] = {}
+        for style in self.doc.get_styles():
+            name = style.name
+            if not name:
+                continue
+            definition, depends = index.get(name, ("", []))
+            depends = depends + [
+                value
+                for key, value in style.attributes.items()
+                if key.endswith("style-name") and value
+            ]
+            index[name] = (definition + style.serialize(), depends)
+        fingerprints = []
+        for position, (table, digest, names) in enumerate(table_digests(self.doc)):
+            fingerprint = hashlib.sha256(f"{position}:{digest}".encode())
+            for name in sorted(style_closure(names, index)):
+                fingerprint.update(f"{name}:{index[name][0]}".encode())
+            fingerprints.append((table, fingerprint.hexdigest()))
+        return fingerprints
+
+    def parse_incremental(self, previous: dict[str, Any] | None = None) -> list[str]:
+        """Parse the .ods content, reusing the tables of a previous parsing
+        when their fingerprint did not change, see table_fingerprints().
+
+        The new self.snapshot can be used as previous parsing of the next
+        call.
+
+        Args:
+            previous (dict): self.snapshot of a previous parsing with the same
+                options, or None.
+
+        Returns:
+            list: names of the parsed tables, the other ones are reused.
+        """
+        options = self.cache_options()
+        options["version"] = __version__
+        reusable: dict[str, Any] = {}
+        if previous and previous.get(OPTIONS) == options:
+            reusable = previous[SHEETS]
+        self._remaining_sheets = None if self.sheets is None else set(self.sheets)
+        wanted = [
+            (position, fingerprint)
+            for position, (table, fingerprint) in enumerate(self.table_fingerprints())
+            if self.is_wanted_table(table, position)
+        ]
+        changed = [
+            position for position, fingerprint in wanted if fingerprint not in reusable
+        ]
+        parsed = iter(self.collect_sheets(changed))
+        sheets = {}
+        self.reparsed = []
+        for position, fingerprint in wanted:
+            if position in changed:
+                sheet = next(parsed)
+                self.reparsed.append(sheet[RECORD][NAME])
+            else:
+                sheet = reusable[fingerprint]
+            sheets[fingerprint] = sheet
+        self.snapshot = {OPTIONS: options, SHEETS: sheets}
+        self.body = [sheet[RECORD] for sheet in sheets.values()]
+        self._used_style_names = {}
+        for sheet in sheets.values():
+            self._used_style_names.update(dict.fromkeys(sheet[STYLES]))
+        self.collect_styles()
+        return self.reparsed
+
+    def collect_sheets(self, positions: list[int]) -> list[dict[str, Any]]:
+        """Parse the tables at the given positions.
+
+        Args:
+            positions (list of int): Positions of the tables in the document.
+
+        Returns:
+            list: for each table, dict {"record": record of the table,
+                "styles": names of the styles used by the table}.
+        """
+        if not positions:
+            return []
+        with self._phase("styles"):
+            self.collect_col_widths()
+        sheets = self.sheets
+        self.sheets = list(positions)
+        result: list[dict[str, Any]] = []
+        record: dict[str, Any] = {}
+        try:
+            for event, item in self.iter_tables():
+                if event == TABLE_START:
+                    self._used_style_names = {}
+                    record = {NAME: item, TABLE: []}
+                elif event == STREAM_ROW:
+                    record[TABLE].append(item)
+                else:
+                    if item is not None:
+                        record[WIDTH] = item
+                    styles = list(self._used_style_names)
+                    result.append({RECORD: record, STYLES: styles})
+        finally:
+            self.sheets = sheets
+        return result
+
     def is_hidden_table(self, table: Table) -> bool:
         if self.see_hidden:
             return False  # parse also hidden sheets
         style_name = table.style
         if not style_name:
             return False
-        style = self.doc.get_style("table", style_name)
+        # the table styles are automatic styles of content.xml
+        style = self.doc.content.get_style("table", style_name)
         if not style:
             return False
         display = str(style.get_properties().get("table:display"))
@@ -203,11 +553,314 @@ class ODSParsator:
     def collect_tables(self) -> None:
         """Retrieve all tables of the input document."""
         self.body = []
-        for table in self.doc.body.get_tables():
-            if self.is_hidden_table(table):
-                continue
-            self.initialize_table(table)
-            self.parse_table(table)
+        record: dict[str, Any] = {}
+        for event, item in self.iter_tables():
+            if event == TABLE_START:
+                record = {NAME: item, TABLE: []}
+            elif event == STREAM_ROW:
+                record[TABLE].append(item)
+            else:
+                if item is not None:
+                    record[WIDTH] = item
+                self.body.append(record)
+
+    def iter_tables(
+        self, parse_rows: Callable[[Row, int], Iterable[Any]] | None = None
+    ) -> Iterator[tuple[str, Any]]:
+        """Parse the wanted tables of the input document, one row at a time.
+
+        Args:
+            parse_rows (callable): Function converting each odfdo Row and its
+                number of repetitions, default to self.parse_rows(). The
+                workers option is only used with the default function.
+
+        Yields:
+            tuple: (TABLE_START, name of the table), (ROW, content of one row)
+                and (TABLE_END, columns widths, or None if export_minimal).
+        """
+        self._remaining_sheets = None if self.sheets is None else set(self.sheets)
+        self._used_style_names = {}
+        if self.workers > 1 and parse_rows is None:
+            events = self.iter_parallel_tables()
+        elif self.streaming or self.workers > 1:
+            events = self.iter_stream_tables(parse_rows or self.parse_rows)
+        else:
+            events = self.iter_dom_tables(parse_rows or self.parse_rows)
+        if self.cancel is not None:
+            events = self.iter_cancellable_tables(events, self.cancel)
+        if self.stats is None:
+            yield from events
+        else:
+            yield from self.iter_measured_tables(events, parse_rows is None)
+
+    @staticmethod
+    def iter_cancellable_tables(
+        events: Iterator[tuple[str, Any]], cancel: Event
+    ) -> Iterator[tuple[str, Any]]:
+        """Raise ParseCancelled before the next event of iter_tables() once
+        the cancel event is set."""
+        for event in events:
+            if cancel.is_set():
+                raise ParseCancelled("Parsing cancelled")
+            yield event
+
+    def iter_measured_tables(
+        self, events: Iterator[tuple[str, Any]], count_rows: bool = True
+    ) -> Iterator[tuple[str, Any]]:
+        """Record the timing and counters of the events of iter_tables() in
+        self.stats.
+
+        The time spent in the parsing, out of the geometry phase, is added to
+        the rows phase. The time spent by the consumer of the events counts
+        only for the time of the sheets.
+
+        Args:
+            events (iterator): Events of iter_tables().
+            count_rows (bool): Count the rows and cells, for the default
+                parse_rows() function.
+        """
+        stats = self.stats
+        if stats is None:
+            yield from events
+            return
+        geometry = stats.phases["geometry"]
+        elapsed = 0.0
+        start = perf_counter()
+        for event, item in events:
+            elapsed += perf_counter() - start
+            if event == TABLE_START:
+                stats.start_sheet(item)
+            elif event == STREAM_ROW:
+                if count_rows:
+                    self.count_row(stats, item)
+            else:
+                stats.end_sheet()
+            yield event, item
+            start = perf_counter()
+        elapsed += perf_counter() - start
+        stats.add_time("rows", elapsed - (stats.phases["geometry"] - geometry))
+
+    def count_row(self, stats: ParseStats, row: list | dict) -> None:
+        """Count the row and its cells in the stats.
+
+        Args:
+            stats (ParseStats): Stats of the parsing.
+            row (list or dict): Python content of the row.
+        """
+        repeat = 1
+        cells = row
+        if isinstance(row, dict):
+            repeat = row.get(REPEAT, 1)
+            cells = row[ROW]
+        width = 0
+        for cell in cells:
+            if isinstance(cell, dict):
+                number = cell.get(REPEAT, 1)
+                self.count_cell(stats, cell, number * repeat)
+                width += number
+            else:
+                width += 1
+        stats.count_sheet_row(repeat, width * repeat)
+
+    def count_cell(self, stats: ParseStats, cell: dict, number: int) -> None:
+        """Count the styles, spans and formulas of the cell in the stats.
+
+        Args:
+            stats (ParseStats): Stats of the parsing.
+            cell (dict): Python content of the cell.
+            number (int): Number of repetitions of the cell.
+        """
+        if style := cell.get(STYLE):
+            stats.count("styled_cells", number)
+            if BGCOLOR in cell:
+                if style in self._cell_bgcolors:
+                    stats.count("style_cache_hits", number)
+                else:
+                    stats.count("style_cache_misses", number)
+        if COLSPAN in cell:
+            stats.count("spans", number)
+        if FORMULA in cell:
+            stats.count("formulas", number)
+
+    def iter_dom_tables(
+        self, parse_rows: Callable[[Row, int], Iterable[Any]]
+    ) -> Iterator[tuple[str, Any]]:
+        """Parse the tables of the odfdo Document, see iter_tables()."""
+        for position, table in enumerate(self.doc.body.get_tables()):
+            if self.is_wanted_table(table, position):
+                window = self.table_window(table, position)
+                if window is not None:
+                    table = crop_table(table, window)
+                self._current_window = window
+                self.initialize_table(table)
+                yield TABLE_START, table.name
+                for row in table.get_elements(XPATH_ROWS):
+                    for item in parse_rows(row, row.repeated or 1):
+                        yield STREAM_ROW, item
+                yield TABLE_END, self.columns_width(table) if self.export_full else None
+            if self.all_sheets_found():
+                break
+
+    def iter_stream_tables(
+        self, parse_rows: Callable[[Row, int], Iterable[Any]]
+    ) -> Iterator[tuple[str, Any]]:
+        """Parse the tables reading the content.xml part as a stream of rows,
+        see iter_tables()."""
+        stream = ContentStream(
+            self.doc,
+            keep_styled=self.keep_styled,
+            accept=self.is_wanted_table,
+            window=self.table_window,
+        )
+        for event, item, count in stream:
+            if event == TABLE_START:
+                self._column_bgcolors = None
+                self._current_table = item
+                self._current_window = stream.current_window
+                yield TABLE_START, item.name
+            elif event == STREAM_ROW:
+                for row in parse_rows(item, count):
+                    yield STREAM_ROW, row
+            else:
+                width = self.columns_width(item, count) if self.export_full else None
+                yield TABLE_END, width
+                if self.all_sheets_found():
+                    break
+
+    def iter_parallel_tables(self) -> Iterator[tuple[str, Any]]:
+        """Parse the tables, each table being parsed by a worker process, see
+        iter_tables().
+
+        The tables keep the order of the document, so the result is the same
+        as the one of a serial parsing.
+        """
+        positions = [
+            position
+            for position, table in enumerate(table_shells(self.doc))
+            if self.is_wanted_table(table, position)
+        ]
+        if not positions:
+            return
+        options = {
+            "export_minimal": not self.export_full,
+            "use_decimal": self.use_decimal,
+            "colors": self.colors,
+            "keep_styled": self.keep_styled,
+            "see_hidden": self.see_hidden,
+            "cell_range": self.cell_range,
+            "keep_repeated": self.keep_repeated,
+            "raw_values": self.raw_values,
+        }
+        from concurrent.futures import ProcessPoolExecutor  # only with workers
+
+        source = self.doc.container.path or self._document_data
+        with ProcessPoolExecutor(min(self.workers, len(positions))) as executor:
+            for records, style_names in executor.map(
+                parse_sheet, repeat(source), positions, repeat(options)
+            ):
+                for record in records:
+                    yield TABLE_START, record[NAME]
+                    for row in record[TABLE]:
+                        yield STREAM_ROW, row
+                    self._used_style_names.update(dict.fromkeys(style_names))
+                    yield TABLE_END, record.get(WIDTH)
+
+    @staticmethod
+    def is_selected_table(table: Table, position: int, sheet: int | str) -> bool:
+        """Check if the table is the required sheet.
+
+        Args:
+            table (odfdo.Table): Table object.
+            position (int): Position of the table in the document.
+            sheet (int or str): Position or name of the required sheet.
+        """
+        if isinstance(sheet, int):
+            return position == sheet
+        return bool(table.name == sheet)
+
+    def is_wanted_table(self, table: Table, position: int) -> bool:
+        """Check if the table is to be parsed: selected by the sheets option
+        and not hidden.
+
+        Args:
+            table (odfdo.Table): Table object.
+            position (int): Position of the table in the document.
+        """
+        if self._remaining_sheets is not None:
+            found = {
+                sheet
+                for sheet in self._remaining_sheets
+                if self.is_selected_table(table, position, sheet)
+            }
+            if not found:
+                return False
+            self._remaining_sheets -= found
+        return not self.is_hidden_table(table)
+
+    def table_window(self, table: Table, position: int) -> Window | None:
+        """Return the window of cells to parse for the table, from the
+        cell_range option, or None to parse the whole table.
+
+        Args:
+            table (odfdo.Table): Table object.
+            position (int): Position of the table in the document.
+        """
+        if isinstance(self._windows, dict):
+            for sheet, window in self._windows.items():
+                if self.is_selected_table(table, position, sheet):
+                    return window
+            return None
+        return self._windows
+
+    def all_sheets_found(self) -> bool:
+        """Check if all the sheets selected by the sheets option are found."""
+        return self._remaining_sheets is not None and not self._remaining_sheets
+
+    def iter_rows(self, sheet: int | str = 0) -> Iterator[Any]:
+        """Yield the rows of one table of the loaded document, one at a time.
+
+        With the streaming option, the rows are parsed while reading the
+        content.xml part. A hidden table yields no row, except if the
+        see_hidden option is set.
+
+        Args:
+            sheet (int or str): Position of the table in the document, or name.
+
+        Yields:
+            list or dict: Python content of the row, see parse_row().
+        """
+        if self.streaming or self.workers > 1:
+            yield from self._iter_stream_rows(sheet)
+            return
+        for position, table in enumerate(self.doc.body.get_tables()):
+            if self.is_selected_table(table, position, sheet):
+                if not self.is_hidden_table(table):
+                    window = self.table_window(table, position)
+                    if window is not None:
+                        table = crop_table(table, window)
+                    self.initialize_table(table)
+                    yield from (self.parse_row(row) for row in table.traverse())
+                return
+
+    def _iter_stream_rows(self, sheet: int | str) -> Iterator[Any]:
+        stream = ContentStream(
+            self.doc,
+            keep_styled=self.keep_styled,
+            accept=lambda table, position: (
+                self.is_selected_table(table, position, sheet)
+                and not self.is_hidden_table(table)
+            ),
+            window=self.table_window,
+        )
+        for event, item, count in stream:
+            if event == TABLE_START:
+                self._column_bgcolors = None
+                self._current_table = item
+            elif event == TABLE_END:
+                return
+            else:
+                for _ in range(count):
+                    yield self.parse_row(item)
 
     def initialize_table(self, table: Table) -> None:
         """Shrink table keeping empty calls or strongly strip
@@ -216,12 +869,14 @@ class ODSParsator:
         Args:
             table (odfdo.Table): Table object.
         """
-        self._current_table_column_cache = {}
+        self._column_bgcolors = None
         self._current_table = table  # for default bgcolor
-        if self.keep_styled:
-            table.optimize_width()
-        else:
-            table.rstrip(aggressive=True)
+        # a table cropped to a range of cells may have no row
+        with self._phase("geometry"):
+            if self.keep_styled and table.height:
+                table.optimize_width()
+            else:
+                table.rstrip(aggressive=True)
 
     def parse_table(self, table: Table) -> None:
         """Parse one table content.
@@ -235,18 +890,19 @@ class ODSParsator:
             record[WIDTH] = self.columns_width(table)
         self.body.append(record)
 
-    def columns_width(self, table: Table) -> list[str]:
+    def columns_width(self, table: Table, max_columns: int | None = None) -> list[str]:
         """Retrieve the table columsn widths.
 
         Args:
             table (odfdo.Table): Table object.
+            max_columns (int or None): Maximum number of columns to read.
 
         Returns:
             list: List of widths.
         """
         # parse "table-column" styles, keep only the width component
         widths: list[str] = []
-        for col in table.get_columns():
+        for col in islice(table.traverse_columns(), max_columns):
             style_name = col.style
             width = self.col_widths.get(style_name)
             if not width:
@@ -267,23 +923,126 @@ class ODSParsator:
         value_type = cell.get_attribute("office:value-type")
         if value_type == "boolean":
             return cell.get_attribute("office:boolean-value")
-        if value_type in {"float", "percentage", "currency"}:
-            value = Decimal(cell.get_attribute("office:value"))
-            if int(value) == value:
-                return int(value)
-            return float(value)
+        if value_type in NUMERIC_TYPES:
+            return number(cell.get_attribute_string("office:value"))
         if value_type == "date":
             return cell.get_attribute("office:date-value")
         if value_type == "time":
             return cell.get_attribute("office:time-value")
         if value_type == "string":
-            value = cell.get_attribute("office:string-value")
-            if value is not None:
-                return value
-            value_list = [para.text_recursive for para in cell.get_elements("text:p")]
-            return "\n".join(value_list)
+            return ODSParsator.cell_text(cell)
+        return None
+
+    @staticmethod
+    def cell_text(cell: Cell) -> Any:
+        """Return the text of a string cell: its office:string-value, or the
+        lines of its paragraphs.
+
+        Args:
+            cell (odfdo.Cell): The ODF cell.
+        """
+        value = cell.get_attribute("office:string-value")
+        if value is not None:
+            return value
+        value_list = [para.text_recursive for para in cell.get_elements("text:p")]
+        return "\n".join(value_list)
+
+    @staticmethod
+    def raw_value(cell: Cell) -> tuple[str, str] | None:
+        """Return the value of the cell unconverted, as a (value type, raw
+        string) pair, like ("float", "2.50") or ("date", "2025-01-31").
+
+        The raw string is the office:*-value attribute of the value type, the
+        text for a string cell.
+
+        Args:
+            cell (odfdo.Cell): The ODF cell.
+
+        Returns:
+            tuple or None: (value type, raw string), None for an empty cell.
+        """
+        value_type = cell.get_attribute_string("office:value-type")
+        if value_type in RAW_ATTRIBUTES:
+            raw = cell.get_attribute_string(RAW_ATTRIBUTES[value_type])
+            return value_type, raw or ""
+        if value_type == "string":
+            return value_type, str(ODSParsator.cell_text(cell))
         return None
 
+    def parse_rows(self, row: Row, repeated: int) -> Iterator[list | dict]:
+        """Parse the row content, repeated times, or once with a repeat count
+        if the keep_repeated option is set.
+
+        Args:
+            row (odfdo.Row): Row object.
+            repeated (int): Number of repetitions of the row.
+
+        Yields:
+            list or dict: Python content of the row.
+        """
+        if self.keep_repeated:
+            yield self.parse_repeated_row(row, repeated)
+            return
+        for _ in range(repeated):
+            yield self.parse_row(row)
+
+    def parse_repeated_row(self, row: Row, repeated: int = 1) -> list | dict:
+        """Parse the row content, keeping the repeated cells as one item.
+
+        A row or a cell repeated more than once is a dict with a "repeat" key,
+        like {"row": [...], "repeat": 3} or {"value": 0, "repeat": 10}.
+
+        Args:
+            row (odfdo.Row): Row object.
+            repeated (int): Number of repetitions of the row.
+
+        Returns:
+            list or dict: Python content of the row.
+        """
+        cells = []
+        x = 0
+        row_color = self.row_bgcolor(row) if self.colors else None
+        for cell in row.get_elements(XPATH_CELLS):
+            for count in self._bgcolor_runs(row_color, cell, x):
+                cell.x = x
+                content = self.parse_cell(cell)
+                if self.colors:
+                    content[BGCOLOR] = self._bgcolor(cell, row_color)
+                if count > 1:
+                    if not isinstance(content, dict):
+                        content = {VALUE: content}
+                    content[REPEAT] = count
+                cells.append(content)
+                x += count
+        record: dict[str, Any] = {ROW: cells}
+        if row.style and self.export_full:
+            record[STYLE] = row.style
+            self._used_style_names[row.style] = None
+        elif repeated <= 1:
+            return cells
+        if repeated > 1:
+            record[REPEAT] = repeated
+        return record
+
+    def _bgcolor_runs(self, row_color: str | None, cell: Cell, x: int) -> list[int]:
+        """Split the repeated cell in runs of cells of same background color,
+        that may depend on the style of the columns."""
+        repeated = cell.repeated or 1
+        if not self.colors or repeated == 1 or cell.style:
+            return [repeated]
+        if row_color is not None:
+            return [repeated]
+        runs: list[int] = []
+        previous = None
+        for column in range(x, x + repeated):
+            color = self._column_bgcolor(column)
+            if color == previous:
+                runs[-1] += 1
+            else:
+                runs.append(1)
+                previous = color
+        return runs
+
     def parse_row(self, row: Row) -> list | dict:
         """Parse the row content.
 
@@ -293,15 +1052,64 @@ class ODSParsator:
         Returns:
             list or dict: Python content of the row.
         """
+        if self.values_only:
+            return self.parse_row_values(row)
         style = row.style
         if self.colors:
-            cells = [self.parse_cell_color(row, cell) for cell in row.traverse()]
+            row_color = self.row_bgcolor(row)
+            cells = [self._parse_cell_color(cell, row_color) for cell in row.traverse()]
         else:
             cells = [self.parse_cell(cell) for cell in row.traverse()]
         if style and self.export_full:
+            self._used_style_names[style] = None
             return {ROW: cells, STYLE: style}
         return cells
 
+    @property
+    def values_only(self) -> bool:
+        """The cells are parsed as bare values: minimal mode without colors."""
+        return not (self.export_full or self.colors)
+
+    def parse_row_values(self, row: Row) -> list:
+        """Parse the values of the row, in minimal mode without colors.
+
+        The cell elements are read in place, without the copy of each cell
+        made by Row.traverse(), and only their value attributes are read. The
+        spans are only looked for in the rows having spanned cells.
+
+        Args:
+            row (odfdo.Row): Row object.
+
+        Returns:
+            list: Python content of the row.
+        """
+        convert = self.parse_cell if row.get_elements(XPATH_SPANNED) else self.value
+        cells: list = []
+        for cell in row.get_elements(XPATH_CELLS):
+            content = convert(cell)
+            repeated = cell.repeated or 1
+            if repeated == 1:
+                cells.append(content)
+            elif isinstance(content, dict):
+                cells.extend(dict(content) for _ in range(repeated))
+            else:
+                cells.extend([content] * repeated)
+        return cells
+
+    def value(self, cell: Cell) -> Any:
+        """Return the value of the cell, as Decimal with the use_decimal
+        option, or as a (value type, raw string) pair with the raw_values
+        option.
+
+        Args:
+            cell (odfdo.Cell): Cell object.
+        """
+        if self.raw_values:
+            return self.raw_value(cell)
+        if self.use_decimal:
+            return cell.get_value()
+        return self.json_convert(cell)
+
     def parse_cell(self, cell: Cell) -> Any:
         """Parse the cell content.
 
@@ -311,10 +1119,7 @@ class ODSParsator:
         Returns:
             value or dict: Python content of the cell.
         """
-        if self.use_decimal:
-            value = cell.get_value()
-        else:
-            value = self.json_convert(cell)
+        value = self.value(cell)
         spanned = self.spanned(cell)
         if self.export_full:
             style = cell.style
@@ -327,6 +1132,7 @@ class ODSParsator:
         record = {VALUE: value}
         if style:
             record[STYLE] = style
+            self._used_style_names[style] = None
         if spanned:
             record.update(spanned)
         if formula:
@@ -343,44 +1149,73 @@ class ODSParsator:
         Returns:
             dict: Python content of the cell.
         """
+        return self._parse_cell_color(cell, self.row_bgcolor(row))
+
+    def _parse_cell_color(self, cell: Cell, row_color: str | None) -> dict[str, Any]:
         record: dict[str, Any] = self.parse_cell(cell)
-        record[BGCOLOR] = self.cell_bgcolor(row, cell)
+        record[BGCOLOR] = self._bgcolor(cell, row_color)
         return record
 
-    def _style_cell_properties(self, family_style: tuple[str, str]) -> dict[str, Any]:
-        if props := self._doc_style_cache.get(family_style):
-            return props
-        props = (
-            self.doc.get_style_properties(
-                family_style[0], family_style[1], "table-cell"
-            )
-            or {}
-        )
-        self._doc_style_cache[family_style] = props
-        return props
+    def _family_bgcolors(self, family: str) -> dict[str, str]:
+        colors: dict[str, str] = {}
+        # the styles of content.xml come first and take precedence
+        for style in reversed(self.doc.get_styles(family=family)):
+            name = style.name
+            if name and (props := style.get_properties(area="table-cell")):
+                colors[name] = str(props.get("fo:background-color", DEFAULT_BGCOLOR))
+        return colors
+
+    def collect_bgcolors(self) -> None:
+        """Resolve once the background color of the table-cell and table-row
+        styles of the document.
+
+        Only the row styles having cell properties are kept, the color of the
+        cells of other rows comes from the columns.
+        """
+        self._cell_bgcolors = self._family_bgcolors("table-cell")
+        self._row_bgcolors = self._family_bgcolors("table-row")
+
+    def table_column_bgcolors(self, table: Table) -> list[str]:
+        """Default background color of the cells of each column of the table.
+
+        Args:
+            table (odfdo.Table): Table object.
+
+        Returns:
+            list: colors of the columns, by position.
+        """
+        colors: list[str] = []
+        for column in table.get_elements(XPATH_COLUMNS):
+            style = column.get_default_cell_style()
+            color = self._cell_bgcolors.get(style, DEFAULT_BGCOLOR)
+            colors.extend([color] * (column.repeated or 1))
+        return colors
 
     def _column_bgcolor(self, column_nb: int) -> str:
-        if color := self._current_table_column_cache.get(column_nb):
-            return color
-        column = self._current_table.get_column(column_nb)
-        if style := column.get_default_cell_style():
-            props = self._style_cell_properties(("table-cell", style))
-            color = props.get("fo:background-color", DEFAULT_BGCOLOR)
-        else:
-            color = DEFAULT_BGCOLOR
-        self._current_table_column_cache[column_nb] = color
-        return color
+        colors = self._column_bgcolors
+        if colors is None:
+            colors = self.table_column_bgcolors(self._current_table)
+            self._column_bgcolors = colors
+        if column_nb < len(colors):
+            return colors[column_nb]
+        return DEFAULT_BGCOLOR
+
+    def row_bgcolor(self, row: Row) -> str | None:
+        """Background color of the cells given by the row style, or None if
+        it comes from the columns."""
+        style = row.style
+        return self._row_bgcolors.get(style) if style else None
 
-    def cell_bgcolor(self, row: Row, cell: Cell) -> str:
-        if cell.style:
-            props = self._style_cell_properties(("table-cell", cell.style))
-            return str(props.get("fo:background-color", DEFAULT_BGCOLOR))
-        if row.style:
-            props = self._style_cell_properties(("table-row", row.style))
-            if props:
-                return str(props.get("fo:background-color", DEFAULT_BGCOLOR))
+    def _bgcolor(self, cell: Cell, row_color: str | None) -> str:
+        if style := cell.style:
+            return self._cell_bgcolors.get(style, DEFAULT_BGCOLOR)
+        if row_color is not None:
+            return row_color
         return self._column_bgcolor(cell.x)
 
+    def cell_bgcolor(self, row: Row, cell: Cell) -> str:
+        return self._bgcolor(cell, self.row_bgcolor(row))
+
     @staticmethod
     def spanned(cell: Cell) -> dict | None:
         """Detect and retrieve the spanned columns and rows of the cell.
@@ -400,6 +1235,27 @@ class ODSParsator:
         """Check the ODF document is a spreadsheet"""
         return bool(self.doc.get_type() == "spreadsheet")
 
+    def cache_options(self) -> dict[str, Any]:
+        """Options changing the result of the parsing, for the keys of the
+        result cache, see odsparsator.cache."""
+        cell_range = self.cell_range
+        if isinstance(cell_range, dict):
+            cell_range = sorted(
+                (repr(sheet), value) for sheet, value in cell_range.items()
+            )
+        return {
+            "export_minimal": not self.export_full,
+            "use_decimal": self.use_decimal,
+            "all_styles": self.all_styles,
+            "colors": self.colors,
+            "keep_styled": self.keep_styled,
+            "see_hidden": self.see_hidden,
+            "sheets": self.sheets,
+            "cell_range": cell_range,
+            "keep_repeated": self.keep_repeated,
+            "raw_values": self.raw_values,
+        }
+
     @property
     def content(self) -> dict[str, Any]:
         """Python dict of the content."""
@@ -410,30 +1266,158 @@ class ODSParsator:
     @property
     def json_content(self) -> str:
         """JSON string of the content."""
-        return json.dumps(self.content, ensure_ascii=False, indent=4, sort_keys=True)
+        with self._phase("json"):
+            return json.dumps(
+                self.content, ensure_ascii=False, indent=4, sort_keys=True
+            )
+
+    def collect_columns(
+        self, header: bool = False, use_numpy: bool = True
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Parse the loaded document in columnar layout, without building the
+        rows.
+
+        See the odsparsator.columnar module for the layout of the columns. The
+        values are the ones of json_convert(). Styles and formulas are not
+        collected.
+
+        Args:
+            header (bool): Use the first row of the tables as column names,
+                else the columns are named by their letters.
+            use_numpy (bool): Return numpy arrays if NumPy is installed.
+
+        Returns:
+            dict: for each table, by name, its columns by name.
+        """
+        tables: dict[str, dict[str, dict[str, Any]]] = {}
+        name = ""
+        columns = TableColumns(self.json_convert, header)
+
+        def add_rows(row: Row, repeated: int) -> list:
+            return columns.add_row(row, repeated)
+
+        for event, item in self.iter_tables(add_rows):
+            if event == TABLE_START:
+                name = item
+                columns = TableColumns(self.json_convert, header)
+            elif event == TABLE_END:
+                first_column = self._current_window[0] if self._current_window else 0
+                tables[name] = columns.result(use_numpy, first_column)
+        return tables
+
+    def write_json(
+        self, output: TextIO, profile: str = PRETTY, ndjson: bool = False
+    ) -> None:
+        """Parse the loaded document and write the JSON content to the output,
+        one row at a time.
+
+        With the default "pretty" profile, the text is the same as
+        json_content, but neither the body nor the text are kept in memory:
+        with the streaming option, the memory used stays close to the size of
+        one row.
+
+        Args:
+            output (TextIO): Text file opened for writing.
+            profile (str): Output profile: "pretty", "compact" (no indentation,
+                no key sorting) or "fast" (compact, using orjson if installed).
+            ndjson (bool): Write JSON Lines, one row per line, see NDJSONWriter.
+        """
+        writer: JSONWriter | NDJSONWriter | TimedWriter
+        if ndjson:
+            writer = NDJSONWriter(output, profile)
+        else:
+            writer = JSONWriter(output, profile)
+        if self.stats is not None:
+            writer = TimedWriter(writer, self.stats)
+        with self._phase("styles"):
+            self.collect_col_widths()
+        writer.start()
+        for event, item in self.iter_tables():
+            if event == TABLE_START:
+                writer.start_table(item)
+            elif event == STREAM_ROW:
+                writer.write_row(item)
+            else:
+                writer.end_table(item)
+        self.collect_styles()
+        writer.end({STYLES: self.styles} if self.export_full else {})
+
+
+def parse_sheet(
+    document_path: Path | str | bytes, position: int, options: dict[str, Any]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Parse one sheet of the .ods file, in a worker process.
+
+    Args:
+        document_path (str or Path or bytes): Path of the .ods file, or its
+            content.
+        position (int): Position of the sheet in the document.
+        options (dict): Options of ODSParsator.
+
+    Returns:
+        tuple: (the record of the table or an empty list, names of the styles
+            used by the table).
+    """
+    parser = ODSParsator(streaming=True, sheets=[position], **options)
+    parser.load_document(document_path)
+    parser.collect_col_widths()
+    parser.collect_tables()
+    records: list[dict[str, Any]] = parser.body
+    return records, list(parser._used_style_names)
 
 
 def ods_to_json(
-    input_path: Path | str,
-    output_path: Path | str,
+    input_path: InputSource,
+    output_path: OutputTarget,
     export_minimal: bool = False,
     all_styles: bool = False,
     colors: bool = False,
     keep_styled: bool = False,
     see_hidden: bool = False,
+    streaming: bool = False,
+    sheets: Iterable[int | str] | None = None,
+    cell_range: CellRange | dict[int | str, CellRange] | None = None,
+    workers: int = 1,
+    profile: str = PRETTY,
+    ndjson: bool = False,
+    keep_repeated: bool = False,
+    cache: CacheOption = None,
+    stats: ParseStats | None = None,
+    cancel: Event | None = None,
+    raw_values: bool = False,
 ) -> None:
     """Parse the input file and save the result in a json file.
 
     The input file must be a .ods ODF file
 
     Args:
-        input_path (str or Path): Path of the .ods file
-        output_path (str or Path or BytesIO): Path of the json output file.
+        input_path (str or Path or bytes or file object): Path of the .ods
+            file, its content, or a binary file object to read.
+        output_path (str or Path or file object): Path of the json output
+            file, or a text or binary file object to write, not closed.
         export_minimal (bool): Export only values, no styles or formula or col width.
         all_styles (bool): Collect all styles from the input.
         colors (bool): Collect background color of cells.
         keep_styled (bool): Keep styled cells with empty value.
         see_hidden (bool): parse also the hidden sheets.
+        streaming (bool): Read the tables as a stream, lower memory usage.
+        sheets (list of int or str): Positions or names of the sheets to parse.
+        cell_range (str or tuple or dict): Range of cells to parse, like "A1:H500".
+        workers (int): Number of processes parsing the sheets in parallel.
+        profile (str): JSON output profile: "pretty", "compact" (no indentation,
+            no key sorting) or "fast" (compact, using orjson if installed).
+        ndjson (bool): Write JSON Lines: one line per row, tagged with the sheet
+            name and the row index, then the columns widths and styles lines.
+        keep_repeated (bool): Keep the repeated rows and cells as one item with
+            a "repeat" count.
+        cache (str or Path or ResultCache): Directory of the result cache,
+            see odsparsator.cache. Default to None, no cache.
+        stats (ParseStats): Record the timing and counters of the parsing,
+            see odsparsator.stats. Default to None, no measure.
+        cancel (threading.Event): Stop the parsing by raising ParseCancelled
+            once the event is set, see odsparsator.aio.
+        raw_values (bool): Keep the cell values unconverted, as (value type,
+            raw string) pairs, see ODSParsator.raw_value().
     """
     parser = ODSParsator(
         export_minimal=export_minimal,
@@ -442,32 +1426,178 @@ def ods_to_json(
         colors=colors,
         keep_styled=keep_styled,
         see_hidden=see_hidden,
+        streaming=streaming,
+        sheets=sheets,
+        cell_range=cell_range,
+        workers=workers,
+        keep_repeated=keep_repeated,
+        stats=stats,
+        cancel=cancel,
+        raw_values=raw_values,
+    )
+    source = as_source(input_path)
+    result_cache = as_cache(cache)
+    key = ""
+    if result_cache is not None:
+        options = parser.cache_options()
+        options.update({"output": "json", "profile": profile, "ndjson": ndjson})
+        key = result_cache.key(source, options, __version__)
+        if entry := result_cache.get(key):
+            copy_entry(entry, output_path)
+            return
+    parser.load_document(source)
+    if isinstance(output_path, (str, Path)) and not writes_in_place(Path(output_path)):
+        with open_output(output_path) as output:
+            parser.write_json(output, profile, ndjson)
+        if result_cache is not None:
+            result_cache.put_file(key, output_path)
+    elif result_cache is None:
+        with open_output(output_path) as output:
+            parser.write_json(output, profile, ndjson)
+    else:
+        # a stream or a special file can not be read back to fill the cache
+        buffer = StringIO()
+        parser.write_json(buffer, profile, ndjson)
+        result_cache.put(key, buffer.getvalue().encode("utf8"))
+        with open_output(output_path) as output:
+            output.write(buffer.getvalue())
+
+
+def ods_to_columns(
+    input_path: InputSource,
+    keep_styled: bool = False,
+    see_hidden: bool = False,
+    streaming: bool = False,
+    sheets: Iterable[int | str] | None = None,
+    cell_range: CellRange | dict[int | str, CellRange] | None = None,
+    header: bool = False,
+    use_numpy: bool = True,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Parse the input file and return the values of the sheets by column.
+
+    The input file must be a .ods ODF file. Each column is a dict {"type",
+    "values", "mask"}, the values being a compact array for the numeric and
+    boolean columns, and the mask flagging the empty cells, see the
+    odsparsator.columnar module.
+
+    Args:
+        input_path (str or Path or bytes or file object): Path of the .ods
+            file, its content, or a binary file object to read.
+        keep_styled (bool): Keep styled cells with empty value.
+        see_hidden (bool): parse also the hidden sheets.
+        streaming (bool): Read the tables as a stream, lower memory usage.
+        sheets (list of int or str): Positions or names of the sheets to parse.
+        cell_range (str or tuple or dict): Range of cells to parse, like "A1:H500".
+        header (bool): Use the first row as column names, else the letters.
+        use_numpy (bool): Return numpy arrays if NumPy is installed.
+
+    Returns:
+        dict: for each sheet, by name, its columns by name.
+    """
+    parser = ODSParsator(
+        export_minimal=True,
+        keep_styled=keep_styled,
+        see_hidden=see_hidden,
+        streaming=streaming,
+        sheets=sheets,
+        cell_range=cell_range,
+    )
+    parser.load_document(input_path)
+    return parser.collect_columns(header, use_numpy)
+
+
+def iter_rows(
+    input_path: InputSource,
+    sheet: int | str = 0,
+    export_minimal: bool = False,
+    use_decimal: bool = False,
+    colors: bool = False,
+    keep_styled: bool = False,
+    see_hidden: bool = False,
+    cell_range: CellRange | None = None,
+    raw_values: bool = False,
+) -> Iterator[Any]:
+    """Parse the input file and yield the rows of one sheet, one at a time.
+
+    The input file must be a .ods ODF file. The content.xml part is read as a
+    stream, so the rows are available before the end of the parsing.
+
+    Args:
+        input_path (str or Path or bytes or file object): Path of the .ods
+            file, its content, or a binary file object to read.
+        sheet (int or str): Position of the sheet in the document, or name.
+        export_minimal (bool): Export only values, no styles or formula.
+        use_decimal (bool): Use Decimal(), DateTime() for the cell values.
+        colors (bool): Collect background color of cells.
+        keep_styled (bool): Keep styled cells with empty value.
+        see_hidden (bool): parse also the hidden sheets.
+        cell_range (str or tuple): Range of cells to parse, like "A1:H500",
+            the reading stops after the last row of the range.
+        raw_values (bool): Keep the cell values unconverted, as (value type,
+            raw string) pairs, see ODSParsator.raw_value().
+
+    Yields:
+        list or dict: content of the row as python structure
+    """
+    parser = ODSParsator(
+        export_minimal=export_minimal,
+        use_decimal=use_decimal,
+        colors=colors,
+        keep_styled=keep_styled,
+        see_hidden=see_hidden,
+        streaming=True,
+        cell_range=cell_range,
+        raw_values=raw_values,
     )
-    parser.parse_document(input_path)
-    Path(output_path).write_text(parser.json_content, encoding="utf8")
+    parser.load_document(input_path)
+    yield from parser.iter_rows(sheet)
 
 
 def ods_to_python(
-    input_path: Path | str,
+    input_path: InputSource,
     export_minimal: bool = False,
     use_decimal: bool = False,
     all_styles: bool = False,
     colors: bool = False,
     keep_styled: bool = False,
     see_hidden: bool = False,
+    streaming: bool = False,
+    sheets: Iterable[int | str] | None = None,
+    cell_range: CellRange | dict[int | str, CellRange] | None = None,
+    workers: int = 1,
+    keep_repeated: bool = False,
+    cache: CacheOption = None,
+    stats: ParseStats | None = None,
+    cancel: Event | None = None,
+    raw_values: bool = False,
 ) -> dict[str, Any] | list[Any]:
     """Parse the input file and return the content as python structure.
 
     The input file must be a .ods ODF file
 
     Args:
-        input_path (str or Path): Path of the .ods file
+        input_path (str or Path or bytes or file object): Path of the .ods
+            file, its content, or a binary file object to read.
         export_minimal (bool): Export only values, no styles or formula or col width.
         use_decimal (bool): Use Decimal(), DateTime() for the cell values.
         all_styles (bool): Collect all styles from the input.
         colors (bool): Collect background color of cells.
         keep_styled (bool): Keep styled cells with empty value.
         see_hidden (bool): parse also the hidden sheets.
+        streaming (bool): Read the tables as a stream, lower memory usage.
+        sheets (list of int or str): Positions or names of the sheets to parse.
+        cell_range (str or tuple or dict): Range of cells to parse, like "A1:H500".
+        workers (int): Number of processes parsing the sheets in parallel.
+        keep_repeated (bool): Keep the repeated rows and cells as one item with
+            a "repeat" count.
+        cache (str or Path or ResultCache): Directory of the result cache,
+            see odsparsator.cache. Default to None, no cache.
+        stats (ParseStats): Record the timing and counters of the parsing,
+            see odsparsator.stats. Default to None, no measure.
+        cancel (threading.Event): Stop the parsing by raising ParseCancelled
+            once the event is set, see odsparsator.aio.
+        raw_values (bool): Keep the cell values unconverted, as (value type,
+            raw string) pairs, see ODSParsator.raw_value().
 
     Returns:
         dict or list: content as python structure
@@ -479,6 +1609,100 @@ def ods_to_python(
         colors=colors,
         keep_styled=keep_styled,
         see_hidden=see_hidden,
+        streaming=streaming,
+        sheets=sheets,
+        cell_range=cell_range,
+        workers=workers,
+        keep_repeated=keep_repeated,
+        stats=stats,
+        cancel=cancel,
+        raw_values=raw_values,
     )
-    parser.parse_document(input_path)
+    result_cache = as_cache(cache)
+    if result_cache is None:
+        parser.parse_document(input_path)
+        return parser.content
+    source = as_source(input_path)
+    options = parser.cache_options()
+    options["output"] = "python"
+    key = result_cache.key(source, options, __version__)
+    if entry := result_cache.get(key):
+        content: dict[str, Any] = pickle.loads(entry.read_bytes())  # noqa: S301
+        return content
+    parser.parse_document(source)
+    result_cache.put(key, pickle.dumps(parser.content))
     return parser.content
+
+
+def ods_to_python_incremental(
+    input_path: InputSource,
+    snapshot_path: Path | str,
+    export_minimal: bool = False,
+    use_decimal: bool = False,
+    all_styles: bool = False,
+    colors: bool = False,
+    keep_styled: bool = False,
+    see_hidden: bool = False,
+    streaming: bool = False,
+    sheets: Iterable[int | str] | None = None,
+    cell_range: CellRange | dict[int | str, CellRange] | None = None,
+    workers: int = 1,
+    keep_repeated: bool = False,
+    raw_values: bool = False,
+) -> tuple[dict[str, Any], list[str]]:
+    """Parse the input file and return the content as python structure,
+    parsing only the sheets changed since the previous call using the same
+    snapshot file.
+
+    The snapshot file keeps the fingerprints and the content of the sheets, it
+    is replaced at each call. It is pickled: only use a file writable by
+    trusted users.
+
+    Args:
+        input_path (str or Path or bytes or file object): Path of the .ods
+            file, its content, or a binary file object to read.
+        snapshot_path (str or Path): Path of the snapshot file, created if
+            needed.
+        export_minimal (bool): Export only values, no styles or formula or col width.
+        use_decimal (bool): Use Decimal(), DateTime() for the cell values.
+        all_styles (bool): Collect all styles from the input.
+        colors (bool): Collect background color of cells.
+        keep_styled (bool): Keep styled cells with empty value.
+        see_hidden (bool): parse also the hidden sheets.
+        streaming (bool): Read the tables as a stream, lower memory usage.
+        sheets (list of int or str): Positions or names of the sheets to parse.
+        cell_range (str or tuple or dict): Range of cells to parse, like "A1:H500".
+        workers (int): Number of processes parsing the sheets in parallel.
+        keep_repeated (bool): Keep the repeated rows and cells as one item with
+            a "repeat" count.
+        raw_values (bool): Keep the cell values unconverted, as (value type,
+            raw string) pairs, see ODSParsator.raw_value().
+
+    Returns:
+        tuple: (content as python structure, names of the parsed sheets).
+    """
+    parser = ODSParsator(
+        export_minimal=export_minimal,
+        use_decimal=use_decimal,
+        all_styles=all_styles,
+        colors=colors,
+        keep_styled=keep_styled,
+        see_hidden=see_hidden,
+        streaming=streaming,
+        sheets=sheets,
+        cell_range=cell_range,
+        workers=workers,
+        keep_repeated=keep_repeated,
+        raw_values=raw_values,
+    )
+    snapshot_path = Path(snapshot_path)
+    previous = None
+    if snapshot_path.is_file():
+        try:
+            previous = pickle.loads(snapshot_path.read_bytes())  # noqa: S301
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            previous = None  # unreadable snapshot, parse all sheets
+    parser.load_document(input_path)
+    reparsed = parser.parse_incremental(previous)
+    write_atomic(snapshot_path, pickle.dumps(parser.snapshot))
+    return parser.content, reparsed
@@ -0,0 +1,196 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Profiling of a conversion with cProfile and tracemalloc.
+
+The cProfile statistics are written in the pstats format, to be read with
+the pstats module or tools like snakeviz. The memory report gives the peak
+of memory allocated by Python and the allocation sites, grouped by method of
+ODSParsator (or function of odsparsator) from a snapshot taken at the end of
+the sheet where the most memory is allocated.
+
+Memory allocated by lxml for the XML trees is not seen by tracemalloc.
+"""
+
+from __future__ import annotations
+
+import ast
+import cProfile
+import tracemalloc
+from bisect import bisect_right
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from odsparsator.stats import ParseStats
+
+PACKAGE_DIR = Path(__file__).parent
+OTHER = "<outside odsparsator>"
+
+
+class MemoryProbe(ParseStats):
+    def __init__(self) -> None:
+        """ParseStats keeping a tracemalloc snapshot at the end of the sheet
+        where the most memory is allocated, tracemalloc being started."""
+        super().__init__()
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.largest = -1
+
+    def probe(self) -> None:
+        """Take a snapshot if more memory is allocated than at the previous
+        snapshot."""
+        current, _peak = tracemalloc.get_traced_memory()
+        if current > self.largest:
+            self.largest = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def end_sheet(self) -> None:
+        super().end_sheet()
+        self.probe()
+
+
+def function_ranges(path: Path) -> tuple[list[int], list[str]]:
+    """Return the first lines and the qualified names of the functions and
+    methods of a module, sorted by line.
+
+    Args:
+        path (Path): Path of the Python module.
+    """
+    module = path.stem
+    found: list[tuple[int, str]] = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                visit(child, f"{prefix}{child.name}.")
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                found.append((child.lineno, f"{module}.{prefix}{child.name}"))
+                visit(child, f"{prefix}{child.name}.")
+
+    visit(ast.parse(path.read_text(encoding="utf8")), "")
+    found.sort()
+    return [line for line, _name in found], [name for _line, name in found]
+
+
+class FunctionIndex:
+    def __init__(self) -> None:
+        """Find the function of the odsparsator package containing a line."""
+        self._modules: dict[str, tuple[list[int], list[str]]] = {}
+
+    def name(self, filename: str, lineno: int) -> str | None:
+        """Return the qualified name of the function, or None if the file is
+        not a module of the package."""
+        path = Path(filename)
+        if path.parent != PACKAGE_DIR:
+            return None
+        if filename not in self._modules:
+            self._modules[filename] = function_ranges(path)
+        lines, names = self._modules[filename]
+        index = bisect_right(lines, lineno) - 1
+        return names[index] if index >= 0 else path.stem
+
+
+def allocations_by_function(
+    snapshot: tracemalloc.Snapshot,
+) -> list[tuple[str, int, int]]:
+    """Group the memory blocks of the snapshot by the innermost function of
+    the odsparsator package in their traceback.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): Snapshot with tracebacks.
+
+    Returns:
+        list: (function, size in bytes, number of blocks), largest first.
+    """
+    index = FunctionIndex()
+    groups: dict[str, list[int]] = {}
+    for statistic in snapshot.statistics("traceback"):
+        name = OTHER
+        for frame in reversed(statistic.traceback):  # most recent first
+            found = index.name(frame.filename, frame.lineno)
+            if found:
+                name = found
+                break
+        group = groups.setdefault(name, [0, 0])
+        group[0] += statistic.size
+        group[1] += statistic.count
+    return sorted(
+        ((name, size, count) for name, (size, count) in groups.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+
+def memory_report(probe: MemoryProbe, peak: int, top: int = 20) -> str:
+    """Return the text of the memory report.
+
+    Args:
+        probe (MemoryProbe): Probe used during the conversion.
+        peak (int): Peak of traced memory, in bytes.
+        top (int): Maximum number of functions and lines listed.
+    """
+    lines = [f"Peak memory allocated by Python: {peak / 1024:.1f} KiB"]
+    snapshot = probe.snapshot
+    if snapshot is None:
+        return "\n".join(lines) + "\n"
+    lines.append(
+        f"Snapshot, at the end of the sheet using the most memory: "
+        f"{probe.largest / 1024:.1f} KiB"
+    )
+    lines.append("")
+    lines.append("Allocations by function:")
+    for name, size, count in allocations_by_function(snapshot)[:top]:
+        lines.append(f"{size / 1024:12.1f} KiB {count:9d} blocks  {name}")
+    lines.append("")
+    lines.append("Allocations by line:")
+    for statistic in snapshot.statistics("lineno")[:top]:
+        frame = statistic.traceback[0]
+        lines.append(
+            f"{statistic.size / 1024:12.1f} KiB {statistic.count:9d} blocks  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def run_profiled(
+    run: Callable[[ParseStats | None], Any],
+    cprofile_path: Path | str | None = None,
+    memory_path: Path | str | None = None,
+    top: int = 20,
+    nframes: int = 30,
+) -> Any:
+    """Run a conversion under cProfile and/or tracemalloc.
+
+    Args:
+        run (callable): Function doing the conversion, called with the
+            ParseStats to use (a MemoryProbe with memory_path) or None.
+        cprofile_path (str or Path): Path of the pstats file to write.
+        memory_path (str or Path): Path of the memory report to write.
+        top (int): Maximum number of functions and lines in the memory report.
+        nframes (int): Number of frames stored by tracemalloc.
+
+    Returns:
+        The result of run().
+    """
+    profiler = cProfile.Profile() if cprofile_path else None
+    probe = MemoryProbe() if memory_path else None
+    if probe is not None:
+        tracemalloc.start(nframes)
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return run(probe)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    finally:
+        if profiler is not None and cprofile_path:
+            profiler.dump_stats(cprofile_path)
+        if probe is not None and memory_path:
+            probe.probe()
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            Path(memory_path).write_text(
+                memory_report(probe, peak, top), encoding="utf8"
+            )
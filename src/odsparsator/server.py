@@ -0,0 +1,497 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Conversion server: a long-lived local HTTP server converting .ods files
+to JSON, for many small files.
+
+The conversions run in a pool of worker processes, started and warmed up
+(odfdo imported, a small document parsed) before the first request, so a
+request does not pay for the interpreter startup and the imports.
+
+Usage:
+    odsparsator-server [--port PORT | --socket PATH] [--workers N] [--root DIR]
+
+Requests:
+    POST /convert, the body being the .ods file, returns the JSON content.
+    POST /convert?path=FILE converts FILE, relative to the --root directory,
+        only if the server was started with --root.
+    GET /health returns the state of the pool as JSON.
+
+The options are query parameters: minimal, all_styles, color, keep_styled,
+see_hidden, keep_repeated, raw, stream, ndjson (flags: "1" or "true"), sheet
+and sheet_name (can be repeated), range and profile, like the odsparsator
+command line:
+
+    curl --data-binary @file.ods "http://127.0.0.1:8765/convert?minimal=1"
+
+At most max_in_flight conversions run at the same time, the other requests
+wait in a queue. A request is refused with the 503 status if the queue is
+full or if it waits more than queue_timeout seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import Any, Union
+from urllib.parse import parse_qs, urlsplit
+from zipfile import BadZipFile
+
+from odfdo import Document, Table
+
+from odsparsator.cli import check_odfdo_version, sheet_argument
+from odsparsator.odsparsator import ODSParsator, __version__
+from odsparsator.window import parse_range
+from odsparsator.writer import PRETTY, PROFILES
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_QUEUED = 100
+DEFAULT_QUEUE_TIMEOUT = 30.0
+DEFAULT_MAX_UPLOAD = 100 * 1024 * 1024
+FLAGS = {
+    "minimal": "export_minimal",
+    "all_styles": "all_styles",
+    "color": "colors",
+    "keep_styled": "keep_styled",
+    "see_hidden": "see_hidden",
+    "keep_repeated": "keep_repeated",
+    "raw": "raw_values",
+    "stream": "streaming",
+    "ndjson": "ndjson",
+}
+TRUE = ("1", "true", "yes", "on")
+JSON_TYPE = "application/json"
+NDJSON_TYPE = "application/x-ndjson"
+
+Source = Union[bytes, str]  # noqa: UP007
+
+
+class ServerBusy(Exception):
+    """No conversion slot available."""
+
+
+def request_options(query: dict[str, list[str]]) -> dict[str, Any]:
+    """Return the options of convert() from the query parameters.
+
+    Args:
+        query (dict): Parsed query string, see urllib.parse.parse_qs().
+
+    Raises:
+        ValueError: unknown parameter or bad value.
+    """
+    options: dict[str, Any] = {}
+    for name, values in query.items():
+        value = values[-1]
+        if name in FLAGS:
+            options[FLAGS[name]] = value.lower() in TRUE
+        elif name == "sheet":
+            sheets = options.setdefault("sheets", [])
+            sheets.extend(sheet_argument(item) for item in values)
+        elif name == "sheet_name":
+            options.setdefault("sheets", []).extend(values)
+        elif name == "range":
+            parse_range(value)
+            options["cell_range"] = value
+        elif name == "profile":
+            if value not in PROFILES:
+                raise ValueError(f"Unknown JSON profile: {value!r}")
+            options["profile"] = value
+        elif name != "path":
+            raise ValueError(f"Unknown parameter: {name!r}")
+    return options
+
+
+def convert(source: Source, options: dict[str, Any]) -> str:
+    """Convert a .ods file to JSON, in a worker process.
+
+    Args:
+        source (bytes or str): Content of the .ods file, or its path.
+        options (dict): Options of ODSParsator, and "profile" and "ndjson"
+            options of the JSON output.
+
+    Returns:
+        str: the JSON content.
+    """
+    options = dict(options)
+    profile = options.pop("profile", PRETTY)
+    ndjson = options.pop("ndjson", False)
+    parser = ODSParsator(**options)
+    parser.load_document(source)
+    output = StringIO()
+    parser.write_json(output, profile, ndjson)
+    return output.getvalue()
+
+
+def sample_document() -> bytes:
+    """Return a small .ods document, used to warm up the workers."""
+    doc = Document("spreadsheet")
+    doc.body.clear()
+    table = Table("warm up")
+    table.set_values([["a", 1, 2.5, True], ["b", 2, 3.5, False]])
+    doc.body.append(table)
+    output = BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def warm_worker() -> None:
+    """Initializer of the worker processes: import and run the code paths of
+    a conversion once."""
+    convert(sample_document(), {})
+
+
+def ready() -> bool:
+    return True
+
+
+class ConversionPool:
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+    ) -> None:
+        """Pool of warm worker processes, with a limit of conversions in
+        flight and of waiting requests.
+
+        Args:
+            workers (int): Number of worker processes, default to the number
+                of CPUs.
+            max_in_flight (int): Maximum number of conversions running at the
+                same time, default to the number of workers.
+            max_queued (int): Maximum number of requests waiting for a slot.
+            queue_timeout (float): Maximum waiting time of a request, in
+                seconds.
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_in_flight = max(1, max_in_flight or self.workers)
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.queued = 0
+        self.in_flight = 0
+        self.done = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._executor = self.start_executor()
+
+    def start_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes and wait until they are warm."""
+        executor = ProcessPoolExecutor(self.workers, initializer=warm_worker)
+        wait([executor.submit(ready) for _ in range(self.workers)])
+        return executor
+
+    def convert(self, source: Source, options: dict[str, Any]) -> str:
+        """Convert a .ods file in a worker process, waiting for a free slot.
+
+        Args:
+            source (bytes or str): Content of the .ods file, or its path.
+            options (dict): Options of convert().
+
+        Raises:
+            ServerBusy: the queue is full or the waiting time is exceeded.
+        """
+        with self._lock:
+            if self.queued >= self.max_queued:
+                raise ServerBusy("Too many requests waiting")
+            self.queued += 1
+        acquired = self._slots.acquire(timeout=self.queue_timeout)
+        with self._lock:
+            self.queued -= 1
+            if acquired:
+                self.in_flight += 1
+        if not acquired:
+            raise ServerBusy("No conversion slot available")
+        try:
+            executor = self._executor
+            try:
+                return executor.submit(convert, source, options).result()
+            except BrokenProcessPool:
+                self.restart(executor)
+                raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.done += 1
+            self._slots.release()
+
+    def restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replace the executor after the crash of a worker process."""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self.start_executor()
+        broken.shutdown(wait=False)
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "version": __version__,
+                "workers": self.workers,
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "done": self.done,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    server: ConversionServer
+    protocol_version = "HTTP/1.1"
+    server_version = f"odsparsator/{__version__}"
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != "/health":
+            self.send_error_json(HTTPStatus.NOT_FOUND, "Not found")
+            return
+        self.send_text(HTTPStatus.OK, json.dumps(self.server.pool.status()))
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # the end of the body is unknown, the connection can not be reused
+            self.close_connection = True
+            self.send_error_json(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return
+        if url.path != "/convert":
+            # the body is not read, the connection can not be reused
+            self.close_connection = True
+            self.send_error_json(HTTPStatus.NOT_FOUND, "Not found")
+            return
+        if length > self.server.max_upload:
+            self.close_connection = True
+            self.send_error_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Too large")
+            return
+        body = self.rfile.read(length)
+        query = parse_qs(url.query, keep_blank_values=True)
+        try:
+            options = request_options(query)
+            source = self.source(body, query)
+        except PermissionError as e:
+            self.send_error_json(HTTPStatus.FORBIDDEN, str(e))
+            return
+        except (ValueError, FileNotFoundError) as e:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        self.run_conversion(source, options)
+
+    def source(self, body: bytes, query: dict[str, list[str]]) -> Source:
+        """Return the uploaded content, or the path of the file to convert.
+
+        Raises:
+            PermissionError: path requests are not allowed, or the path is out
+                of the root directory.
+            FileNotFoundError: the file does not exist.
+            ValueError: no content and no path.
+        """
+        if "path" not in query:
+            if not body:
+                raise ValueError("No .ods content")
+            return body
+        root = self.server.root
+        if root is None:
+            raise PermissionError("Conversion of paths is not allowed")
+        path = (root / query["path"][-1]).resolve()
+        if not path.is_relative_to(root):
+            raise PermissionError("Path out of the root directory")
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {query['path'][-1]}")
+        return str(path)
+
+    def run_conversion(self, source: Source, options: dict[str, Any]) -> None:
+        content_type = NDJSON_TYPE if options.get("ndjson") else JSON_TYPE
+        try:
+            text = self.server.pool.convert(source, options)
+        except ServerBusy as e:
+            self.send_error_json(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+        except (ValueError, TypeError, KeyError, BadZipFile) as e:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, f"Bad .ods file: {e}")
+        except Exception as e:
+            self.send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, repr(e))
+        else:
+            self.send_text(HTTPStatus.OK, text, content_type)
+
+    def send_text(
+        self, status: HTTPStatus, text: str, content_type: str = JSON_TYPE
+    ) -> None:
+        data = text.encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_error_json(self, status: HTTPStatus, message: str) -> None:
+        self.send_text(status, json.dumps({"error": message}))
+
+    def address_string(self) -> str:
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ConversionServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Any,
+        pool: ConversionPool,
+        root: Path | str | None = None,
+        max_upload: int = DEFAULT_MAX_UPLOAD,
+        verbose: bool = False,
+    ) -> None:
+        """HTTP server of the conversions, one thread per connection.
+
+        Args:
+            address (tuple): (host, port) to listen to.
+            pool (ConversionPool): Pool of the worker processes.
+            root (str or Path): Directory of the files that can be converted
+                by path, default to None, only uploads are converted.
+            max_upload (int): Maximum size of an uploaded file, in bytes.
+            verbose (bool): Log the requests on stderr.
+        """
+        self.pool = pool
+        self.root = None if root is None else Path(root).expanduser().resolve()
+        self.max_upload = max_upload
+        self.verbose = verbose
+        super().__init__(address, ConversionHandler)
+
+
+class UnixConversionServer(ConversionServer):
+    address_family = socket.AF_UNIX
+
+    def server_bind(self) -> None:
+        """Bind the Unix socket, replacing a stale socket file."""
+        path = Path(str(self.server_address))
+        if path.is_socket():
+            path.unlink()
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(str(self.server_address)).unlink(missing_ok=True)
+
+
+def make_server(
+    pool: ConversionPool,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_socket: Path | str | None = None,
+    root: Path | str | None = None,
+    max_upload: int = DEFAULT_MAX_UPLOAD,
+    verbose: bool = False,
+) -> ConversionServer:
+    """Return the conversion server listening on host:port, or on the Unix
+    socket if given, see ConversionServer."""
+    if unix_socket is not None:
+        return UnixConversionServer(str(unix_socket), pool, root, max_upload, verbose)
+    return ConversionServer((host, port), pool, root, max_upload, verbose)
+
+
+def main() -> None:  # pragma: no cover
+    """Start the conversion server, until interrupted."""
+    if not check_odfdo_version():
+        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Serve the conversion of .ods files to JSON over HTTP.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--version", action="version", version="%(prog)s " + __version__
+    )
+    parser.add_argument("--host", help="listening address", default=DEFAULT_HOST)
+    parser.add_argument("--port", help="listening port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--socket", help="listen on this Unix socket", metavar="PATH")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="number of worker processes, default to the number of CPUs",
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        help="maximum number of conversions running, default to the workers",
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--max-queued",
+        help="maximum number of requests waiting for a conversion slot",
+        type=int,
+        default=DEFAULT_MAX_QUEUED,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--queue-timeout",
+        help="maximum waiting time of a request, in seconds",
+        type=float,
+        default=DEFAULT_QUEUE_TIMEOUT,
+        metavar="SECONDS",
+    )
+    parser.add_argument(
+        "--root",
+        help="allow the conversion of the files of this directory by path",
+        metavar="DIR",
+    )
+    parser.add_argument(
+        "--max-upload",
+        help="maximum size of an uploaded file, in MB",
+        type=int,
+        default=DEFAULT_MAX_UPLOAD // (1024 * 1024),
+        metavar="MB",
+    )
+    parser.add_argument("-v", "--verbose", help="log the requests", action="store_true")
+    args = parser.parse_args()
+    pool = ConversionPool(
+        args.workers, args.max_in_flight, args.max_queued, args.queue_timeout
+    )
+    server = make_server(
+        pool,
+        args.host,
+        args.port,
+        args.socket,
+        args.root,
+        args.max_upload * 1024 * 1024,
+        args.verbose,
+    )
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"odsparsator server on {where}, {pool.workers} workers", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
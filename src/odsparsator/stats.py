@@ -0,0 +1,123 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Timing and counters of a parsing.
+
+A ParseStats object given to ODSParsator records the wall time of each phase
+and of each sheet, and counts the parsed items. Without it, nothing is
+measured.
+
+Phases:
+    load: reading of the .ods file (odfdo Document).
+    geometry: rstrip() or optimize_width() of the tables, not measured with
+        the streaming option where it is part of the rows phase.
+    rows: parsing of the rows.
+    styles: collection of the columns widths and of the styles.
+    json: serialization of the JSON content.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+PHASES = ("load", "geometry", "rows", "styles", "json")
+COUNTERS = (
+    "tables",
+    "rows",
+    "cells",
+    "styled_cells",
+    "spans",
+    "formulas",
+    "style_cache_hits",
+    "style_cache_misses",
+)
+
+
+class ParseStats:
+    def __init__(self) -> None:
+        """Timing and counters of one or several parsings.
+
+        Counters, the repeated rows and cells being counted for each
+        repetition:
+            tables, rows, cells: parsed items.
+            styled_cells, spans, formulas: cells with these items in the
+                result, so not counted with the export_minimal option,
+                except spans.
+            style_cache_hits, style_cache_misses: styled cells whose style is
+                found or not in the precomputed table of background colors
+                (colors option).
+        """
+        self.phases: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.sheets: dict[str, dict[str, Any]] = {}
+        self._sheet: dict[str, Any] = {}
+        self._sheet_start = 0.0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Context manager adding its wall time to the phase."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add a wall time to the phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, number: int = 1) -> None:
+        """Increment the counter."""
+        self.counters[name] = self.counters.get(name, 0) + number
+
+    def start_sheet(self, name: str) -> None:
+        """Start the timing of a sheet."""
+        self._sheet = {"seconds": 0.0, "rows": 0, "cells": 0}
+        self.sheets[name] = self._sheet
+        self._sheet_start = perf_counter()
+        self.count("tables")
+
+    def count_sheet_row(self, rows: int, cells: int) -> None:
+        """Count the rows and cells of the current sheet."""
+        self._sheet["rows"] += rows
+        self._sheet["cells"] += cells
+        self.count("rows", rows)
+        self.count("cells", cells)
+
+    def end_sheet(self) -> None:
+        """End the timing of the current sheet."""
+        self._sheet["seconds"] = perf_counter() - self._sheet_start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing, in seconds, and the counters."""
+        return {
+            "phases": dict(self.phases),
+            "sheets": {name: dict(sheet) for name, sheet in self.sheets.items()},
+            "counters": dict(self.counters),
+        }
+
+
+class TimedWriter:
+    def __init__(self, writer: Any, stats: ParseStats) -> None:
+        """Writer adding the time of each call of the JSON writer to the json
+        phase of the stats.
+
+        Args:
+            writer (JSONWriter or NDJSONWriter): Writer of the content.
+            stats (ParseStats): Stats of the parsing.
+        """
+        self.writer = writer
+        self.stats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.writer, name)
+        stats = self.stats
+
+        def timed(*args: Any) -> Any:
+            with stats.phase("json"):
+                return method(*args)
+
+        return timed
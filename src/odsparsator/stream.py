@@ -0,0 +1,376 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Streaming reader of the content.xml part of a .ods file.
+
+The tables are read row by row with lxml iterparse(), each row being released
+once parsed, so the memory used does not grow with the size of the sheets.
+The geometry rules of odfdo Table.rstrip() and Table.optimize_width() are
+applied on the fly, the yielded rows are the same as the ones of the odfdo
+Document.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import IO, Any
+from zipfile import ZipFile
+
+from lxml import etree
+from odfdo import Document, Element
+from odfdo.document import Table
+from odfdo.row import Row
+
+from odsparsator.archive import CONTENT, ArchiveContainer
+from odsparsator.window import RowWindow, Window, crop_table
+
+TABLE_START = "table_start"
+ROW = "row"
+TABLE_END = "table_end"
+COLUMN = "column"
+
+_NS_OFFICE = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+_NS_TABLE = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+_BODY = f"{{{_NS_OFFICE}}}body"
+_SPREADSHEET = f"{{{_NS_OFFICE}}}spreadsheet"
+_TABLE = f"{{{_NS_TABLE}}}table"
+_ROW = f"{{{_NS_TABLE}}}table-row"
+# same rows as odfdo Table: rows of table:table-row-group are not parsed
+_ROW_CONTAINERS = {
+    f"{{{_NS_TABLE}}}table-rows",
+    f"{{{_NS_TABLE}}}table-header-rows",
+}
+_COLUMN_ELEMENTS = {
+    f"{{{_NS_TABLE}}}table-column",
+    f"{{{_NS_TABLE}}}table-columns",
+    f"{{{_NS_TABLE}}}table-header-columns",
+    f"{{{_NS_TABLE}}}table-column-group",
+}
+_WATCHED_TAGS = [
+    _BODY,
+    _TABLE,
+    _ROW,
+    f"{{{_NS_TABLE}}}table-row-group",
+    *_ROW_CONTAINERS,
+    *_COLUMN_ELEMENTS,
+]
+
+
+@contextmanager
+def open_content(doc: Document) -> Iterator[IO[bytes]]:
+    """Open the original content.xml part of the .ods file of the document.
+
+    The part is read from the archive file, or from the archive in memory of
+    an ArchiveContainer.
+
+    Args:
+        doc (odfdo.Document): Document opened from a .ods file.
+    """
+    container = doc.container
+    if isinstance(container, ArchiveContainer):
+        with container.open_member(CONTENT) as xml:
+            yield xml
+        return
+    with ZipFile(container.path) as archive, archive.open(CONTENT) as xml:
+        yield xml
+
+
+def load_content_styles(doc: Document) -> None:
+    """Replace the content.xml part of the document by its styles only.
+
+    Only the beginning of content.xml is read, up to the office:body element,
+    so the styles API of the Document is available without loading the
+    tables.
+
+    Args:
+        doc (odfdo.Document): Document opened from a .ods file.
+    """
+    with open_content(doc) as xml:
+        for _event, elem in etree.iterparse(xml, events=("start",), tag=_BODY):
+            root = elem.getparent()
+            skeleton = etree.Element(root.tag, dict(root.attrib), nsmap=root.nsmap)
+            for child in root:
+                if child is not elem:
+                    skeleton.append(deepcopy(child))
+            body = etree.SubElement(skeleton, _BODY)
+            etree.SubElement(body, _SPREADSHEET)
+            break
+        else:
+            raise ValueError("No body found in content.xml")
+    doc.container.set_part(CONTENT, etree.tostring(skeleton))
+
+
+def _shell(elem: Any) -> Any:
+    """Return a copy of the table element without its content."""
+    return etree.Element(elem.tag, dict(elem.attrib), nsmap=elem.nsmap)
+
+
+def table_shells(doc: Document) -> list[Table]:
+    """Return the top level tables of the content.xml part, without their
+    rows and columns.
+
+    Args:
+        doc (odfdo.Document): Document opened from a .ods file.
+    """
+    shells = []
+    with open_content(doc) as xml:
+        for event, elem in etree.iterparse(
+            xml, events=("start", "end"), tag=[_TABLE, _ROW], huge_tree=True
+        ):
+            if event == "end":
+                _release(elem)
+            elif elem.tag == _TABLE and elem.getparent().tag == _SPREADSHEET:
+                shells.append(Element.from_tag(_shell(elem)))
+    return shells
+
+
+def table_digests(doc: Document) -> list[tuple[Table, str, set[str]]]:
+    """Return for each top level table of the content.xml part: the table
+    without rows and columns, the SHA-256 digest of its XML and the names of
+    the styles it refers to.
+
+    The tables are read one at a time.
+
+    Args:
+        doc (odfdo.Document): Document opened from a .ods file.
+    """
+    digests = []
+    with open_content(doc) as xml:
+        for _event, elem in etree.iterparse(xml, tag=_TABLE, huge_tree=True):
+            if elem.getparent().tag != _SPREADSHEET:
+                continue  # table inside a cell
+            names = {
+                value
+                for child in elem.iter()
+                for key, value in child.attrib.items()
+                if key.endswith("style-name")
+            }
+            digest = hashlib.sha256(etree.tostring(elem)).hexdigest()
+            digests.append((Element.from_tag(_shell(elem)), digest, names))
+            _release(elem)
+    return digests
+
+
+def _release(elem: Any) -> None:
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+class ContentStream:
+    def __init__(
+        self,
+        doc: Document,
+        keep_styled: bool = False,
+        accept: Callable[[Table, int], bool] | None = None,
+        window: Callable[[Table, int], Window | None] | None = None,
+    ) -> None:
+        """Iterator on the tables and rows of the content.xml part.
+
+        Yield tuples (event, item, count):
+            (TABLE_START, table, 0): table only contains its columns,
+            (ROW, row, repeated): row ready to parse, repeated times,
+            (TABLE_END, table, width): width of the table, in columns.
+
+        Args:
+            doc (odfdo.Document): Document opened from a .ods file.
+            keep_styled (bool): Apply optimize_width() rules, else rstrip().
+            accept (callable): Filter of the tables to parse, called with
+                the table and its position in the document.
+            window (callable): Window of cells to parse for the table, called
+                with the table and its position in the document. The table
+                ends after the last row of the window.
+        """
+        self.doc = doc
+        self.keep_styled = keep_styled
+        self.accept = accept
+        self.window = window
+        self._pending: list[tuple[Row, int]] = []
+        self._row_index: int = 0
+        self._keep: int = 0
+        self._width: int = 0
+        self._rows = RowWindow(None)
+        self._scan_rows: RowWindow | None = None
+
+    @property
+    def current_window(self) -> Window | None:
+        """Window of cells of the current table, None if not cropped."""
+        return self._rows.window
+
+    def _walk(self) -> Iterator[tuple[str, Any]]:
+        """Yield the top level tables and their rows and columns elements,
+        releasing them once processed."""
+        with open_content(self.doc) as xml:
+            table = None
+            for event, elem in etree.iterparse(
+                xml, events=("start", "end"), tag=_WATCHED_TAGS, huge_tree=True
+            ):
+                if event == "start":
+                    if (
+                        table is None
+                        and elem.tag == _TABLE
+                        and elem.getparent().tag == _SPREADSHEET
+                    ):
+                        table = elem
+                        yield TABLE_START, elem
+                    continue
+                if table is None:
+                    continue
+                if elem is table:
+                    yield TABLE_END, elem
+                    table = None
+                    _release(elem)
+                    continue
+                parent = elem.getparent()
+                if parent is table:
+                    if elem.tag == _ROW:
+                        yield ROW, elem
+                    elif elem.tag in _COLUMN_ELEMENTS:
+                        yield COLUMN, elem
+                    _release(elem)
+                elif (
+                    elem.tag == _ROW
+                    and parent.tag in _ROW_CONTAINERS
+                    and parent.getparent() is table
+                ):
+                    yield ROW, elem
+                    _release(elem)
+
+    def _scan_geometry(self) -> Generator[tuple[int, int]]:
+        """Compute for each table the rows to keep and the width, as
+        Table.optimize_width() would do.
+
+        The scan reads its own content.xml stream, one table ahead of the
+        parsing: rows of the tables not accepted are not scanned, and the
+        scan of a table stops after the last row of its window.
+
+        Yields:
+            tuple: (number of row elements to keep, width) for each table.
+        """
+        count = width = run_start = run_first = run_width = 0
+        rows: RowWindow | None = None
+        scanning = False
+        for event, elem in self._walk():
+            if event == TABLE_START:
+                rows = self._scan_rows
+                scanning = True
+                count = width = run_width = 0
+                run_start = -1
+                continue
+            if not scanning or event == COLUMN:
+                continue
+            if event == ROW:
+                row = rows.crop(Element.from_tag(elem)) if rows else None
+                if row is not None:
+                    row_width = row.minimized_width()
+                    if row.is_empty(aggressive=False):
+                        if run_start < 0:
+                            run_start = count
+                            run_first = row_width
+                        run_width = max(run_width, row_width)
+                    else:
+                        width = max(width, run_width, row_width)
+                        run_start = -1
+                        run_width = 0
+                    count += 1
+                if rows is None or not rows.exhausted:
+                    continue
+            # end of the table, or of its window
+            scanning = False
+            if run_start >= 0:
+                # keep one empty row at the end of the table
+                yield run_start + 1, max(width, run_first)
+            else:
+                yield count, width
+
+    def _optimized_rows(self, row: Row) -> Iterator[tuple[Row, int]]:
+        """Apply Table.optimize_width() rules to the row."""
+        self._row_index += 1
+        if self._row_index > self._keep:
+            return
+        repeated = row.repeated or 1
+        if self._row_index == self._keep:
+            repeated = 1
+        row.force_width(self._width)
+        yield row, repeated
+
+    def _stripped_rows(self, row: Row) -> Iterator[tuple[Row, int]]:
+        """Apply Table.rstrip(aggressive=True) rules to the row."""
+        repeated = row.repeated or 1
+        row.rstrip(aggressive=True)
+        if row.is_empty(aggressive=True):
+            # only yielded if some not empty row follows
+            self._pending.append((row.clone, repeated))
+            return
+        yield from self._pending
+        self._pending = []
+        self._width = max(self._width, row.width)
+        yield row, repeated
+
+    def __iter__(self) -> Iterator[tuple[str, Any, int]]:
+        geometry = self._scan_geometry() if self.keep_styled else None
+        try:
+            yield from self._iter_tables(geometry)
+        finally:
+            if geometry is not None:
+                geometry.close()
+
+    def _start_table(
+        self, elem: Any, index: int, geometry: Iterator[tuple[int, int]] | None
+    ) -> tuple[Any, bool]:
+        """Return the table element without rows, for the columns API, and
+        whether the table is accepted."""
+        shell = _shell(elem)
+        wrapper = Element.from_tag(shell)
+        accepted = self.accept is None or self.accept(wrapper, index)
+        window = self.window(wrapper, index) if accepted and self.window else None
+        self._rows = RowWindow(window)
+        self._pending = []
+        self._row_index = self._width = 0
+        if geometry is not None:
+            self._scan_rows = RowWindow(window) if accepted else None
+            self._keep, self._width = next(geometry)
+        return shell, accepted
+
+    def _window_rows(
+        self, elem: Any, rows: Callable[[Row], Iterator[tuple[Row, int]]]
+    ) -> Iterator[tuple[str, Any, int]]:
+        row = self._rows.crop(Element.from_tag(elem))
+        if row is not None:
+            for item, repeated in rows(row):
+                yield ROW, item, repeated
+
+    def _iter_tables(
+        self, geometry: Iterator[tuple[int, int]] | None
+    ) -> Iterator[tuple[str, Any, int]]:
+        rows = self._optimized_rows if self.keep_styled else self._stripped_rows
+        index = -1
+        accepted = False
+        shell: Any = None
+        table: Table | None = None
+        for event, elem in self._walk():
+            if event == TABLE_START:
+                index += 1
+                shell, accepted = self._start_table(elem, index, geometry)
+                table = None
+                continue
+            if not accepted:
+                continue
+            if event == COLUMN:
+                shell.append(deepcopy(elem))
+                continue
+            if table is None:
+                table = Element.from_tag(shell)
+                if self._rows.window is not None:
+                    table = crop_table(table, self._rows.window)
+                yield TABLE_START, table, 0
+            if event == ROW:
+                yield from self._window_rows(elem, rows)
+                if not self._rows.exhausted:
+                    continue
+            # end of the table, or of its window
+            accepted = False
+            yield TABLE_END, table, self._width
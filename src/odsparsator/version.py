@@ -0,0 +1,6 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Version of odsparsator, importable without loading odfdo."""
+
+__version__ = "1.13.1"
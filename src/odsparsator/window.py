@@ -0,0 +1,175 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Restriction of a table to a range of cells.
+
+The table is processed as if it contained only the cells of the range: rows
+and cells are cropped before the usual rstrip() or optimize_width() rules.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Union
+
+from odfdo import Element
+from odfdo.document import Table
+from odfdo.row import Row
+from odfdo.utils import convert_coordinates
+
+# (first column, first row, last column, last row), None if no limit
+Window = tuple[int, int, Union[int, None], Union[int, None]]  # noqa: UP007
+CellRange = Union[str, tuple, list]  # noqa: UP007
+
+XPATH_ROWS = (
+    "table:table-row|table:table-rows/table:table-row"
+    "|table:table-header-rows/table:table-row"
+)
+XPATH_COLUMNS = (
+    "table:table-column|table:table-columns/table:table-column"
+    "|table:table-header-columns/table:table-column"
+)
+XPATH_CELLS = "table:table-cell|table:covered-table-cell"
+
+
+def parse_range(cell_range: CellRange) -> Window:
+    """Convert a range of cells in a Window tuple.
+
+    Args:
+        cell_range (str or tuple): "A1:H500" or "B3" or "A:C" or "2:10"
+            notation, or a tuple of 4 positions (first column, first row,
+            last column, last row) starting from 0, None meaning no limit.
+
+    Returns:
+        tuple: (first column, first row, last column, last row).
+    """
+    try:
+        coordinates = convert_coordinates(cell_range)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Bad cell range: {cell_range!r}") from e
+    if len(coordinates) == 2:
+        coordinates = coordinates * 2
+    if len(coordinates) != 4 or not all(
+        item is None or (isinstance(item, int) and item >= 0) for item in coordinates
+    ):
+        raise ValueError(f"Bad cell range: {cell_range!r}")
+    x, y, z, t = coordinates
+    window = (x or 0, y or 0, z, t)
+    if (z is not None and z < window[0]) or (t is not None and t < window[1]):
+        raise ValueError(f"Bad cell range: {cell_range!r}")
+    return window
+
+
+def crop_repeated(
+    elements: Iterable[Any], start: int, end: int | None
+) -> Iterator[tuple[Any, int]]:
+    """Yield the repeated elements (rows, cells or columns) covering the
+    positions from start to end, with their new number of repetitions.
+
+    Args:
+        elements (iterable of odfdo.Element): Elements, in document order.
+        start (int): First position.
+        end (int or None): Last position, None if no limit.
+    """
+    position = 0
+    for element in elements:
+        repeated = element.repeated or 1
+        first = max(position, start)
+        last = position + repeated - 1
+        if end is not None:
+            last = min(last, end)
+        position += repeated
+        if first <= last:
+            yield element, last - first + 1
+        if end is not None and position > end:
+            return
+
+
+def _clone_repeated(element: Any, count: int) -> Any:
+    clone = element.clone
+    clone.repeated = count if count > 1 else None
+    return clone
+
+
+def crop_row(row: Row, window: Window) -> Row:
+    """Return a copy of the row with only the cells of the window columns.
+
+    Args:
+        row (odfdo.Row): Row object.
+        window (tuple): Window of the table.
+    """
+    cropped = Row(style=row.style)
+    cells = crop_repeated(row.get_elements(XPATH_CELLS), window[0], window[2])
+    for cell, count in cells:
+        cropped.append_cell(_clone_repeated(cell, count), clone=False)
+    return cropped
+
+
+class RowWindow:
+    def __init__(self, window: Window | None) -> None:
+        """Crop the successive rows of a table to the window.
+
+        Args:
+            window (tuple or None): Window of the table, None for no crop.
+        """
+        self.window = window
+        self.position = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """True when the rows after the last row of the window are reached."""
+        if self.window is None or self.window[3] is None:
+            return False
+        return self.position > self.window[3]
+
+    def crop(self, row: Row) -> Row | None:
+        """Return the cropped row with its repetitions inside the window,
+        or None if the row is out of the window.
+
+        Args:
+            row (odfdo.Row): Next row of the table, in document order.
+        """
+        if self.window is None:
+            return row
+        repeated = row.repeated or 1
+        first = max(self.position, self.window[1])
+        last = self.position + repeated - 1
+        if self.window[3] is not None:
+            last = min(last, self.window[3])
+        self.position += repeated
+        if first > last:
+            return None
+        cropped = crop_row(row, self.window)
+        cropped.repeated = last - first + 1 if last > first else None
+        return cropped
+
+
+def crop_columns(table: Table, window: Window) -> list[Element]:
+    """Return copies of the columns of the window.
+
+    Args:
+        table (odfdo.Table): Table object.
+        window (tuple): Window of the table.
+    """
+    columns = crop_repeated(table.get_elements(XPATH_COLUMNS), window[0], window[2])
+    return [_clone_repeated(column, count) for column, count in columns]
+
+
+def crop_table(table: Table, window: Window) -> Table:
+    """Return a new table containing only the cells of the window.
+
+    Args:
+        table (odfdo.Table): Table object.
+        window (tuple): Window of the table.
+    """
+    cropped = Table(table.name, style=table.style)
+    for column in crop_columns(table, window):
+        cropped.append_column(column)
+    rows = RowWindow(window)
+    for row in table.get_elements(XPATH_ROWS):
+        if rows.exhausted:
+            break
+        cropped_row = rows.crop(row)
+        if cropped_row is not None:
+            cropped.append_row(cropped_row, clone=False)
+    return cropped
@@ -0,0 +1,215 @@
+# Copyright 2021-2025 Jérôme Dumonteil
+# Licence: MIT
+# Authors: jerome.dumonteil@gmail.com
+"""Incremental writer of the JSON content.
+
+The content is sent to the output one table row at a time, so the whole JSON
+text is never built in memory.
+
+Output profiles:
+    pretty: the default, same text as json.dumps(content, ensure_ascii=False,
+        indent=4, sort_keys=True).
+    compact: no indentation, no key sorting.
+    fast: compact, encoded with orjson when it is installed, else with the
+        json module of the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any, TextIO
+
+# orjson is imported by the first use of the fast profile
+HAS_ORJSON = find_spec("orjson") is not None
+
+INDENT = "    "
+PRETTY = "pretty"
+COMPACT = "compact"
+FAST = "fast"
+PROFILES = (PRETTY, COMPACT, FAST)
+
+
+def dumps_pretty(item: Any) -> str:
+    return json.dumps(item, ensure_ascii=False, indent=4, sort_keys=True)
+
+
+def dumps_compact(item: Any) -> str:
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_fast(item: Any) -> str:
+    if not HAS_ORJSON:  # pragma: no cover
+        return dumps_compact(item)
+    import orjson
+
+    try:
+        return str(orjson.dumps(item).decode())
+    except TypeError:
+        # orjson.JSONEncodeError, like integers out of the 64-bit range
+        return dumps_compact(item)
+
+
+class JSONWriter:
+    def __init__(self, output: TextIO, profile: str = PRETTY) -> None:
+        """Write the content {"body": [tables], ...} to a text output.
+
+        Call start(), then for each table start_table(), write_row() for each
+        row and end_table(), then end() with the other keys of the content.
+
+        Args:
+            output (TextIO): Text file opened for writing.
+            profile (str): Output profile, "pretty", "compact" or "fast".
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown JSON profile: {profile!r}")
+        self.output = output
+        self.pretty = profile == PRETTY
+        self._dumps: Callable[[Any], str] = {
+            PRETTY: dumps_pretty,
+            COMPACT: dumps_compact,
+            FAST: dumps_fast,
+        }[profile]
+        self._colon = ": " if self.pretty else ":"
+        self._tables = 0
+        self._rows = 0
+
+    def newline(self, depth: int) -> str:
+        """Line break before an item of the given depth in the content."""
+        if self.pretty:
+            return "\n" + INDENT * depth
+        return ""
+
+    def dumps(self, item: Any, depth: int) -> str:
+        """JSON text of the item, indented for its depth in the content."""
+        text = self._dumps(item)
+        if self.pretty:
+            return text.replace("\n", self.newline(depth))
+        return text
+
+    def start(self) -> None:
+        """Write the beginning of the content."""
+        self._tables = 0
+        self.output.write(f'{{{self.newline(1)}"body"{self._colon}[')
+
+    def start_table(self, name: str) -> None:
+        """Write the beginning of a table.
+
+        Args:
+            name (str): Name of the table.
+        """
+        separator = "," if self._tables else ""
+        self._tables += 1
+        self._rows = 0
+        self.output.write(
+            f"{separator}{self.newline(2)}{{"
+            f'{self.newline(3)}"name"{self._colon}{self.dumps(name, 3)},'
+            f'{self.newline(3)}"table"{self._colon}['
+        )
+
+    def write_row(self, row: Any) -> None:
+        """Write a row of the current table.
+
+        Args:
+            row (list or dict): Python content of the row.
+        """
+        separator = "," if self._rows else ""
+        self._rows += 1
+        self.output.write(f"{separator}{self.newline(4)}{self.dumps(row, 4)}")
+
+    def end_table(self, width: list[str] | None) -> None:
+        """Write the end of the current table.
+
+        Args:
+            width (list or None): Columns widths, None if not exported.
+        """
+        text = f"{self.newline(3)}]" if self._rows else "]"
+        if width is not None:
+            text += f',{self.newline(3)}"width"{self._colon}{self.dumps(width, 3)}'
+        self.output.write(f"{text}{self.newline(2)}}}")
+
+    def end(self, tail: dict[str, Any]) -> None:
+        """Write the end of the content.
+
+        Args:
+            tail (dict): Other keys of the content, like "styles".
+        """
+        text = f"{self.newline(1)}]" if self._tables else "]"
+        keys = sorted(tail) if self.pretty else list(tail)
+        for key in keys:
+            text += (
+                f",{self.newline(1)}{self.dumps(key, 1)}{self._colon}"
+                f"{self.dumps(tail[key], 1)}"
+            )
+        self.output.write(f"{text}{self.newline(0)}}}")
+
+
+class NDJSONWriter:
+    def __init__(self, output: TextIO, profile: str = COMPACT) -> None:
+        """Write the content as JSON Lines, one row per line.
+
+        Same interface as JSONWriter. Each row is written as a line
+        {"sheet": name, "index": position in the sheet, "row": row}. If not
+        None, the columns widths of a table follow its rows in a line
+        {"sheet": name, "width": widths}, and the other keys of the content
+        are written in a last line, like {"styles": styles}. A row with a
+        "repeat" count covers the positions from its index.
+
+        Args:
+            output (TextIO): Text file opened for writing.
+            profile (str): Output profile, lines are always compact: "fast" to
+                use orjson if installed.
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown JSON profile: {profile!r}")
+        self.output = output
+        self._dumps = dumps_fast if profile == FAST else dumps_compact
+        self._sheet = ""
+        self._rows = 0
+
+    def write_line(self, item: dict[str, Any]) -> None:
+        """Write one JSON line."""
+        self.output.write(self._dumps(item) + "\n")
+
+    def start(self) -> None:
+        """Start the content, nothing to write."""
+
+    def start_table(self, name: str) -> None:
+        """Start a table, nothing to write.
+
+        Args:
+            name (str): Name of the table.
+        """
+        self._sheet = name
+        self._rows = 0
+
+    def write_row(self, row: Any) -> None:
+        """Write a row of the current table.
+
+        Args:
+            row (list or dict): Python content of the row.
+        """
+        self.write_line({"sheet": self._sheet, "index": self._rows, "row": row})
+        if isinstance(row, dict):
+            self._rows += row.get("repeat", 1)
+        else:
+            self._rows += 1
+
+    def end_table(self, width: list[str] | None) -> None:
+        """End the current table, write the columns widths if any.
+
+        Args:
+            width (list or None): Columns widths, None if not exported.
+        """
+        if width is not None:
+            self.write_line({"sheet": self._sheet, "width": width})
+
+    def end(self, tail: dict[str, Any]) -> None:
+        """End the content, write the other keys of the content if any.
+
+        Args:
+            tail (dict): Other keys of the content, like "styles".
+        """
+        if tail:
+            self.write_line(tail)
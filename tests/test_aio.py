@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import odsparsator.odsparsator as parser
+from odsparsator import aio
+from odsparsator.aio import AsyncParsator, ods_to_json_async, ods_to_python_async
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_STYLES = DATA / "styles.ods"
+
+
+def test_ods_to_python_async():
+    content = asyncio.run(ods_to_python_async(FILE_MINIMAL, export_minimal=True))
+    assert content == parser.ods_to_python(FILE_MINIMAL, export_minimal=True)
+
+
+def test_ods_to_json_async(tmp_path):
+    dest = tmp_path / "minimal.json"
+    asyncio.run(ods_to_json_async(FILE_MINIMAL, dest))
+    expected = tmp_path / "expected.json"
+    parser.ods_to_json(FILE_MINIMAL, expected)
+    assert json.loads(dest.read_text()) == json.loads(expected.read_text())
+
+
+def test_process_executor():
+    async def convert():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return await AsyncParsator(executor).ods_to_python(FILE_MINIMAL)
+
+    assert asyncio.run(convert()) == parser.ods_to_python(FILE_MINIMAL)
+
+
+def test_concurrency_limit():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_parse(input_path, cancel=None):
+        with lock:
+            running.append(input_path)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(input_path)
+        return input_path
+
+    async def convert():
+        parsator = AsyncParsator(max_concurrency=2)
+        return await asyncio.gather(
+            *(parsator.run(slow_parse, index) for index in range(6))
+        )
+
+    assert asyncio.run(convert()) == list(range(6))
+    assert max(peak) == 2
+
+
+def test_cancellation_stops_parsing():
+    outcome = []
+    done = threading.Event()
+
+    def parse(input_path, cancel=None):
+        cancel.wait(5)
+        try:
+            parser.ods_to_python(input_path, cancel=cancel)
+        except parser.ParseCancelled:
+            outcome.append("cancelled")
+        done.set()
+
+    async def convert():
+        task = asyncio.ensure_future(AsyncParsator().run(parse, FILE_MINIMAL))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(convert())
+    assert done.wait(5)
+    assert outcome == ["cancelled"]
+
+
+def test_cancellation_keeps_slot():
+    events = []
+    finish = threading.Event()
+
+    def slow_parse(input_path, cancel=None):
+        events.append(("start", input_path))
+        finish.wait(5)
+        events.append(("end", input_path))
+        return input_path
+
+    async def convert():
+        parsator = AsyncParsator(max_concurrency=1)
+        first = asyncio.ensure_future(parsator.run(slow_parse, 1))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        second = asyncio.ensure_future(parsator.run(slow_parse, 2))
+        await asyncio.sleep(0.05)
+        assert events == [("start", 1)]
+        finish.set()
+        return await second
+
+    assert asyncio.run(convert()) == 2
+    assert events == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+def test_cancel_event():
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(parser.ParseCancelled):
+        parser.ods_to_python(FILE_MINIMAL, cancel=cancel)
+    assert parser.ods_to_python(FILE_MINIMAL, cancel=threading.Event())
+
+
+def test_iter_rows_async():
+    async def collect():
+        parsator = AsyncParsator()
+        return [row async for row in parsator.iter_rows(FILE_STYLES, batch_size=2)]
+
+    assert asyncio.run(collect()) == list(parser.iter_rows(FILE_STYLES))
+
+
+def test_iter_rows_async_break(monkeypatch):
+    closed = []
+    close_rows = aio.close_rows
+
+    def spy(rows, lock):
+        close_rows(rows, lock)
+        closed.append(True)
+
+    monkeypatch.setattr(aio, "close_rows", spy)
+
+    async def first():
+        rows = AsyncParsator(max_concurrency=1).iter_rows(FILE_STYLES, batch_size=1)
+        async for row in rows:
+            await rows.aclose()
+            return row
+        return None
+
+    assert asyncio.run(first()) == next(parser.iter_rows(FILE_STYLES))
+    assert closed == [True]
@@ -0,0 +1,86 @@
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import odsparsator.odsparsator as parser
+from odsparsator.archive import ArchiveContainer, load_archive, needed_parts
+
+DATA = Path(__file__).parent / "data"
+FILE_HIDDEN = DATA / "minimal_hidden.ods"
+FILE_STYLES = DATA / "styles.ods"
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Names of the members opened for reading, out of the odfdo templates."""
+    names = []
+    original = zipfile.ZipFile.open
+
+    def spy(self, name, mode="r", *args, **kwargs):
+        if mode == "r" and "odfdo" not in str(self.filename):
+            names.append(getattr(name, "filename", name))
+        return original(self, name, mode, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", spy)
+    return names
+
+
+def with_pictures(path):
+    """Content of the .ods file with a large embedded image."""
+    output = io.BytesIO(path.read_bytes())
+    with zipfile.ZipFile(output, "a") as archive:
+        archive.writestr("Pictures/big.png", b"\x89PNG" * 100_000)
+    return output.getvalue()
+
+
+def test_needed_parts():
+    assert needed_parts(True, False) == ("mimetype", "content.xml")
+    assert "styles.xml" in needed_parts(True, True)
+    assert "styles.xml" in needed_parts(False, False)
+
+
+def test_minimal_reads_content_only(opened):
+    data = with_pictures(FILE_HIDDEN)
+    expected = parser.ods_to_python(FILE_HIDDEN, export_minimal=True)
+    assert sorted(set(opened)) == ["content.xml", "mimetype"]
+    opened.clear()
+    assert parser.ods_to_python(data, export_minimal=True) == expected
+    assert sorted(set(opened)) == ["content.xml", "mimetype"]
+
+
+def test_full_reads_styles(opened):
+    data = with_pictures(FILE_STYLES)
+    expected = parser.ods_to_python(FILE_STYLES)
+    opened.clear()
+    assert parser.ods_to_python(data) == expected
+    assert sorted(set(opened)) == ["content.xml", "mimetype", "styles.xml"]
+
+
+def test_seekable_file_not_read(tmp_path, opened):
+    path = tmp_path / "pictures.ods"
+    path.write_bytes(with_pictures(FILE_STYLES))
+    with path.open("rb") as file:
+        assert parser.as_source(file) is file
+        content = parser.ods_to_python(file, streaming=True)
+    assert content == parser.ods_to_python(FILE_STYLES, streaming=True)
+    assert "Pictures/big.png" not in opened
+
+
+def test_slim_archive():
+    doc = load_archive(io.BytesIO(with_pictures(FILE_STYLES)))
+    assert isinstance(doc.container, ArchiveContainer)
+    assert "Pictures/big.png" in doc.container.get_parts()
+    slim = doc.container.slim_archive(needed_parts(True, False))
+    with zipfile.ZipFile(io.BytesIO(slim)) as archive:
+        assert archive.namelist() == ["mimetype", "content.xml"]
+    expected = parser.ods_to_python(FILE_STYLES, export_minimal=True)
+    assert parser.ods_to_python(slim, export_minimal=True) == expected
+
+
+def test_workers_from_bytes(opened):
+    data = with_pictures(FILE_STYLES)
+    expected = parser.ods_to_python(FILE_STYLES, workers=2)
+    assert parser.ods_to_python(data, workers=2) == expected
+    assert "Pictures/big.png" not in opened
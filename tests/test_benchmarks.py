@@ -0,0 +1,70 @@
+import json
+
+import odsparsator.odsparsator as parser
+from benchmarks.conversion import compare as compare_conversion
+from benchmarks.conversion import literals
+from benchmarks.generate import CorpusSpec, generate
+from benchmarks.harness import benchmark, compare, option_sets
+from benchmarks.startup import COMMANDS, heavy_modules, startup
+
+
+def test_generate(tmp_path):
+    spec = CorpusSpec(
+        rows=10,
+        columns=4,
+        sheets=2,
+        hidden=1,
+        style_density=0.5,
+        spans=2,
+        formulas=0.2,
+        repeated=1,
+        repeat_size=5,
+    )
+    path = generate(tmp_path / "bench.ods", spec)
+    content = parser.ods_to_python(path, see_hidden=True)
+    assert [table["name"] for table in content["body"]] == [
+        "sheet 0",
+        "sheet 1",
+        "hidden 0",
+    ]
+    assert len(content["body"][0]["table"]) == 15
+    assert len(parser.ods_to_python(path)["body"]) == 2
+    assert generate(tmp_path / "again.ods", spec)
+    assert parser.ods_to_python(tmp_path / "again.ods") == parser.ods_to_python(path)
+
+
+def test_option_sets():
+    assert len(option_sets()) == 6
+    assert len(option_sets(combinations=True)) == 32
+
+
+def test_harness(tmp_path):
+    path = generate(tmp_path / "bench.ods", CorpusSpec(rows=5, columns=3))
+    results = benchmark([path], repeat=1, functions=["python"])
+    assert len(results["results"]) == 6
+    result = results["results"][0]
+    assert result["rows"] == 5
+    assert result["cells"] == 15
+    assert result["seconds"] > 0
+    assert result["peak_memory"] > 0
+    json.dumps(results)
+    lines = compare(results, results)
+    assert lines[1].endswith("1.00 time, 1.00 memory")
+
+
+def test_cli_import_is_light():
+    assert heavy_modules() == []
+
+
+def test_startup():
+    results = startup(repeat=1)
+    assert sorted(results["seconds"]) == sorted(COMMANDS)
+    assert results["heavy_modules"] == []
+
+
+def test_conversion():
+    assert len(literals(30)) == 30
+    assert len(set(literals(300, distinct=10))) <= 10
+    results = compare_conversion(count=300, repeat=1)
+    assert sorted(results) == ["distinct", "repeated"]
+    assert results["repeated"]["speedup"] > 0
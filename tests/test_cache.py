@@ -0,0 +1,95 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import odsparsator.odsparsator as parser
+from odsparsator.cache import ResultCache, archive_crcs
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_STYLES = DATA / "styles.ods"
+
+
+def no_load(*args, **kwargs):
+    raise AssertionError("the document should not be loaded")
+
+
+def test_archive_crcs():
+    crcs = archive_crcs(FILE_MINIMAL)
+    assert sorted(crcs) == ["content.xml", "styles.xml"]
+    assert crcs != archive_crcs(FILE_STYLES)
+
+
+def test_cache_python(tmp_path, monkeypatch):
+    expected = parser.ods_to_python(FILE_STYLES)
+    content = parser.ods_to_python(FILE_STYLES, cache=tmp_path)
+    assert content == expected
+    assert len(list(tmp_path.iterdir())) == 1
+    monkeypatch.setattr(parser.ODSParsator, "load_document", no_load)
+    assert parser.ods_to_python(FILE_STYLES, cache=tmp_path) == expected
+
+
+def test_cache_options(tmp_path):
+    parser.ods_to_python(FILE_MINIMAL, cache=tmp_path)
+    content = parser.ods_to_python(FILE_MINIMAL, export_minimal=True, cache=tmp_path)
+    assert content == parser.ods_to_python(FILE_MINIMAL, export_minimal=True)
+    parser.ods_to_python(
+        FILE_MINIMAL, cell_range={0: "A1", "Tab 2": "B2"}, cache=tmp_path
+    )
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_cache_file_changed(tmp_path):
+    source = tmp_path / "source.ods"
+    cache = ResultCache(tmp_path / "cache")
+    shutil.copyfile(FILE_MINIMAL, source)
+    parser.ods_to_python(source, cache=cache)
+    shutil.copyfile(FILE_STYLES, source)
+    content = parser.ods_to_python(source, cache=cache)
+    assert content == parser.ods_to_python(FILE_STYLES)
+
+
+def test_cache_json(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "cache")
+    dest = tmp_path / "minimal.json"
+    parser.ods_to_json(FILE_MINIMAL, dest, cache=cache)
+    expected = dest.read_text(encoding="utf8")
+    dest.unlink()
+    monkeypatch.setattr(parser.ODSParsator, "load_document", no_load)
+    parser.ods_to_json(FILE_MINIMAL, dest, cache=cache)
+    assert dest.read_text(encoding="utf8") == expected
+    # a cache hit replaces the file like a parsing, keeping the mode
+    dest.chmod(0o600)
+    inode = dest.stat().st_ino
+    parser.ods_to_json(FILE_MINIMAL, dest, cache=cache)
+    assert dest.stat().st_ino != inode
+    assert dest.stat().st_mode & 0o777 == 0o600
+    assert dest.read_text(encoding="utf8") == expected
+
+
+def test_cache_lru(tmp_path):
+    cache = ResultCache(tmp_path, max_size=25)
+    cache.put("a", b"1" * 10)
+    cache.put("b", b"2" * 10)
+    assert cache.get("a")
+    cache.put("c", b"3" * 10)
+    assert cache.get("a")
+    assert cache.get("b") is None
+    assert cache.get("c")
+    cache.put("d", b"4" * 30)
+    assert cache.get("d") is None
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_cache_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    cache = tmp_path / "cache"
+    command = ["odsparsator", "-m", "--cache", str(cache), str(FILE_MINIMAL), str(dest)]
+    for _ in range(2):
+        proc = subprocess.run(command, capture_output=True, check=False)
+        assert proc.returncode == 0
+    content = json.loads(dest.read_text(encoding="utf8"))
+    assert content["body"][0]["table"][0][:3] == ["a", "b", "c"]
+    assert len(list(cache.iterdir())) == 1
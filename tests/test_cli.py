@@ -3,6 +3,8 @@ import re
 import subprocess
 from pathlib import Path
 
+from odfdo import Document, Table
+
 from odsparsator.cli import check_odfdo_version
 
 RE_VERS = re.compile(r' *version *= *"(\S+)"$')
@@ -139,3 +141,23 @@ def test_generate_min_hidden_hidden_off(tmp_path):
     content = json.loads(dest.read_text(encoding="utf8"))
     assert "body" in content
     assert len(content["body"]) == 1
+
+
+def test_sheet_name(tmp_path):
+    document = Document("ods")
+    document.body.clear()
+    for name in ("first", "2024"):
+        table = Table(name)
+        table.set_value("A1", name)
+        document.body.append(table)
+    source = tmp_path / "years.ods"
+    document.save(source)
+    dest = tmp_path / "years.json"
+    for option, value in (("--sheet-name", "2024"), ("--sheet", "1")):
+        command = ["odsparsator", "-m", option, value, str(source), str(dest)]
+        out, err, exitcode = capture(command)
+        assert exitcode == 0
+        assert err == b""
+        assert out == b""
+        content = json.loads(dest.read_text(encoding="utf8"))
+        assert content["body"] == [{"name": "2024", "table": [["2024"]]}]
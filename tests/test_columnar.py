@@ -0,0 +1,106 @@
+from array import array
+from pathlib import Path
+
+import pytest
+
+import odsparsator.odsparsator as parser
+from odsparsator.columnar import ColumnBuilder, TableColumns
+
+DATA = Path(__file__).parent / "data"
+FILES = sorted(DATA.glob("*.ods"))
+FILE_MINIMAL = DATA / "minimal.ods"
+
+
+def column_values(column):
+    values = column["values"]
+    if column["type"] == "bool":
+        values = [bool(value) for value in values]
+    return [None if column["mask"][i] else value for i, value in enumerate(values)]
+
+
+def cell_value(cell):
+    return cell["value"] if isinstance(cell, dict) else cell
+
+
+def test_columns_same_values():
+    for file in FILES:
+        for options in ({}, {"keep_styled": True}, {"streaming": True}):
+            body = parser.ods_to_python(file, export_minimal=True, **options)["body"]
+            tables = parser.ods_to_columns(file, use_numpy=False, **options)
+            assert list(tables) == [table["name"] for table in body]
+            for table in body:
+                columns = list(tables[table["name"]].values())
+                width = max((len(row) for row in table["table"]), default=0)
+                assert len(columns) == width
+                for x, column in enumerate(columns):
+                    expected = [
+                        cell_value(row[x]) if x < len(row) else None
+                        for row in table["table"]
+                    ]
+                    assert column_values(column) == expected, (file.name, x)
+
+
+def test_columns_arrays():
+    tables = parser.ods_to_columns(FILE_MINIMAL, use_numpy=False)
+    column = tables["Tab 1"]["B"]
+    assert column["type"] == "object"
+    assert column["values"] == ["b", 10, 11, 12]
+    assert column["mask"] == array("B", [0, 0, 0, 0])
+
+
+def test_columns_header():
+    tables = parser.ods_to_columns(FILE_MINIMAL, header=True, use_numpy=False)
+    assert list(tables["Tab 1"]) == list("abcdefghij")
+    column = tables["Tab 1"]["b"]
+    assert column["type"] == "int"
+    assert column["values"] == array("q", [10, 11, 12])
+
+
+def test_columns_range_names():
+    tables = parser.ods_to_columns(FILE_MINIMAL, cell_range="C2:D4", use_numpy=False)
+    assert list(tables["Tab 1"]) == ["C", "D"]
+    assert tables["Tab 1"]["D"]["values"] == array("q", [30, 31, 32])
+
+
+def test_columns_unique_names():
+    columns = TableColumns(parser.ODSParsator.json_convert, header=True)
+    columns.header = ["B", None, "B_2", None]
+    columns.columns = [ColumnBuilder() for _ in range(4)]
+    assert columns.names() == ["B", "B_2", "C", "D"]
+    columns.header = ["B", None]
+    columns.columns = columns.columns[:2]
+    assert columns.names() == ["B", "B_2"]
+    assert len(columns.result(use_numpy=False)) == 2
+
+
+def test_columns_numpy():
+    numpy = pytest.importorskip("numpy")
+    tables = parser.ods_to_columns(FILE_MINIMAL, header=True)
+    column = tables["Tab 1"]["b"]
+    assert column["values"].dtype == numpy.int64
+    assert column["mask"].dtype == numpy.bool_
+    assert column["values"].tolist() == [10, 11, 12]
+
+
+def test_column_builder_types():
+    column = ColumnBuilder()
+    column.append(None)
+    assert column.kind is None
+    column.append(1)
+    assert column.kind == "int"
+    column.append(1.5)
+    assert column.kind == "float"
+    assert column.values == array("d", [0, 1, 1.5])
+    column.append("x")
+    assert column.kind == "object"
+    assert column.values == [None, 1.0, 1.5, "x"]
+    assert column.mask == array("B", [1, 0, 0, 0])
+
+
+def test_column_builder_bool_and_big_int():
+    column = ColumnBuilder(1)
+    column.append(True)
+    assert column.kind == "bool"
+    column.append(2**70)
+    assert column.kind == "object"
+    assert column.values == [None, True, 2**70]
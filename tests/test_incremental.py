@@ -0,0 +1,103 @@
+import shutil
+from pathlib import Path
+
+from odfdo import Document
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILE_USE_CASE = DATA / "use_case.ods"
+FILE_MINIMAL = DATA / "minimal.ods"
+
+
+def copy_source(tmp_path):
+    source = tmp_path / "source.ods"
+    shutil.copyfile(FILE_USE_CASE, source)
+    return source
+
+
+def test_fingerprints():
+    odsp = parser.ODSParsator()
+    odsp.load_document(FILE_USE_CASE)
+    fingerprints = odsp.table_fingerprints()
+    assert [table.name for table, _ in fingerprints] == ["Results", "Scale"]
+    assert fingerprints[0][1] != fingerprints[1][1]
+    assert [item[1] for item in odsp.table_fingerprints()] == [
+        item[1] for item in fingerprints
+    ]
+
+
+def test_incremental_unchanged(tmp_path):
+    snapshot = tmp_path / "snapshot"
+    expected = parser.ods_to_python(FILE_USE_CASE)
+    content, reparsed = parser.ods_to_python_incremental(FILE_USE_CASE, snapshot)
+    assert content == expected
+    assert reparsed == ["Results", "Scale"]
+    content, reparsed = parser.ods_to_python_incremental(FILE_USE_CASE, snapshot)
+    assert content == expected
+    assert reparsed == []
+
+
+def test_incremental_changed_sheet(tmp_path):
+    source = copy_source(tmp_path)
+    snapshot = tmp_path / "snapshot"
+    parser.ods_to_python_incremental(source, snapshot)
+    doc = Document(source)
+    doc.body.get_table(name="Scale").set_value("A1", "changed")
+    doc.save(source)
+    content, reparsed = parser.ods_to_python_incremental(source, snapshot)
+    assert reparsed == ["Scale"]
+    assert content == parser.ods_to_python(source)
+
+
+def test_incremental_changed_style(tmp_path):
+    source = copy_source(tmp_path)
+    snapshot = tmp_path / "snapshot"
+    parser.ods_to_python_incremental(source, snapshot, colors=True)
+    doc = Document(source)
+    table = doc.body.get_table(name="Results")
+    name = next(cell.style for cell in table.get_cells(flat=True) if cell.style)
+    doc.get_style("table-cell", name).set_properties({"fo:background-color": "#123456"})
+    doc.save(source)
+    content, reparsed = parser.ods_to_python_incremental(source, snapshot, colors=True)
+    assert "Results" in reparsed
+    assert content == parser.ods_to_python(source, colors=True)
+
+
+def test_incremental_options(tmp_path):
+    snapshot = tmp_path / "snapshot"
+    parser.ods_to_python_incremental(FILE_USE_CASE, snapshot)
+    content, reparsed = parser.ods_to_python_incremental(
+        FILE_USE_CASE, snapshot, export_minimal=True
+    )
+    assert reparsed == ["Results", "Scale"]
+    assert content == parser.ods_to_python(FILE_USE_CASE, export_minimal=True)
+
+
+def test_incremental_sheets_streaming(tmp_path):
+    snapshot = tmp_path / "snapshot"
+    options = {"streaming": True, "sheets": ["Tab 2"], "keep_styled": True}
+    content, reparsed = parser.ods_to_python_incremental(
+        FILE_MINIMAL, snapshot, **options
+    )
+    assert reparsed == ["Tab 2"]
+    assert content == parser.ods_to_python(FILE_MINIMAL, **options)
+
+
+def test_incremental_workers(tmp_path):
+    source = copy_source(tmp_path)
+    snapshot = tmp_path / "snapshot"
+    parser.ods_to_python_incremental(source, snapshot, workers=2)
+    doc = Document(source)
+    doc.body.get_table(name="Results").set_value("B2", 42)
+    doc.save(source)
+    content, reparsed = parser.ods_to_python_incremental(source, snapshot, workers=2)
+    assert reparsed == ["Results"]
+    assert content == parser.ods_to_python(source)
+
+
+def test_incremental_bad_snapshot(tmp_path):
+    snapshot = tmp_path / "snapshot"
+    snapshot.write_bytes(b"not a snapshot")
+    _content, reparsed = parser.ods_to_python_incremental(FILE_USE_CASE, snapshot)
+    assert reparsed == ["Results", "Scale"]
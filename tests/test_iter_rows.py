@@ -0,0 +1,60 @@
+from pathlib import Path
+from types import GeneratorType
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_MINIMAL_HIDDEN = DATA / "minimal_hidden.ods"
+FILE_USE_CASE = DATA / "use_case.ods"
+
+
+def test_iter_rows_is_generator():
+    rows = parser.iter_rows(FILE_MINIMAL)
+    assert isinstance(rows, GeneratorType)
+
+
+def test_iter_rows_first_sheet():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    assert list(parser.iter_rows(FILE_MINIMAL)) == body[0]["table"]
+
+
+def test_iter_rows_by_position():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    assert list(parser.iter_rows(FILE_MINIMAL, sheet=1)) == body[1]["table"]
+
+
+def test_iter_rows_by_name():
+    body = parser.ods_to_python(FILE_MINIMAL, export_minimal=True)["body"]
+    rows = parser.iter_rows(FILE_MINIMAL, sheet="Tab 2", export_minimal=True)
+    assert list(rows) == body[1]["table"]
+
+
+def test_iter_rows_options():
+    options = {"colors": True, "keep_styled": True}
+    body = parser.ods_to_python(FILE_USE_CASE, **options)["body"]
+    for position, table in enumerate(body):
+        rows = parser.iter_rows(FILE_USE_CASE, sheet=position, **options)
+        assert list(rows) == table["table"]
+
+
+def test_iter_rows_unknown_sheet():
+    assert list(parser.iter_rows(FILE_MINIMAL, sheet="unknown")) == []
+
+
+def test_iter_rows_hidden_sheet():
+    body = parser.ods_to_python(FILE_MINIMAL_HIDDEN, see_hidden=True)["body"]
+    hidden = body[1]
+    rows = list(parser.iter_rows(FILE_MINIMAL_HIDDEN, sheet=hidden["name"]))
+    assert rows == []
+    rows = list(
+        parser.iter_rows(FILE_MINIMAL_HIDDEN, sheet=hidden["name"], see_hidden=True)
+    )
+    assert rows == hidden["table"]
+
+
+def test_iter_rows_dom():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    odsp = parser.ODSParsator()
+    odsp.load_document(FILE_MINIMAL)
+    assert list(odsp.iter_rows("Tab 2")) == body[1]["table"]
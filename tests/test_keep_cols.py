@@ -655,3 +655,15 @@ def test_content_keep_colors_minimal():
     ]
 
     assert body == expected
+
+
+def test_bgcolor_same_as_odfdo():
+    odsp = parser.ODSParsator(colors=True, keep_styled=True)
+    odsp.load_document(FILE_COLS)
+    table = odsp.doc.body.get_tables()[0]
+    odsp.initialize_table(table)
+    for row in table.traverse():
+        for cell in row.traverse():
+            props = odsp.doc.get_cell_style_properties(0, (cell.x, cell.y))
+            expected = props.get("fo:background-color", parser.DEFAULT_BGCOLOR)
+            assert odsp.cell_bgcolor(row, cell) == expected, (cell.x, cell.y)
@@ -0,0 +1,84 @@
+import io
+import subprocess
+from pathlib import Path
+
+import odsparsator.odsparsator as parser
+from odsparsator.cache import ResultCache
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_STYLES = DATA / "styles.ods"
+
+
+def expected_json(tmp_path, file, **options):
+    dest = tmp_path / "expected.json"
+    parser.ods_to_json(file, dest, **options)
+    return dest.read_text(encoding="utf8")
+
+
+def test_python_from_bytes():
+    data = FILE_STYLES.read_bytes()
+    expected = parser.ods_to_python(FILE_STYLES)
+    assert parser.ods_to_python(data) == expected
+    assert parser.ods_to_python(bytearray(data)) == expected
+    assert parser.ods_to_python(io.BytesIO(data)) == expected
+    with FILE_STYLES.open("rb") as file:
+        assert parser.ods_to_python(file) == expected
+
+
+def test_python_from_bytes_streaming():
+    data = FILE_STYLES.read_bytes()
+    for options in ({"streaming": True}, {"workers": 2}):
+        expected = parser.ods_to_python(FILE_STYLES, **options)
+        assert parser.ods_to_python(data, **options) == expected
+
+
+def test_iter_rows_from_bytes():
+    data = FILE_MINIMAL.read_bytes()
+    rows = list(parser.iter_rows(data, sheet=1))
+    assert rows == list(parser.iter_rows(FILE_MINIMAL, sheet=1))
+
+
+def test_json_to_binary_stream(tmp_path):
+    output = io.BytesIO()
+    parser.ods_to_json(FILE_MINIMAL.read_bytes(), output)
+    assert not output.closed
+    assert output.getvalue().decode("utf8") == expected_json(tmp_path, FILE_MINIMAL)
+
+
+def test_json_to_text_stream(tmp_path):
+    output = io.StringIO()
+    parser.ods_to_json(FILE_MINIMAL, output, ndjson=True)
+    assert output.getvalue() == expected_json(tmp_path, FILE_MINIMAL, ndjson=True)
+
+
+def test_json_stream_cache(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    data = FILE_MINIMAL.read_bytes()
+    first = io.BytesIO()
+    parser.ods_to_json(data, first, cache=cache)
+    assert len(list(cache.directory.iterdir())) == 1
+    second = io.StringIO()
+    parser.ods_to_json(io.BytesIO(data), second, cache=cache)
+    assert first.getvalue().decode("utf8") == second.getvalue()
+    assert second.getvalue() == expected_json(tmp_path, FILE_MINIMAL)
+
+
+def test_incremental_from_bytes(tmp_path):
+    snapshot = tmp_path / "snapshot"
+    data = FILE_MINIMAL.read_bytes()
+    content, reparsed = parser.ods_to_python_incremental(data, snapshot)
+    assert content == parser.ods_to_python(FILE_MINIMAL)
+    assert len(reparsed) == 2
+    _content, reparsed = parser.ods_to_python_incremental(data, snapshot)
+    assert reparsed == []
+
+
+def test_cli_pipe(tmp_path):
+    command = ["odsparsator", "--minimal", "-", "-"]
+    proc = subprocess.run(
+        command, input=FILE_MINIMAL.read_bytes(), capture_output=True, check=False
+    )
+    assert proc.returncode == 0
+    expected = expected_json(tmp_path, FILE_MINIMAL, export_minimal=True)
+    assert proc.stdout.decode("utf8") == expected
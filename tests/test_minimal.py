@@ -593,3 +593,19 @@ def test_t1_r2_row_style():
     t = body()[1]
     row = t["table"][2]
     assert row["style"] == "default_table_row"
+
+
+def test_values_only_rows():
+    for use_decimal in (False, True):
+        ods = parser.ODSParsator(export_minimal=True, use_decimal=use_decimal)
+        assert ods.values_only
+        ods.load_document(DATA / "json.ods")
+        for table in ods.doc.body.get_tables():
+            for row in table.traverse():
+                expected = [ods.parse_cell(cell) for cell in row.traverse()]
+                assert ods.parse_row_values(row) == expected
+
+
+def test_values_only_options():
+    assert not parser.ODSParsator().values_only
+    assert not parser.ODSParsator(export_minimal=True, colors=True).values_only
@@ -0,0 +1,97 @@
+import random
+from decimal import InvalidOperation
+
+import pytest
+from odfdo import Cell
+
+import odsparsator.odsparsator as parser
+from odsparsator.numeric import (
+    MEMO_SIZE,
+    clear_memo,
+    decimal_number,
+    number,
+    parse_number,
+)
+
+LITERALS = [
+    "0",
+    "-0",
+    "42",
+    "-42",
+    "+42",
+    "1_000",
+    "12345678901234567890",
+    "9007199254740993",
+    "2.0",
+    "-0.0",
+    "2.50",
+    "0.1",
+    "-.5",
+    "5.",
+    "1e3",
+    "1E-3",
+    "1e-400",
+    "1e400",
+    "12345678901234567890.0",
+    "1.0000000000000000001",
+    "true",
+    "false",
+]
+
+
+def test_same_as_decimal():
+    for literal in LITERALS:
+        expected = decimal_number(literal)
+        for value in (parse_number(literal), number(literal), number(literal)):
+            assert type(value) is type(expected)
+            assert value == expected
+
+
+def test_same_as_decimal_random():
+    rnd = random.Random(0)  # noqa: S311
+    for _ in range(10_000):
+        literal = rnd.choice(
+            [
+                str(rnd.randint(-(10**12), 10**12)),
+                repr(rnd.uniform(-1e6, 1e6)),
+                f"{rnd.randint(0, 999)}.{rnd.randint(0, 99):02d}",
+                f"{rnd.randint(0, 10**20)}.0",
+            ]
+        )
+        expected = decimal_number(literal)
+        value = parse_number(literal)
+        assert type(value) is type(expected)
+        assert value == expected
+
+
+def test_same_errors():
+    with pytest.raises(ValueError):
+        number("NaN")
+    with pytest.raises(OverflowError):
+        number("Infinity")
+    with pytest.raises(InvalidOperation):
+        number("not a number")
+    with pytest.raises(TypeError):
+        number(None)
+
+
+def test_memo():
+    clear_memo()
+    assert number("3.25") == 3.25
+    assert number("3.25") == 3.25
+    assert number("7") == 7
+    info = number.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 2, MEMO_SIZE)
+    for index in range(MEMO_SIZE + 10):
+        number(str(index))
+    assert number.cache_info().currsize == MEMO_SIZE
+
+
+def test_boolean_literals():
+    # malformed numeric cells, read as booleans by odfdo.get_attribute()
+    for literal, expected in (("true", 1), ("false", 0)):
+        cell = Cell(1)
+        cell.set_attribute("office:value", literal)
+        value = parser.ODSParsator.json_convert(cell)
+        assert value == expected
+        assert type(value) is int
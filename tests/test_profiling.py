@@ -0,0 +1,96 @@
+import json
+import pstats
+import subprocess
+import tracemalloc
+from pathlib import Path
+
+import odsparsator.odsparsator as parser
+from odsparsator.profiling import (
+    MemoryProbe,
+    allocations_by_function,
+    function_ranges,
+    run_profiled,
+)
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+SOURCE = Path(parser.__file__)
+
+
+def test_function_ranges():
+    lines, names = function_ranges(SOURCE)
+    assert lines == sorted(lines)
+    assert "odsparsator.ODSParsator.parse_cell" in names
+    assert "odsparsator.ods_to_json" in names
+
+
+def test_run_profiled_result():
+    content = run_profiled(
+        lambda stats: parser.ods_to_python(FILE_MINIMAL, stats=stats)
+    )
+    assert content == parser.ods_to_python(FILE_MINIMAL)
+
+
+def test_run_profiled_cprofile(tmp_path):
+    dest = tmp_path / "profile.pstats"
+    run_profiled(
+        lambda stats: parser.ods_to_python(FILE_MINIMAL, stats=stats),
+        cprofile_path=dest,
+    )
+    functions = {name for _file, _line, name in pstats.Stats(str(dest)).stats}
+    assert "parse_cell" in functions
+
+
+def test_run_profiled_memory(tmp_path):
+    dest = tmp_path / "memory.txt"
+    seen = []
+
+    def run(stats):
+        seen.append(stats)
+        return parser.ods_to_python(FILE_MINIMAL, stats=stats)
+
+    run_profiled(run, memory_path=dest)
+    assert isinstance(seen[0], MemoryProbe)
+    assert seen[0].snapshot is not None
+    assert seen[0].counters["tables"] == 2
+    assert not tracemalloc.is_tracing()
+    report = dest.read_text(encoding="utf8")
+    assert report.startswith("Peak memory allocated by Python")
+    assert "odsparsator.ODSParsator." in report
+
+
+def test_allocations_by_function():
+    probe = MemoryProbe()
+    tracemalloc.start(30)
+    try:
+        content = parser.ods_to_python(FILE_MINIMAL, stats=probe)
+        probe.probe()
+    finally:
+        tracemalloc.stop()
+    assert content
+    groups = allocations_by_function(probe.snapshot)
+    sizes = [size for _name, size, _count in groups]
+    assert sizes == sorted(sizes, reverse=True)
+    assert any(name.startswith("odsparsator.ODSParsator.") for name, _s, _c in groups)
+
+
+def test_profiling_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    cpu = tmp_path / "cpu.pstats"
+    memory = tmp_path / "memory.txt"
+    command = [
+        "odsparsator",
+        "--stats",
+        "--cprofile",
+        str(cpu),
+        "--tracemalloc",
+        str(memory),
+        str(FILE_MINIMAL),
+        str(dest),
+    ]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    assert json.loads(proc.stderr)["counters"]["tables"] == 2
+    assert json.loads(dest.read_text(encoding="utf8"))["body"]
+    assert pstats.Stats(str(cpu)).total_calls > 0
+    assert "Allocations by function:" in memory.read_text(encoding="utf8")
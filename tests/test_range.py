@@ -0,0 +1,118 @@
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+from odfdo import Document
+
+import odsparsator.odsparsator as parser
+from odsparsator.stream import ROW, TABLE_END, ContentStream
+from odsparsator.window import parse_range
+
+DATA = Path(__file__).parent / "data"
+FILES = sorted(DATA.glob("*.ods"))
+FILE_MINIMAL = DATA / "minimal.ods"
+RANGES = ("A1:B3", "B3", "A:C", "2:4", (1, 1, None, None), "C5:F9")
+OPTIONS = (
+    {},
+    {"export_minimal": True},
+    {"keep_styled": True, "colors": True},
+)
+
+
+def canonical(dict_item):
+    if "styles" in dict_item:
+        tmp = sorted([(s["definition"], s.get("name")) for s in dict_item["styles"]])
+        dict_item["styles"] = tmp
+    return json.dumps(dict_item, sort_keys=True, indent=4, ensure_ascii=False)
+
+
+def test_parse_range():
+    assert parse_range("A1:H500") == (0, 0, 7, 499)
+    assert parse_range("B3") == (1, 2, 1, 2)
+    assert parse_range("A:C") == (0, 0, 2, None)
+    assert parse_range("2:4") == (0, 1, None, 3)
+    assert parse_range((1, 2)) == (1, 2, 1, 2)
+
+
+def test_parse_range_bad():
+    for cell_range in ("B3:A1", (1, -1, 2, 3), 12):
+        with pytest.raises(ValueError):
+            parse_range(cell_range)
+
+
+def test_range_values():
+    content = parser.ods_to_python(
+        FILE_MINIMAL, export_minimal=True, cell_range="B2:C3"
+    )
+    assert content["body"][0]["table"] == [[10, 20], [11, 21]]
+
+
+def test_range_outside():
+    content = parser.ods_to_python(FILE_MINIMAL, export_minimal=True, cell_range="Z99")
+    assert [table["table"] for table in content["body"]] == [[], []]
+
+
+def test_range_by_sheet():
+    content = parser.ods_to_python(
+        FILE_MINIMAL, export_minimal=True, cell_range={"Tab 1": "A1:A2"}
+    )
+    full = parser.ods_to_python(FILE_MINIMAL, export_minimal=True)
+    assert content["body"][0]["table"] == [["a"], [0]]
+    assert content["body"][1] == full["body"][1]
+
+
+def test_range_streaming_same_content():
+    for file in FILES:
+        for cell_range in RANGES:
+            for options in OPTIONS:
+                expected = parser.ods_to_python(file, cell_range=cell_range, **options)
+                content = parser.ods_to_python(
+                    file, streaming=True, cell_range=cell_range, **options
+                )
+                assert canonical(content) == canonical(expected), (
+                    file.name,
+                    cell_range,
+                    options,
+                )
+
+
+def test_range_iter_rows():
+    rows = parser.iter_rows(FILE_MINIMAL, export_minimal=True, cell_range="A2:B2")
+    assert list(rows) == [[0, 10]]
+
+
+def test_range_early_termination():
+    stream = ContentStream(
+        Document(FILE_MINIMAL), window=lambda table, position: parse_range("1:2")
+    )
+    walk = stream._walk
+    walked = []
+
+    def counting_walk():
+        for event, elem in walk():
+            walked.append(event)
+            yield event, elem
+
+    stream._walk = counting_walk
+    for event, _item, _count in stream:
+        if event == TABLE_END:
+            break
+    assert walked.count(ROW) == 2
+
+
+def test_range_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    command = ["odsparsator", "-m", "--range", "A1:B1", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    content = json.loads(dest.read_text(encoding="utf8"))
+    assert content["body"][0]["table"] == [["a", "b"]]
+
+
+def test_range_cli_bad(tmp_path):
+    dest = tmp_path / "minimal.json"
+    command = ["odsparsator", "--range", "B3:A1", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode != 0
+    assert not dest.exists()
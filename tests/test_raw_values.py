@@ -0,0 +1,103 @@
+import json
+import subprocess
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from odfdo import Cell, Document, Row, Table
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILE_JSON = DATA / "json.ods"
+EXPECTED = [
+    ("float", "2.50"),
+    ("float", "3"),
+    ("percentage", "0.25"),
+    ("boolean", "true"),
+    ("date", "2025-01-31"),
+    ("string", "some text"),
+    None,
+    ("float", "7"),
+]
+
+
+@pytest.fixture
+def values_file(tmp_path):
+    document = Document("ods")
+    document.body.clear()
+    table = Table("values")
+    row = Row()
+    row.append_cell(Cell(Decimal("2.50")))
+    row.append_cell(Cell(3))
+    row.append_cell(Cell(Decimal("0.25"), cell_type="percentage"))
+    row.append_cell(Cell(True))
+    row.append_cell(Cell(date(2025, 1, 31)))
+    row.append_cell(Cell("some text"))
+    row.append_cell(Cell())
+    row.append_cell(Cell(7))
+    table.append_row(row)
+    document.body.append(table)
+    path = tmp_path / "values.ods"
+    document.save(path)
+    return path
+
+
+def test_raw_values(values_file):
+    for options in ({}, {"export_minimal": True}, {"streaming": True}):
+        content = parser.ods_to_python(values_file, raw_values=True, **options)
+        cells = content["body"][0]["table"][0]
+        if isinstance(cells, dict):
+            cells = cells["row"]
+        values = [cell["value"] if isinstance(cell, dict) else cell for cell in cells]
+        assert values == EXPECTED
+
+
+def test_raw_values_over_decimal(values_file):
+    content = parser.ods_to_python(
+        values_file, export_minimal=True, use_decimal=True, raw_values=True
+    )
+    assert content["body"][0]["table"][0] == EXPECTED
+
+
+def test_raw_values_json(values_file, tmp_path):
+    output = tmp_path / "values.json"
+    parser.ods_to_json(values_file, output, export_minimal=True, raw_values=True)
+    content = json.loads(output.read_text(encoding="utf8"))
+    assert content["body"][0]["table"][0] == [
+        None if value is None else list(value) for value in EXPECTED
+    ]
+
+
+def test_raw_values_structure():
+    options = {"export_minimal": True, "keep_repeated": True}
+    raw = parser.ods_to_python(FILE_JSON, raw_values=True, **options)
+    converted = parser.ods_to_python(FILE_JSON, **options)
+    assert len(raw["body"]) == len(converted["body"])
+    assert raw["body"][0]["table"][0][0] == {
+        "value": ("string", "spanned cell"),
+        "colspanned": 3,
+        "rowspanned": 2,
+    }
+    assert raw["body"][0]["table"][1][:2] == [
+        {"value": None, "repeat": 3},
+        ("float", "30"),
+    ]
+
+
+def test_raw_values_rows_and_workers(values_file):
+    rows = list(parser.iter_rows(values_file, export_minimal=True, raw_values=True))
+    assert rows == [EXPECTED]
+    content = parser.ods_to_python(
+        values_file, export_minimal=True, raw_values=True, workers=2
+    )
+    assert content["body"][0]["table"][0] == EXPECTED
+
+
+def test_cli_raw(values_file, tmp_path):
+    output = tmp_path / "cli.json"
+    command = ["odsparsator", "--minimal", "--raw", str(values_file), str(output)]
+    subprocess.run(command, check=True)
+    content = json.loads(output.read_text(encoding="utf8"))
+    assert content["body"][0]["table"][0][0] == ["float", "2.50"]
@@ -0,0 +1,118 @@
+import json
+import subprocess
+from pathlib import Path
+
+from odfdo import Cell, Document, Row, Table
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILES = sorted(DATA.glob("*.ods"))
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_COL_CELL_BLUE = DATA / "col_cell_blue.ods"
+OPTIONS = (
+    {},
+    {"export_minimal": True},
+    {"colors": True},
+    {"keep_styled": True, "colors": True},
+    {"streaming": True, "keep_styled": True},
+    {"streaming": True, "colors": True, "cell_range": "B2:Z40"},
+)
+
+
+def expand_cells(cells):
+    result = []
+    for cell in cells:
+        if isinstance(cell, dict) and "repeat" in cell:
+            cell = dict(cell)
+            count = cell.pop("repeat")
+            if list(cell) == ["value"]:
+                cell = cell["value"]
+            result.extend([cell] * count)
+        else:
+            result.append(cell)
+    return result
+
+
+def expand_rows(rows):
+    result = []
+    for row in rows:
+        count = 1
+        if isinstance(row, dict):
+            row = dict(row)
+            count = row.pop("repeat", 1)
+            row["row"] = expand_cells(row["row"])
+            if list(row) == ["row"]:
+                row = row["row"]
+        else:
+            row = expand_cells(row)
+        result.extend([row] * count)
+    return result
+
+
+def test_repeated_expand_to_same_content():
+    for file in FILES:
+        for options in OPTIONS:
+            expected = parser.ods_to_python(file, **options)
+            content = parser.ods_to_python(file, keep_repeated=True, **options)
+            for table in content["body"]:
+                table["table"] = expand_rows(table["table"])
+            assert content == expected, (file.name, options)
+
+
+def make_template(path):
+    document = Document("spreadsheet")
+    document.body.clear()
+    table = Table("template")
+    row = Row(repeated=1000)
+    row.append_cell(Cell(7, repeated=5), clone=False)
+    row.append_cell(Cell("x"), clone=False)
+    table.append_row(row, clone=False)
+    table.append_row(Row(), clone=False)
+    last = Row()
+    last.append_cell(Cell("end"), clone=False)
+    table.append_row(last, clone=False)
+    document.body.append(table)
+    document.save(path)
+
+
+def test_repeated_rows_and_cells(tmp_path):
+    path = tmp_path / "template.ods"
+    make_template(path)
+    for streaming in (False, True):
+        content = parser.ods_to_python(
+            path, export_minimal=True, keep_repeated=True, streaming=streaming
+        )
+        assert content["body"][0]["table"] == [
+            {"row": [{"value": 7, "repeat": 5}, "x"], "repeat": 1000},
+            [],
+            ["end"],
+        ]
+
+
+def test_repeated_ndjson_index(tmp_path):
+    dest = tmp_path / "blue.ndjson"
+    parser.ods_to_json(
+        FILE_COL_CELL_BLUE,
+        dest,
+        keep_styled=True,
+        keep_repeated=True,
+        ndjson=True,
+        export_minimal=True,
+    )
+    lines = [json.loads(line) for line in dest.read_text().splitlines()]
+    index = 0
+    for line in lines:
+        assert line["index"] == index
+        row = line["row"]
+        index += row.get("repeat", 1) if isinstance(row, dict) else 1
+
+
+def test_repeated_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    command = ["odsparsator", "-m", "-r", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    content = json.loads(dest.read_text(encoding="utf8"))
+    expected = parser.ods_to_python(FILE_MINIMAL, export_minimal=True)
+    assert content["body"][0]["table"] == expected["body"][0]["table"]
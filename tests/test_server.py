@@ -0,0 +1,185 @@
+import http.client
+import json
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+import odsparsator.odsparsator as parser
+from odsparsator.server import (
+    ConversionPool,
+    ServerBusy,
+    make_server,
+    request_options,
+)
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ConversionPool(workers=1, queue_timeout=0.1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def server(pool):
+    server = make_server(pool, port=0, root=DATA)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, url, body=None):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    conn.request(method, url, body=body)
+    response = conn.getresponse()
+    result = response.status, response.read().decode("utf8")
+    conn.close()
+    return result
+
+
+def expected_json(tmp_path, **options):
+    dest = tmp_path / "expected.json"
+    parser.ods_to_json(FILE_MINIMAL, dest, **options)
+    return dest.read_text(encoding="utf8")
+
+
+def test_request_options():
+    options = request_options(
+        {"minimal": ["1"], "color": ["false"], "raw": ["1"], "sheet": ["0", "Tab 2"]}
+    )
+    assert options == {
+        "export_minimal": True,
+        "colors": False,
+        "raw_values": True,
+        "sheets": [0, "Tab 2"],
+    }
+    options = request_options({"sheet": ["1"], "sheet_name": ["2024"]})
+    assert options == {"sheets": [1, "2024"]}
+    with pytest.raises(ValueError):
+        request_options({"unknown": ["1"]})
+    with pytest.raises(ValueError):
+        request_options({"range": ["B3:A1"]})
+    with pytest.raises(ValueError):
+        request_options({"profile": ["ugly"]})
+
+
+def test_convert_upload(server, tmp_path):
+    status, text = request(server, "POST", "/convert", FILE_MINIMAL.read_bytes())
+    assert status == 200
+    assert text == expected_json(tmp_path)
+
+
+def test_convert_upload_options(server, tmp_path):
+    url = "/convert?minimal=1&profile=compact"
+    status, text = request(server, "POST", url, FILE_MINIMAL.read_bytes())
+    assert status == 200
+    assert text == expected_json(tmp_path, export_minimal=True, profile="compact")
+
+
+def test_convert_path(server, tmp_path):
+    status, text = request(server, "POST", "/convert?path=minimal.ods")
+    assert status == 200
+    assert text == expected_json(tmp_path)
+
+
+def test_convert_path_refused(server, pool):
+    status, _text = request(server, "POST", "/convert?path=../test_server.py")
+    assert status == 403
+    status, _text = request(server, "POST", "/convert?path=missing.ods")
+    assert status == 400
+    other = make_server(pool, port=0)
+    thread = threading.Thread(target=other.serve_forever, daemon=True)
+    thread.start()
+    try:
+        status, _text = request(other, "POST", "/convert?path=minimal.ods")
+        assert status == 403
+    finally:
+        other.shutdown()
+        other.server_close()
+
+
+def test_bad_requests(server):
+    status, text = request(server, "POST", "/convert", b"not an ods file")
+    assert status == 400
+    assert "error" in json.loads(text)
+    assert request(server, "POST", "/convert?unknown=1", b"x")[0] == 400
+    assert request(server, "POST", "/convert")[0] == 400
+    assert request(server, "GET", "/convert")[0] == 404
+
+
+def test_bad_content_length(server):
+    for length in ("abc", "-1"):
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        conn.putrequest("POST", "/convert")
+        conn.putheader("Content-Length", length)
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 400
+        assert "Content-Length" in json.loads(response.read())["error"]
+        conn.close()
+
+
+def test_unknown_path_body_not_read(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    conn.putrequest("POST", "/anything")
+    conn.putheader("Content-Length", str(server.max_upload * 100))
+    conn.endheaders()
+    response = conn.getresponse()
+    assert response.status == 404
+    assert response.getheader("Connection") == "close"
+    conn.close()
+
+
+def test_health(server, pool):
+    status, text = request(server, "GET", "/health")
+    assert status == 200
+    health = json.loads(text)
+    assert health["workers"] == 1
+    assert health["in_flight"] == 0
+
+
+def test_busy(server, pool):
+    pool._slots.acquire()
+    try:
+        with pytest.raises(ServerBusy):
+            pool.convert(FILE_MINIMAL.read_bytes(), {})
+        status, _text = request(server, "POST", "/convert", FILE_MINIMAL.read_bytes())
+        assert status == 503
+    finally:
+        pool._slots.release()
+
+
+def test_unix_socket(pool, tmp_path):
+    path = tmp_path / "odsparsator.sock"
+    server = make_server(pool, unix_socket=path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        data = FILE_MINIMAL.read_bytes()
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(path))
+            client.sendall(
+                b"POST /convert?minimal=1 HTTP/1.1\r\nHost: localhost\r\n"
+                b"Connection: close\r\n"
+                + f"Content-Length: {len(data)}\r\n\r\n".encode()
+                + data
+            )
+            response = b""
+            while chunk := client.recv(65536):
+                response += chunk
+        head, _sep, body = response.partition(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.1 200")
+        assert json.loads(body) == parser.ods_to_python(
+            FILE_MINIMAL, export_minimal=True
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not path.exists()
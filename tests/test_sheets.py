@@ -0,0 +1,66 @@
+import json
+import subprocess
+from pathlib import Path
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_MINIMAL_HIDDEN = DATA / "minimal_hidden.ods"
+
+
+def test_sheets_by_name():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    content = parser.ods_to_python(FILE_MINIMAL, sheets=["Tab 2"])
+    assert content["body"] == [body[1]]
+
+
+def test_sheets_by_position():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    content = parser.ods_to_python(FILE_MINIMAL, sheets=[1])
+    assert content["body"] == [body[1]]
+
+
+def test_sheets_document_order():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    content = parser.ods_to_python(FILE_MINIMAL, sheets=["Tab 2", 0])
+    assert content["body"] == body
+
+
+def test_sheets_unknown():
+    content = parser.ods_to_python(FILE_MINIMAL, sheets=["unknown", 5])
+    assert content["body"] == []
+
+
+def test_sheets_streaming():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    content = parser.ods_to_python(FILE_MINIMAL, streaming=True, sheets=["Tab 1"])
+    assert content["body"] == [body[0]]
+    content = parser.ods_to_python(FILE_MINIMAL, streaming=True, sheets=[1])
+    assert content["body"] == [body[1]]
+    content = parser.ods_to_python(FILE_MINIMAL, streaming=True, sheets=[1, 0])
+    assert content["body"] == body
+
+
+def test_sheets_keep_styled_streaming():
+    expected = parser.ods_to_python(FILE_MINIMAL, keep_styled=True, sheets=[1])
+    content = parser.ods_to_python(
+        FILE_MINIMAL, keep_styled=True, streaming=True, sheets=[1]
+    )
+    assert content == expected
+
+
+def test_sheets_hidden():
+    content = parser.ods_to_python(FILE_MINIMAL_HIDDEN, sheets=[1])
+    assert content["body"] == []
+    content = parser.ods_to_python(FILE_MINIMAL_HIDDEN, sheets=[1], see_hidden=True)
+    assert len(content["body"]) == 1
+
+
+def test_sheets_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    command = ["odsparsator", "-m", "--sheet", "1", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    content = json.loads(dest.read_text(encoding="utf8"))
+    assert [t["name"] for t in content["body"]] == ["Tab 2"]
@@ -0,0 +1,84 @@
+import json
+import subprocess
+from pathlib import Path
+
+from odfdo import Document, Table
+
+import odsparsator.odsparsator as parser
+from odsparsator.stats import COUNTERS, PHASES, ParseStats
+
+DATA = Path(__file__).parent / "data"
+FILE_FORMULA = DATA / "formula.ods"
+FILE_MINIMAL = DATA / "minimal.ods"
+FILE_COLS = DATA / "col_cell.ods"
+
+
+def test_stats_content_unchanged():
+    stats = ParseStats()
+    content = parser.ods_to_python(FILE_MINIMAL, stats=stats)
+    assert content == parser.ods_to_python(FILE_MINIMAL)
+    result = stats.as_dict()
+    assert sorted(result["phases"]) == sorted(PHASES)
+    assert sorted(result["counters"]) == sorted(COUNTERS)
+    assert result["phases"]["rows"] > 0
+    assert result["phases"]["load"] > 0
+
+
+def test_stats_counters():
+    stats = ParseStats()
+    parser.ods_to_python(FILE_MINIMAL, stats=stats)
+    assert stats.counters["tables"] == 2
+    assert stats.counters["rows"] == 8
+    assert stats.counters["cells"] == 80
+    assert sorted(stats.sheets) == ["Tab 1", "Tab 2"]
+    assert stats.sheets["Tab 1"]["rows"] + stats.sheets["Tab 2"]["rows"] == 8
+    stats = ParseStats()
+    parser.ods_to_python(FILE_FORMULA, stats=stats)
+    assert stats.counters["formulas"] == 1
+
+
+def test_stats_repeated_streaming():
+    stats = ParseStats()
+    parser.ods_to_python(FILE_MINIMAL, stats=stats, keep_repeated=True, streaming=True)
+    assert stats.counters["rows"] == 8
+    assert stats.counters["cells"] == 80
+
+
+def test_stats_spans(tmp_path):
+    doc = Document("spreadsheet")
+    doc.body.clear()
+    table = Table("spans")
+    table.set_value("A1", "a")
+    table.set_value("D4", "d")
+    table.set_span("A1:B2")
+    doc.body.append(table)
+    path = tmp_path / "spans.ods"
+    doc.save(path)
+    stats = ParseStats()
+    parser.ods_to_python(path, stats=stats)
+    assert stats.counters["spans"] == 1
+
+
+def test_stats_colors():
+    stats = ParseStats()
+    parser.ods_to_python(FILE_COLS, stats=stats, colors=True)
+    counters = stats.counters
+    hits = counters["style_cache_hits"] + counters["style_cache_misses"]
+    assert hits == counters["styled_cells"] > 0
+
+
+def test_stats_json(tmp_path):
+    stats = ParseStats()
+    parser.ods_to_json(FILE_MINIMAL, tmp_path / "minimal.json", stats=stats)
+    assert stats.phases["json"] > 0
+    assert stats.counters["rows"] == 8
+
+
+def test_stats_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    command = ["odsparsator", "--stats", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    result = json.loads(proc.stderr)
+    assert result["counters"]["tables"] == 2
+    assert dest.exists()
@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILES = sorted(DATA.glob("*.ods"))
+OPTIONS = (
+    {},
+    {"export_minimal": True},
+    {"all_styles": True},
+    {"colors": True},
+    {"keep_styled": True},
+    {"keep_styled": True, "colors": True, "export_minimal": True},
+    {"see_hidden": True},
+)
+
+
+def canonical(dict_item):
+    if "styles" in dict_item:
+        tmp = sorted([(s["definition"], s.get("name")) for s in dict_item["styles"]])
+        dict_item["styles"] = tmp
+    return json.dumps(dict_item, sort_keys=True, indent=4, ensure_ascii=False)
+
+
+def test_streaming_same_content():
+    for file in FILES:
+        for options in OPTIONS:
+            expected = parser.ods_to_python(file, **options)
+            content = parser.ods_to_python(file, streaming=True, **options)
+            assert canonical(content) == canonical(expected), (file.name, options)
+
+
+def test_streaming_json(tmp_path):
+    for file in FILES:
+        output = tmp_path / (file.stem + ".json")
+        expected = tmp_path / (file.stem + "_dom.json")
+        parser.ods_to_json(file, output, streaming=True)
+        parser.ods_to_json(file, expected)
+        assert canonical(json.loads(output.read_text(encoding="utf8"))) == canonical(
+            json.loads(expected.read_text(encoding="utf8"))
+        )
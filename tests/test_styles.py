@@ -26,3 +26,20 @@ def test_json_content_min():
     content = parser.ods_to_python(FILE_STYLES, export_minimal=True)
     expected = json.loads(FILE_RESULT_M.read_text(encoding="utf8"))
     assert canonical(content) == canonical(expected)
+
+
+def test_used_styles_order():
+    content = parser.ods_to_python(FILE_STYLES)
+    names = [style["name"] for style in content["styles"]]
+    assert len(names) == len(set(names))
+    again = parser.ods_to_python(FILE_STYLES, streaming=True)
+    assert [style["name"] for style in again["styles"]] == names
+
+
+def test_styles_document_unchanged():
+    odsp = parser.ODSParsator()
+    odsp.parse_document(FILE_STYLES)
+    first = odsp.content
+    odsp.parse()
+    assert odsp.content == first
+    assert odsp.doc.get_styles(automatic=True)[0].name
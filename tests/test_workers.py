@@ -0,0 +1,64 @@
+import json
+import subprocess
+from pathlib import Path
+
+import odsparsator.odsparsator as parser
+
+DATA = Path(__file__).parent / "data"
+FILES = sorted(DATA.glob("*.ods"))
+FILE_MINIMAL = DATA / "minimal.ods"
+OPTIONS = (
+    {},
+    {"export_minimal": True, "use_decimal": True},
+    {"all_styles": True},
+    {"keep_styled": True, "colors": True},
+    {"see_hidden": True, "sheets": [1, 0]},
+    {"cell_range": {"Tab 2": "A1:B2"}},
+)
+
+
+def canonical(dict_item):
+    if "styles" in dict_item:
+        tmp = sorted([(s["definition"], s.get("name")) for s in dict_item["styles"]])
+        dict_item["styles"] = tmp
+    return json.dumps(dict_item, sort_keys=True, indent=4, ensure_ascii=False)
+
+
+def test_workers_same_content():
+    for file in FILES:
+        for options in OPTIONS:
+            expected = parser.ods_to_python(file, **options)
+            content = parser.ods_to_python(file, workers=3, **options)
+            assert content == expected, (file.name, options)
+
+
+def test_workers_json(tmp_path):
+    output = tmp_path / "minimal.json"
+    expected = tmp_path / "minimal_serial.json"
+    parser.ods_to_json(FILE_MINIMAL, output, workers=2)
+    parser.ods_to_json(FILE_MINIMAL, expected)
+    assert output.read_bytes() == expected.read_bytes()
+
+
+def test_workers_no_sheet():
+    content = parser.ods_to_python(FILE_MINIMAL, workers=2, sheets=["unknown"])
+    assert content["body"] == []
+
+
+def test_workers_iter_rows():
+    body = parser.ods_to_python(FILE_MINIMAL)["body"]
+    odsp = parser.ODSParsator(workers=2)
+    odsp.load_document(FILE_MINIMAL)
+    assert list(odsp.iter_rows(1)) == body[1]["table"]
+
+
+def test_workers_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    expected = tmp_path / "minimal_serial.json"
+    command = ["odsparsator", "--jobs", "2", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    parser.ods_to_json(FILE_MINIMAL, expected)
+    assert canonical(json.loads(dest.read_text(encoding="utf8"))) == canonical(
+        json.loads(expected.read_text(encoding="utf8"))
+    )
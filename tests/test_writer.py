@@ -0,0 +1,213 @@
+import io
+import json
+import os
+import stat
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+from odfdo import Cell, Document, Table
+
+import odsparsator.odsparsator as parser
+from odsparsator import writer
+from odsparsator.writer import JSONWriter
+
+DATA = Path(__file__).parent / "data"
+FILES = sorted(DATA.glob("*.ods"))
+FILE_MINIMAL = DATA / "minimal.ods"
+OPTIONS = (
+    {},
+    {"export_minimal": True},
+    {"all_styles": True},
+    {"colors": True},
+    {"keep_styled": True, "colors": True},
+    {"streaming": True, "colors": True},
+    {"see_hidden": True, "sheets": ["unknown"]},
+)
+
+
+def json_content(file, **options):
+    odsp = parser.ODSParsator(**options)
+    odsp.parse_document(file)
+    return odsp.json_content
+
+
+def test_write_json_same_text():
+    for file in FILES:
+        for options in OPTIONS:
+            odsp = parser.ODSParsator(**options)
+            odsp.load_document(file)
+            output = io.StringIO()
+            odsp.write_json(output)
+            assert output.getvalue() == json_content(file, **options), (
+                file.name,
+                options,
+            )
+
+
+def test_ods_to_json_same_text(tmp_path):
+    for file in FILES:
+        dest = tmp_path / (file.stem + ".json")
+        parser.ods_to_json(file, dest, colors=True)
+        assert dest.read_text(encoding="utf8") == json_content(file, colors=True)
+
+
+def test_writer_empty_table():
+    output = io.StringIO()
+    writer = JSONWriter(output)
+    writer.start()
+    writer.start_table("empty")
+    writer.end_table(None)
+    writer.end({})
+    assert output.getvalue() == (
+        '{\n    "body": [\n        {\n            "name": "empty",\n'
+        '            "table": []\n        }\n    ]\n}'
+    )
+
+
+def test_profile_compact(tmp_path):
+    for file in FILES:
+        dest = tmp_path / (file.stem + ".json")
+        parser.ods_to_json(file, dest, profile="compact")
+        text = dest.read_text(encoding="utf8")
+        assert "\n" not in text
+        assert json.loads(text) == json.loads(json_content(file))
+
+
+def test_profile_fast(tmp_path):
+    for file in FILES:
+        dest = tmp_path / (file.stem + ".json")
+        parser.ods_to_json(file, dest, colors=True, profile="fast")
+        text = dest.read_text(encoding="utf8")
+        assert json.loads(text) == json.loads(json_content(file, colors=True))
+
+
+def test_profile_fast_fallback(monkeypatch):
+    monkeypatch.setattr(writer, "HAS_ORJSON", False)
+    assert writer.dumps_fast({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+
+
+def test_profile_fast_big_integer():
+    assert writer.dumps_fast([2**70]) == f"[{2**70}]"
+
+
+def test_profile_unknown():
+    with pytest.raises(ValueError):
+        JSONWriter(io.StringIO(), "unknown")
+
+
+def test_profile_cli(tmp_path):
+    dest = tmp_path / "minimal.json"
+    command = ["odsparsator", "--profile", "compact", str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    text = dest.read_text(encoding="utf8")
+    assert text.startswith('{"body":[{"name":"Tab 1","table":[')
+
+
+def read_ndjson(path):
+    content = {"body": []}
+    for line in path.read_text(encoding="utf8").splitlines():
+        item = json.loads(line)
+        if "sheet" not in item:
+            content.update(item)
+            continue
+        if not content["body"] or content["body"][-1]["name"] != item["sheet"]:
+            content["body"].append({"name": item["sheet"], "table": []})
+        table = content["body"][-1]
+        if "width" in item:
+            table["width"] = item["width"]
+        else:
+            assert item["index"] == len(table["table"])
+            table["table"].append(item["row"])
+    return content
+
+
+def test_ndjson_same_content(tmp_path):
+    for file in FILES:
+        for options in ({}, {"export_minimal": True}, {"colors": True}):
+            dest = tmp_path / (file.stem + ".ndjson")
+            parser.ods_to_json(file, dest, ndjson=True, **options)
+            expected = json.loads(json_content(file, **options))
+            if "export_minimal" in options:
+                # no line for an empty table without width
+                expected["body"] = [t for t in expected["body"] if t["table"]]
+            assert read_ndjson(dest) == expected, (file.name, options)
+
+
+def test_ndjson_minimal_lines(tmp_path):
+    dest = tmp_path / "minimal.ndjson"
+    parser.ods_to_json(FILE_MINIMAL, dest, export_minimal=True, ndjson=True)
+    lines = [json.loads(line) for line in dest.read_text().splitlines()]
+    assert lines[0] == {
+        "sheet": "Tab 1",
+        "index": 0,
+        "row": ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"],
+    }
+    assert all(set(line) == {"sheet", "index", "row"} for line in lines)
+
+
+def test_ndjson_cli(tmp_path):
+    dest = tmp_path / "minimal.ndjson"
+    command = ["odsparsator", "--ndjson", "--profile", "fast"]
+    command += [str(FILE_MINIMAL), str(dest)]
+    proc = subprocess.run(command, capture_output=True, check=False)
+    assert proc.returncode == 0
+    content = read_ndjson(dest)
+    expected = json.loads(json_content(FILE_MINIMAL))
+    assert content["body"] == expected["body"]
+    assert sorted(s["name"] for s in content["styles"]) == sorted(
+        s["name"] for s in expected["styles"]
+    )
+
+
+def test_failed_parsing_keeps_output(tmp_path):
+    document = Document("ods")
+    document.body.clear()
+    table = Table("bad")
+    cell = Cell(1)
+    cell.set_attribute("office:value", "zz")
+    table.set_cell((0, 0), cell)
+    document.body.append(table)
+    source = tmp_path / "bad.ods"
+    document.save(source)
+    dest = tmp_path / "bad.json"
+    dest.write_text('{"old": 1}', encoding="utf8")
+    with pytest.raises(ArithmeticError):
+        parser.ods_to_json(source, dest, export_minimal=True)
+    assert dest.read_text(encoding="utf8") == '{"old": 1}'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["bad.json", "bad.ods"]
+    parser.ods_to_json(FILE_MINIMAL, dest)
+    assert json.loads(dest.read_text(encoding="utf8")) == json.loads(
+        json_content(FILE_MINIMAL)
+    )
+
+
+def test_symlink_output(tmp_path):
+    target = tmp_path / "target.json"
+    target.write_text('{"old": 1}', encoding="utf8")
+    link = tmp_path / "link.json"
+    link.symlink_to(target)
+    parser.ods_to_json(FILE_MINIMAL, link)
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf8") == json_content(FILE_MINIMAL)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "link.json",
+        "target.json",
+    ]
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="no named pipes")
+def test_fifo_output(tmp_path):
+    fifo = tmp_path / "output.fifo"
+    os.mkfifo(fifo)
+    received = []
+    reader = threading.Thread(
+        target=lambda: received.append(fifo.read_bytes()), daemon=True
+    )
+    reader.start()
+    parser.ods_to_json(FILE_MINIMAL, fifo, cache=tmp_path / "cache")
+    reader.join(5)
+    assert received == [json_content(FILE_MINIMAL).encode("utf8")]
+    assert stat.S_ISFIFO(fifo.stat().st_mode)